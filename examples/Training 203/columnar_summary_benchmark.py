@@ -0,0 +1,38 @@
+import gc
+import time
+
+from rctreportviewer.main import RCTDetailedReport
+from synthetic_inputs import large_rmd
+
+
+zone_counts = (1000, 4000, 12000)
+repeat = 5
+
+
+def summarize_time(rmd, columnar_summaries, freeze_gc):
+    """Returns the best time of summarizing the RMD, with or without the columnar summaries."""
+    report = RCTDetailedReport(None, [], columnar_summaries=columnar_summaries)
+    best = float("inf")
+    for _ in range(repeat):
+        if freeze_gc:
+            gc.collect()
+            gc.freeze()
+        start = time.perf_counter()
+        report.summarize_rmds([rmd])
+        best = min(best, time.perf_counter() - start)
+        if freeze_gc:
+            gc.unfreeze()
+    return best
+
+
+# The columnar summaries are only worth enabling by default once they beat the accumulation loops here
+for zone_count in zone_counts:
+    rmd = large_rmd("PROPOSED", zone_count)
+    for freeze_gc in (False, True):
+        rows_time = summarize_time(rmd, False, freeze_gc)
+        columns_time = summarize_time(rmd, True, freeze_gc)
+        print(
+            f"{zone_count:>6} zones{' (GC frozen)' if freeze_gc else '            '}: "
+            f"rows {rows_time * 1000:7.1f} ms, columns {columns_time * 1000:7.1f} ms, "
+            f"speedup {rows_time / columns_time:4.2f}x"
+        )
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import time
+
+from rctreportviewer.main import RCTDetailedReport
+from rctreportviewer.write_html import write_html_file
+from synthetic_inputs import write_synthetic_inputs
+
+
+rule_count = 10000  # Rules of the synthetic report, copied from the rules of the example report with new ids
+repeat = 5
+
+with tempfile.TemporaryDirectory() as directory:
+    synthetic_file_path, rpd_file_path = write_synthetic_inputs(directory, rule_count)
+
+    # The report is extracted once, and only its HTML is written in the timed runs
+    output_file_path = os.path.join(directory, "report.html")
+    report = RCTDetailedReport(synthetic_file_path, [rpd_file_path], output_file_path)
+    report.load_files()
+    report.extract_evaluation_data()
+    report.extract_model_data()
+    report.join_evaluations_to_objects()
+    report.perform_analytic_calculations()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write_html_file(report)
+        best = min(best, time.perf_counter() - start)
+    size = os.path.getsize(output_file_path)
+    print(
+        f"{rule_count} rules, {size / 1e6:.1f} MB of HTML in {best * 1000:.0f} ms: {size / 1e6 / best:.1f} MB/s"
+    )
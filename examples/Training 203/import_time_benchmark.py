@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+module = "rctreportviewer.main"
+budget_ms = 250  # Budget for the cumulative import time of the module, best of the runs
+repeat = 5
+
+
+def import_times(module_name):
+    """Returns module -> cumulative import time in microseconds, as reported by python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+runs = [import_times(module) for _ in range(repeat)]
+best_ms = min(times[module] for times in runs) / 1000
+print(f"{module}: {best_ms:.0f} ms (budget {budget_ms} ms)")
+for slowest, cumulative in sorted(runs[0].items(), key=lambda item: -item[1])[1:6]:
+    print(f"  {slowest}: {cumulative / 1000:.0f} ms")
+
+# The unit registry is built on first conversion, so importing the report must not import pint
+if "pint" in runs[0]:
+    sys.exit("pint is imported on import of the report")
+if best_ms > budget_ms:
+    sys.exit(f"{module} imports in {best_ms:.0f} ms, over the budget of {budget_ms} ms")
@@ -0,0 +1,14 @@
+import os
+import timeit
+
+from rctreportviewer.json_backends import json_backends, load_json_file
+
+
+report_file_path = os.path.join(os.path.dirname(__file__), "ASHRAE9012019DetailReport.json")
+repeat = 20
+
+for backend in json_backends:
+    best = min(
+        timeit.repeat(lambda: load_json_file(report_file_path, backend), number=1, repeat=repeat)
+    )
+    print(f"{backend:>10}: {best * 1000:8.2f} ms")
@@ -0,0 +1,38 @@
+import timeit
+
+from rctreportviewer.rules import RuleStore
+from synthetic_inputs import load_evaluation_report, synthetic_report
+
+
+rule_counts = (1250, 2500, 5000)
+repeat = 5
+
+
+def store_lookups(rule_store):
+    """Looks up every rule section by section, as the rules are rendered."""
+    for section, rule_ids in rule_store.rule_ids_by_section.items():
+        for rule_id in rule_ids:
+            rule_store[rule_id]
+            rule_store.section(rule_id)
+
+
+def scan_lookups(rules):
+    """Looks up every rule by scanning the rules of the report, as each rule was rendered before the rule store."""
+    for rule in rules:
+        rule_id = rule["rule_id"]
+        next(rule for rule in rules if rule["rule_id"] == rule_id)
+
+
+evaluation_report = load_evaluation_report()
+
+for rule_count in rule_counts:
+    rules = synthetic_report(evaluation_report["rules"], rule_count)
+    rule_store = RuleStore()
+    build_time = timeit.timeit(lambda: [rule_store.add(rule["rule_id"], rule) for rule in rules], number=1)
+    store_time = min(timeit.repeat(lambda: store_lookups(rule_store), number=1, repeat=repeat))
+    scan_time = timeit.timeit(lambda: scan_lookups(rules), number=1)
+    print(
+        f"{rule_count:>6} rules: store built in {build_time * 1000:6.2f} ms, "
+        f"lookups {store_time * 1000:6.2f} ms ({store_time / rule_count * 1e9:4.0f} ns per rule), "
+        f"scan {scan_time * 1000:8.0f} ms ({scan_time / rule_count * 1e6:5.0f} us per rule)"
+    )
@@ -0,0 +1,147 @@
+"""Synthetic inputs of any size for the benchmarks and checks of this folder, built from the example report."""
+import json
+import os
+
+report_file_path = os.path.join(os.path.dirname(__file__), "ASHRAE9012019DetailReport.json")
+
+
+def load_evaluation_report():
+    """Returns the example detailed evaluation report."""
+    with open(report_file_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def synthetic_report(rules, rule_count):
+    """Returns the evaluation report with rule_count rules, copied from its rules with new ids in the same sections."""
+    synthetic_rules = []
+    for index in range(rule_count):
+        rule = dict(rules[index % len(rules)])
+        rule["rule_id"] = f"{rule['rule_id'].split('-')[0]}-{1000 + index}"
+        synthetic_rules.append(rule)
+    synthetic_rules.sort(key=lambda rule: int(rule["rule_id"].split("-")[0]))
+    return synthetic_rules
+
+
+def rmd(rmd_type):
+    """Returns an RMD of one space, zone and HVAC system, with every value the report summarizes."""
+    space = {
+        "id": "Space 1",
+        "floor_area": 1000.0,
+        "lighting_space_type": "OFFICE_OPEN_PLAN",
+        "number_of_occupants": 10,
+        "interior_lighting": [{"power_per_area": 8.0}],
+        "miscellaneous_equipment": [{"power": 5000.0}],
+    }
+    zone = {"id": "Zone 1", "spaces": [space], "terminals": []}
+    hvac_system = {
+        "id": "System 1",
+        "fan_system": {
+            "fan_control": "CONSTANT",
+            "supply_fans": [{"id": "Fan 1", "design_electric_power": 1000.0, "design_airflow": 500.0}],
+        },
+    }
+    building_segment = {
+        "id": "Segment 1",
+        "zones": [zone],
+        "heating_ventilating_air_conditioning_systems": [hvac_system],
+    }
+    return {"type": rmd_type, "buildings": [{"id": "Building 1", "building_segments": [building_segment]}]}
+
+
+def large_rmd(rmd_type, zone_count, zones_per_segment=100):
+    """
+    Returns an RMD of zone_count zones, each with two spaces, four walls and a roof with windows and a skylight, and a
+    terminal with a fan, grouped into building segments of zones_per_segment zones with an HVAC system each.
+    """
+    building_segments = []
+    for zone_index in range(zone_count):
+        if zone_index % zones_per_segment == 0:
+            segment_index = len(building_segments) + 1
+            building_segments.append(
+                {
+                    "id": f"Segment {segment_index}",
+                    "zones": [],
+                    "heating_ventilating_air_conditioning_systems": [
+                        {
+                            "id": f"System {segment_index}",
+                            "fan_system": {
+                                "fan_control": "VARIABLE_SPEED_DRIVE",
+                                "supply_fans": [
+                                    {"id": f"Supply Fan {segment_index}", "design_electric_power": 5000.0,
+                                     "design_airflow": 2500.0}
+                                ],
+                                "return_fans": [
+                                    {"id": f"Return Fan {segment_index}", "shaft_power": 2000.0,
+                                     "motor_efficiency": 0.9, "design_airflow": 2000.0}
+                                ],
+                            },
+                        }
+                    ],
+                }
+            )
+        zone_id = f"Zone {zone_index + 1}"
+        spaces = [
+            {
+                "id": f"{zone_id} Space {space_index}",
+                "floor_area": 500.0,
+                "lighting_space_type": "OFFICE_OPEN_PLAN" if space_index else "CORRIDOR",
+                "number_of_occupants": 5,
+                "interior_lighting": [{"power_per_area": 8.0}, {"power_per_area": 2.0}],
+                "miscellaneous_equipment": [{"power": 2500.0}],
+            }
+            for space_index in range(2)
+        ]
+        surfaces = [
+            {
+                "id": f"{zone_id} Wall {surface_index}",
+                "classification": "WALL",
+                "adjacent_to": "EXTERIOR",
+                "area": 300.0,
+                "construction": {"u_factor": 0.5},
+                "subsurfaces": [
+                    {"id": f"{zone_id} Window {surface_index}", "classification": "WINDOW", "glazed_area": 60.0,
+                     "u_factor": 2.5}
+                ],
+            }
+            for surface_index in range(4)
+        ]
+        surfaces.append(
+            {
+                "id": f"{zone_id} Roof",
+                "classification": "CEILING",
+                "adjacent_to": "EXTERIOR",
+                "area": 1000.0,
+                "construction": {"u_factor": 0.2},
+                "subsurfaces": [
+                    {"id": f"{zone_id} Skylight", "classification": "SKYLIGHT", "glazed_area": 20.0, "u_factor": 3.0}
+                ],
+            }
+        )
+        terminals = [
+            {
+                "id": f"{zone_id} Terminal",
+                "fan": {"id": f"{zone_id} Terminal Fan", "design_electric_power": 200.0, "design_airflow": 100.0},
+            }
+        ]
+        building_segments[-1]["zones"].append(
+            {"id": zone_id, "spaces": spaces, "surfaces": surfaces, "terminals": terminals}
+        )
+    return {"type": rmd_type, "buildings": [{"id": "Building 1", "building_segments": building_segments}]}
+
+
+def write_synthetic_inputs(directory, rule_count, evaluation_report=None):
+    """
+    Writes a synthetic evaluation report of rule_count rules and an RPD of a proposed and a baseline RMD to directory.
+
+    Returns:
+        tuple: (evaluation report file path, RPD file path)
+    """
+    if evaluation_report is None:
+        evaluation_report = load_evaluation_report()
+    rpd_file_path = os.path.join(directory, "rpd.json")
+    with open(rpd_file_path, "w", encoding="utf-8") as file:
+        json.dump({"ruleset_model_descriptions": [rmd("PROPOSED"), rmd("BASELINE_0")]}, file)
+    synthetic_file_path = os.path.join(directory, f"report_{rule_count}.json")
+    with open(synthetic_file_path, "w", encoding="utf-8") as file:
+        json.dump({**evaluation_report, "rules": synthetic_report(evaluation_report["rules"], rule_count)}, file)
+    return synthetic_file_path, rpd_file_path
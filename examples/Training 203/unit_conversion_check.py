@@ -0,0 +1,58 @@
+import math
+import os
+import sys
+import tempfile
+import time
+
+from rctreportviewer.main import RCTDetailedReport
+from rctreportviewer.units import canonical_units, unit_conversions, unit_systems
+from synthetic_inputs import write_synthetic_inputs
+
+values = (0.0, 1.0, -2.5, 0.001, 123.456, 1e9)
+repeat = 100_000
+
+# The report is run in every unit system, and the pairs of units it converted are the ones checked. The pairs of the
+# quantities it displays are added, in case the run leaves one of them out.
+with tempfile.TemporaryDirectory() as directory:
+    synthetic_file_path, rpd_file_path = write_synthetic_inputs(directory, 100)
+    RCTDetailedReport(
+        synthetic_file_path,
+        [rpd_file_path],
+        os.path.join(directory, "report.html"),
+        unit_systems=list(unit_systems),
+    ).run()
+unit_pairs = set(unit_conversions.factors)
+for quantities in (RCTDetailedReport.model_summary_quantities, RCTDetailedReport.drilldown_attribute_quantities):
+    for unit_system in unit_systems.values():
+        for quantity in quantities.values():
+            if canonical_units[quantity] != unit_system.units[quantity]:
+                unit_pairs.add((canonical_units[quantity], unit_system.units[quantity]))
+unit_pairs = sorted(unit_pairs)
+
+# Every pair of units the report converts, checked against pint itself
+mismatches = []
+for from_unit, to_unit in unit_pairs:
+    for value in values:
+        expected = unit_conversions.convert_with_registry(value, from_unit, to_unit)
+        converted = unit_conversions.convert(value, from_unit, to_unit)
+        if not math.isclose(converted, expected, rel_tol=1e-12, abs_tol=1e-12):
+            mismatches.append(f"{from_unit} -> {to_unit}: {value} gives {converted}, pint gives {expected}")
+print(f"{len(unit_pairs)} unit pairs checked against pint, {len(mismatches)} mismatches")
+for mismatch in mismatches:
+    print(f"  {mismatch}")
+
+for from_unit, to_unit in unit_pairs:
+    start = time.perf_counter()
+    for _ in range(repeat // 100):
+        unit_conversions.convert_with_registry(123.456, from_unit, to_unit)
+    pint_time = (time.perf_counter() - start) / (repeat // 100)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        unit_conversions.convert(123.456, from_unit, to_unit)
+    cached_time = (time.perf_counter() - start) / repeat
+    print(
+        f"{from_unit:>12} -> {to_unit:<22} pint {pint_time * 1e6:7.1f} us, cached {cached_time * 1e9:6.0f} ns"
+    )
+
+if mismatches:
+    sys.exit(1)
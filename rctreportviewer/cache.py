@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+# Bump whenever the structure of the cached results changes so stale entries are ignored
+CACHE_VERSION = 11
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """Returns a hex digest of the file content."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of pickled results keyed by strings such as input file digests. The total size of the cache is
+    bounded; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir, max_size=1 << 30):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache entries. Created if missing.
+            max_size (int): Maximum total size of the cache entries in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, f"v{CACHE_VERSION}-{key}.pickle")
+
+    def get(self, key):
+        """Returns the cached value for key, or None if there is no usable entry."""
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Treat unreadable or truncated entries as missing
+            self.discard(path)
+            return None
+
+        # The modification time doubles as the last access time for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process since it was loaded
+            pass
+        return value
+
+    def set(self, key, value):
+        """
+        Stores value under key, then evicts entries until the cache fits in max_size. A value that cannot be stored,
+        e.g. because it cannot be pickled or the disk is full, is logged and left uncached.
+        """
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError as error:
+            logger.warning("Could not cache %s: %s", key, error)
+            return
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.entry_path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            logger.warning("Could not cache %s: %s", key, error)
+        finally:
+            # Left behind only when the entry was not stored
+            self.discard(temp_path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed by another process during the scan
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.discard(path)
+            total_size -= size
+
+    @staticmethod
+    def discard(path):
+        try:
+            os.remove(path)
+        except OSError:
+            # Already removed, or a path that cannot exist, which leaves nothing to discard
+            pass
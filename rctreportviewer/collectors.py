@@ -0,0 +1,163 @@
+_registered_collectors = []
+
+
+def register_collector(collector_class):
+    """
+    Registers an RMDCollector subclass, so that every RCTDetailedReport collects its metric from each summarized RMD.
+    Returns the class, so it can be used as a class decorator.
+    """
+    if collector_class not in _registered_collectors:
+        _registered_collectors.append(collector_class)
+    return collector_class
+
+
+def registered_collectors():
+    """Returns the registered RMDCollector subclasses, in order of registration."""
+    return list(_registered_collectors)
+
+
+def collector_name(collector_class):
+    """Returns the key under which the result of a collector is stored in ModelSummary.collected_metrics."""
+    return collector_class.name or collector_class.__name__
+
+
+class RMDCollector:
+    """
+    Collects a metric from the objects of an RMD while walk_rmd walks it. Subclasses override the visit_* methods of
+    the objects they read, and return the metric from result(). A new instance is created for each RMD.
+
+    Objects are passed to a collector in the order of the RMD tree. Within each building segment its zones are
+    visited first, each zone followed by its spaces, surfaces (each followed by its subsurfaces) and terminals, and
+    then the HVAC systems of the segment. A list is only iterated when a collector visits its objects, so collectors
+    of zone-level metrics add no pass over the spaces or surfaces.
+
+    For example, the outdoor air per occupant of each zone:
+
+        @register_collector
+        class ZoneOAPerOccupant(RMDCollector):
+            projection = {"buildings": {"building_segments": {"zones": {"id": None}}}}
+
+            def __init__(self):
+                self.oa_per_occupant = {}
+
+            def visit_zone(self, zone, building_segment):
+                occupants = sum(space.get("number_of_occupants", 0) for space in zone.get("spaces", []))
+                oa_flow = sum(terminal.get("minimum_outdoor_airflow", 0) for terminal in zone.get("terminals", []))
+                if occupants:
+                    self.oa_per_occupant[zone["id"]] = oa_flow / occupants
+
+            def result(self):
+                return self.oa_per_occupant
+    """
+
+    # Key of the result in ModelSummary.collected_metrics. Defaults to the class name.
+    name = None
+    # RMD attributes read by the collector that are not in projection.RMD_PROJECTION, in the same format. They are
+    # kept as well when project_rpd_fields is set.
+    projection = {}
+
+    def visit_rmd(self, rmd):
+        pass
+
+    def visit_building(self, building):
+        pass
+
+    def visit_building_segment(self, building_segment):
+        pass
+
+    def visit_zone(self, zone, building_segment):
+        pass
+
+    def visit_space(self, space, zone, building_segment):
+        pass
+
+    def visit_surface(self, surface, zone, building_segment):
+        pass
+
+    def visit_subsurface(self, subsurface, surface, zone, building_segment):
+        pass
+
+    def visit_terminal(self, terminal, zone, building_segment):
+        pass
+
+    def visit_hvac_system(self, hvac_system, building_segment):
+        pass
+
+    def result(self):
+        """Returns the metric collected from the RMD."""
+        return None
+
+
+def _visitors(collectors, method_name):
+    """Returns the bound visit methods of the collectors that override method_name."""
+    base_method = getattr(RMDCollector, method_name)
+    return [
+        getattr(collector, method_name)
+        for collector in collectors
+        if getattr(type(collector), method_name) is not base_method
+    ]
+
+
+def walk_rmd(rmd, collectors):
+    """
+    Walks the building -> building segment -> zone tree of an RMD once, passing each object to every collector that
+    visits objects of its kind.
+
+    Args:
+        rmd (dict): The RMD.
+        collectors (list[RMDCollector]): The collectors, which are visited in list order for each object.
+    """
+    rmd_visitors = _visitors(collectors, "visit_rmd")
+    building_visitors = _visitors(collectors, "visit_building")
+    building_segment_visitors = _visitors(collectors, "visit_building_segment")
+    zone_visitors = _visitors(collectors, "visit_zone")
+    space_visitors = _visitors(collectors, "visit_space")
+    surface_visitors = _visitors(collectors, "visit_surface")
+    subsurface_visitors = _visitors(collectors, "visit_subsurface")
+    terminal_visitors = _visitors(collectors, "visit_terminal")
+    hvac_system_visitors = _visitors(collectors, "visit_hvac_system")
+
+    for visit in rmd_visitors:
+        visit(rmd)
+
+    visit_zones = bool(zone_visitors or space_visitors or surface_visitors or subsurface_visitors or terminal_visitors)
+    visit_surfaces = bool(surface_visitors or subsurface_visitors)
+    if not (building_visitors or building_segment_visitors or visit_zones or hvac_system_visitors):
+        return
+
+    for building in rmd.get("buildings", []):
+        for visit in building_visitors:
+            visit(building)
+
+        for building_segment in building.get("building_segments", []):
+            for visit in building_segment_visitors:
+                visit(building_segment)
+
+            if visit_zones:
+                for zone in building_segment.get("zones", []):
+                    for visit in zone_visitors:
+                        visit(zone, building_segment)
+
+                    if space_visitors:
+                        for space in zone.get("spaces", []):
+                            for visit in space_visitors:
+                                visit(space, zone, building_segment)
+
+                    if visit_surfaces:
+                        for surface in zone.get("surfaces", []):
+                            for visit in surface_visitors:
+                                visit(surface, zone, building_segment)
+                            if subsurface_visitors:
+                                for subsurface in surface.get("subsurfaces", []):
+                                    for visit in subsurface_visitors:
+                                        visit(subsurface, surface, zone, building_segment)
+
+                    if terminal_visitors:
+                        for terminal in zone.get("terminals", []):
+                            for visit in terminal_visitors:
+                                visit(terminal, zone, building_segment)
+
+            if hvac_system_visitors:
+                for hvac_system in building_segment.get("heating_ventilating_air_conditioning_systems", []):
+                    for visit in hvac_system_visitors:
+                        visit(hvac_system, building_segment)
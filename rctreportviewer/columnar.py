@@ -0,0 +1,452 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from rctreportviewer.collectors import RMDCollector
+from rctreportviewer.summary import (
+    EXHAUST,
+    FAN_TYPES,
+    RETURN_RELIEF,
+    SUPPLY,
+    TERMINAL_UNIT,
+    ZONAL_EXHAUST,
+)
+
+# Surface and subsurface category codes. Only the categories that are summarized are distinguished, and only for
+# surfaces adjacent to the exterior.
+OTHER = 0
+EXTERIOR_WALL = 1
+EXTERIOR_ROOF = 2
+EXTERIOR_WINDOW = 1
+EXTERIOR_SKYLIGHT = 2
+surface_category_codes = {"WALL": EXTERIOR_WALL, "CEILING": EXTERIOR_ROOF}
+subsurface_category_codes = {"WINDOW": EXTERIOR_WINDOW, "SKYLIGHT": EXTERIOR_SKYLIGHT}
+
+# A space without these lists counts as one entry of zero power, as in RCTDetailedReport.summarize_rmd_space_data
+_default_interior_lighting = ({"power_per_area": 0},)
+_default_miscellaneous_equipment = ({"power": 0},)
+_empty = {}
+# Missing values are stored as NaN and masked out before aggregation
+_nan = float("nan")
+
+
+def _column(objects, key):
+    # A null value is stored as NaN as well, which leaves the object out of the totals like None does
+    return np.array([obj.get(key, _nan) for obj in objects], dtype=float)
+
+
+def _sequential_sum(values):
+    # Adds the values in order, like the accumulation loops they replace, so the totals are identical
+    return sum(values.tolist())
+
+
+class RMDColumns(RMDCollector):
+    """
+    The spaces, lighting and equipment entries, surfaces, subsurfaces, fans and pumps of one RMD, flattened into typed
+    columns. Rows keep the order of the building -> building segment -> zone tree, and refer to their building
+    segment, space, lighting space type or fan control through integer codes, which are assigned in order of first
+    appearance.
+
+    The rows are collected while walk_rmd walks the RMD, and turned into numpy arrays by summarize.
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("The numpy package is required for columnar summaries.")
+
+        self.segment_codes = {}
+        self.space_type_codes = {}
+        self.segment = None  # Code of the building segment being walked
+        self.space_ids = []
+        self.space_segments = []
+        self.space_types = []
+        self.floor_areas = []
+        self.occupants = []
+        self.lighting_spaces = []
+        self.lighting_power_per_area = []
+        self.equipment_spaces = []
+        self.equipment_power = []
+        self.surface_segments = []
+        self.surface_categories = []
+        self.surface_areas = []
+        self.surface_u_factors = []
+        self.subsurface_segments = []
+        self.subsurface_categories = []
+        self.glazed_areas = []
+        self.subsurface_u_factors = []
+        # Zonal exhaust, terminal and HVAC system fans
+        self.fan_control_codes = {"Undefined": 0}
+        self.undefined_fan_control = 0
+        # Fan control code -> number of fan rows when an HVAC system first used the control, in order of first use
+        self.fan_control_registrations = {}
+        # The fan and pump objects are kept until build_arrays, which reads each of their columns in one pass
+        self.fans = []
+        self.fan_controls = []
+        self.fan_types = []  # Zonal exhaust and terminal fans are the ones outside HVAC systems
+        self.pumps = []
+
+    def visit_rmd(self, rmd):
+        self.pumps = rmd.get("pumps", [])
+
+    def visit_building_segment(self, building_segment):
+        self.segment = self.segment_codes.setdefault(building_segment.get("id"), len(self.segment_codes))
+
+    def visit_space(self, space, zone, building_segment):
+        space_index = len(self.space_ids)
+        self.space_ids.append(space.get("id"))
+        self.space_segments.append(self.segment)
+        self.space_types.append(
+            self.space_type_codes.setdefault(space["lighting_space_type"], len(self.space_type_codes))
+            if "lighting_space_type" in space
+            else -1
+        )
+        self.floor_areas.append(space.get("floor_area", _nan))
+        self.occupants.append(space.get("number_of_occupants", _nan))
+        for interior_lighting in space.get("interior_lighting", _default_interior_lighting):
+            self.lighting_spaces.append(space_index)
+            self.lighting_power_per_area.append(interior_lighting.get("power_per_area", _nan))
+        for miscellaneous_equipment in space.get("miscellaneous_equipment", _default_miscellaneous_equipment):
+            self.equipment_spaces.append(space_index)
+            self.equipment_power.append(miscellaneous_equipment.get("power", _nan))
+
+    def visit_surface(self, surface, zone, building_segment):
+        # Subsurfaces are collected here rather than in visit_subsurface, as their category depends on the surface
+        exterior = surface.get("adjacent_to") == "EXTERIOR"
+        self.surface_segments.append(self.segment)
+        self.surface_categories.append(
+            surface_category_codes.get(surface.get("classification"), OTHER) if exterior else OTHER
+        )
+        self.surface_areas.append(surface.get("area", _nan))
+        self.surface_u_factors.append((surface.get("construction") or _empty).get("u_factor", _nan))
+        for subsurface in surface.get("subsurfaces", []):
+            self.subsurface_segments.append(self.segment)
+            self.subsurface_categories.append(
+                subsurface_category_codes.get(subsurface.get("classification"), OTHER) if exterior else OTHER
+            )
+            self.glazed_areas.append(subsurface.get("glazed_area", _nan))
+            self.subsurface_u_factors.append(subsurface.get("u_factor", _nan))
+
+    def visit_zone(self, zone, building_segment):
+        # The zonal exhaust and terminal fans of the zone, which all have the "Undefined" fan control
+        fans = self.fans
+        fan_types = self.fan_types
+        zonal_exhaust_fan = zone.get("zonal_exhaust_fan")
+        if zonal_exhaust_fan:
+            fans.append(zonal_exhaust_fan)
+            fan_types.append(ZONAL_EXHAUST)
+        for terminal in zone.get("terminals", []):
+            if "fan" in terminal:
+                fans.append(terminal["fan"])
+                fan_types.append(TERMINAL_UNIT)
+        self.fan_controls.extend([self.undefined_fan_control] * (len(fans) - len(self.fan_controls)))
+
+    def visit_hvac_system(self, hvac_system, building_segment):
+        hvac_fan_system = hvac_system.get("fan_system")
+        if not hvac_fan_system:
+            return
+        # Same fan control as RCTDetailedReport.summarize_rmd_system_data
+        fan_control = hvac_fan_system.get("fan_control", "Undefined")
+        if fan_control == "CONSTANT" and hvac_fan_system.get("operation_during_occupied", "Undefined") == "CYCLING":
+            fan_control = "Constant Cycling"
+        fan_control = self.fan_control_codes.setdefault(fan_control, len(self.fan_control_codes))
+        self.fan_control_registrations.setdefault(fan_control, len(self.fans))
+
+        for fan_type, fan_list_key in (
+                (SUPPLY, "supply_fans"),
+                (RETURN_RELIEF, "return_fans"),
+                (RETURN_RELIEF, "relief_fans"),
+                (EXHAUST, "exhaust_fans"),
+        ):
+            fans = hvac_fan_system.get(fan_list_key)
+            if fans:
+                self.fans.extend(fans)
+                self.fan_controls.extend([fan_control] * len(fans))
+                self.fan_types.extend([fan_type] * len(fans))
+
+    def build_arrays(self):
+        """Converts the collected rows to numpy arrays. Called by summarize."""
+        if isinstance(self.space_segments, np.ndarray):
+            return
+        self.segments = list(self.segment_codes)
+        self.space_type_names = list(self.space_type_codes)
+        self.space_segments = np.array(self.space_segments, dtype=np.intp)
+        self.space_types = np.array(self.space_types, dtype=np.intp)
+        self.floor_areas = np.array(self.floor_areas, dtype=float)
+        self.occupants = np.array(self.occupants, dtype=float)
+        self.lighting_spaces = np.array(self.lighting_spaces, dtype=np.intp)
+        self.lighting_power_per_area = np.array(self.lighting_power_per_area, dtype=float)
+        self.equipment_spaces = np.array(self.equipment_spaces, dtype=np.intp)
+        self.equipment_power = np.array(self.equipment_power, dtype=float)
+        self.surface_segments = np.array(self.surface_segments, dtype=np.intp)
+        self.surface_categories = np.array(self.surface_categories, dtype=np.int8)
+        self.surface_areas = np.array(self.surface_areas, dtype=float)
+        self.surface_u_factors = np.array(self.surface_u_factors, dtype=float)
+        self.subsurface_segments = np.array(self.subsurface_segments, dtype=np.intp)
+        self.subsurface_categories = np.array(self.subsurface_categories, dtype=np.int8)
+        self.glazed_areas = np.array(self.glazed_areas, dtype=float)
+        self.subsurface_u_factors = np.array(self.subsurface_u_factors, dtype=float)
+        fans = self.fans
+        self.fan_controls = np.array(self.fan_controls, dtype=np.intp)
+        self.fan_types = np.array(self.fan_types, dtype=np.intp)
+        self.fan_in_systems = self.fan_types < ZONAL_EXHAUST
+        self.fan_has_design_electric_power = np.array(["design_electric_power" in fan for fan in fans], dtype=bool)
+        self.fan_design_electric_power = _column(fans, "design_electric_power")
+        self.fan_shaft_power = _column(fans, "shaft_power")
+        self.fan_motor_efficiency = _column(fans, "motor_efficiency")
+        self.fan_total_efficiency = _column(fans, "total_efficiency")
+        self.fan_design_pressure_rise = _column(fans, "design_pressure_rise")
+        self.fan_design_airflow = _column(fans, "design_airflow")
+        pumps = self.pumps
+        self.pump_has_design_electric_power = np.array(["design_electric_power" in pump for pump in pumps], dtype=bool)
+        self.pump_design_electric_power = _column(pumps, "design_electric_power")
+        self.pump_design_flow = _column(pumps, "design_flow")
+        self.pump_design_head = _column(pumps, "design_head")
+        self.pump_impeller_efficiency = _column(pumps, "impeller_efficiency")
+        self.pump_motor_efficiency = _column(pumps, "motor_efficiency")
+        self.fans = self.pumps = None
+
+    @staticmethod
+    def grouped_sums(codes, values, mask, names):
+        """
+        Sums the masked values by group code. Groups are returned in order of their first masked row, as the
+        accumulation loops would have inserted them, and the values of each group are added in row order.
+        """
+        codes = codes[mask]
+        if not len(codes):
+            return {}
+        sums = np.bincount(codes, weights=values[mask], minlength=len(names))
+        _, first_rows = np.unique(codes, return_index=True)
+        return {names[code]: float(sums[code]) for code in codes[np.sort(first_rows)].tolist()}
+
+    def summarize(self, rmd_building_summary, space_areas, baseline_space_space_types):
+        """
+        Adds the space, lighting, equipment, surface and subsurface totals to an RMD summary, with the same results
+        as summarize_rmd_space_data and summarize_rmd_surface_data. Space areas and, for the baseline, lighting space
+        types are added to the given dicts by space id.
+        """
+        self.build_arrays()
+        segments = self.segments
+        space_types = self.space_type_names
+
+        # Spaces
+        has_floor_area = ~np.isnan(self.floor_areas)
+        has_space_type = self.space_types >= 0
+        has_occupants = ~np.isnan(self.occupants)
+
+        rmd_building_summary["total_floor_area"] += _sequential_sum(self.floor_areas[has_floor_area])
+        rmd_building_summary["total_floor_area_by_building_segment"].update(self.grouped_sums(
+            self.space_segments, self.floor_areas, has_floor_area, segments
+        ))
+        space_areas.update(
+            zip(
+                [self.space_ids[row] for row in np.flatnonzero(has_floor_area).tolist()],
+                self.floor_areas[has_floor_area].tolist(),
+            )
+        )
+        if rmd_building_summary["rmd_type"] == "Baseline":
+            baseline_space_space_types.update(
+                (self.space_ids[row], space_types[space_type])
+                for row, space_type in zip(
+                    np.flatnonzero(has_space_type).tolist(), self.space_types[has_space_type].tolist()
+                )
+            )
+
+        rmd_building_summary["total_occupants"] += _sequential_sum(self.occupants[has_occupants])
+        rmd_building_summary["total_occupants_by_space_type"].update(self.grouped_sums(
+            self.space_types, self.occupants, has_occupants & has_space_type, space_types
+        ))
+
+        # Interior lighting, one row per entry
+        lighting_floor_areas = self.floor_areas[self.lighting_spaces]
+        lighting_space_types = self.space_types[self.lighting_spaces]
+        lighting_power = self.lighting_power_per_area * lighting_floor_areas
+        has_lighting = ~np.isnan(self.lighting_power_per_area) & has_floor_area[self.lighting_spaces]
+        has_lighting_space_type = has_lighting & (lighting_space_types >= 0)
+
+        rmd_building_summary["total_lighting_power"] += _sequential_sum(lighting_power[has_lighting])
+        rmd_building_summary["total_floor_area_by_space_type"].update(self.grouped_sums(
+            lighting_space_types, lighting_floor_areas, has_lighting_space_type, space_types
+        ))
+        rmd_building_summary["total_lighting_power_by_space_type"].update(self.grouped_sums(
+            lighting_space_types, lighting_power, has_lighting_space_type, space_types
+        ))
+
+        # Miscellaneous equipment, one row per entry
+        equipment_space_types = self.space_types[self.equipment_spaces]
+        has_equipment = ~np.isnan(self.equipment_power) & has_floor_area[self.equipment_spaces]
+
+        rmd_building_summary["total_equipment_power"] += _sequential_sum(self.equipment_power[has_equipment])
+        rmd_building_summary["total_miscellaneous_equipment_power_by_space_type"].update(self.grouped_sums(
+            equipment_space_types, self.equipment_power, has_equipment & (equipment_space_types >= 0), space_types
+        ))
+
+        # Exterior walls and roofs
+        has_area = ~np.isnan(self.surface_areas)
+        surface_ua = self.surface_u_factors * self.surface_areas
+        has_ua = ~np.isnan(surface_ua)
+        for category, total_key, area_key, ua_key in (
+                (
+                        EXTERIOR_WALL,
+                        "total_exterior_wall_area",
+                        "total_wall_area_by_building_segment",
+                        "overall_wall_ua_by_building_segment",
+                ),
+                (
+                        EXTERIOR_ROOF,
+                        "total_roof_area",
+                        "total_roof_area_by_building_segment",
+                        "overall_roof_ua_by_building_segment",
+                ),
+        ):
+            in_category = self.surface_categories == category
+            rmd_building_summary[total_key] += _sequential_sum(self.surface_areas[in_category & has_area])
+            rmd_building_summary[area_key].update(self.grouped_sums(
+                self.surface_segments, self.surface_areas, in_category & has_area, segments
+            ))
+            rmd_building_summary[ua_key].update(self.grouped_sums(
+                self.surface_segments, surface_ua, in_category & has_ua, segments
+            ))
+
+        # Exterior windows and skylights
+        has_glazed_area = ~np.isnan(self.glazed_areas)
+        subsurface_ua = self.subsurface_u_factors * self.glazed_areas
+        has_subsurface_ua = ~np.isnan(subsurface_ua)
+        for category, total_key, area_key, ua_key in (
+                (
+                        EXTERIOR_WINDOW,
+                        "total_window_area",
+                        "total_window_area_by_building_segment",
+                        "overall_window_ua_by_building_segment",
+                ),
+                (
+                        EXTERIOR_SKYLIGHT,
+                        "total_skylight_area",
+                        "total_skylight_area_by_building_segment",
+                        "overall_skylight_ua_by_building_segment",
+                ),
+        ):
+            in_category = self.subsurface_categories == category
+            rmd_building_summary[total_key] += _sequential_sum(self.glazed_areas[in_category & has_glazed_area])
+            rmd_building_summary[area_key].update(self.grouped_sums(
+                self.subsurface_segments, self.glazed_areas, in_category & has_glazed_area, segments
+            ))
+            rmd_building_summary[ua_key].update(self.grouped_sums(
+                self.subsurface_segments, subsurface_ua, in_category & has_subsurface_ua, segments
+            ))
+
+        # Fans and pumps
+        self.summarize_fans(rmd_building_summary)
+
+        pump_power = self.pump_power()
+        has_pump_power = ~np.isnan(pump_power)
+        rmd_building_summary.total_pump_power += _sequential_sum(pump_power[has_pump_power & (pump_power != 0)])
+        rmd_building_summary.pump_powers.extend(pump_power[has_pump_power].tolist())
+
+    def fan_power(self):
+        """
+        Returns the power of each fan, or NaN where it cannot be determined. Evaluates the formulas of
+        RCTDetailedReport.determine_fan_power for all fans at once, each on the fans it applies to.
+        """
+        power = np.full(len(self.fan_design_electric_power), _nan)
+        from_design_electric_power = self.fan_has_design_electric_power
+        power[from_design_electric_power] = self.fan_design_electric_power[from_design_electric_power]
+
+        from_shaft_power = (
+                ~from_design_electric_power
+                & ~np.isnan(self.fan_shaft_power)
+                & ~np.isnan(self.fan_motor_efficiency)
+        )
+        power[from_shaft_power] = self.fan_shaft_power[from_shaft_power] / self.fan_motor_efficiency[from_shaft_power]
+
+        from_pressure_rise = (
+                ~from_design_electric_power
+                & ~from_shaft_power
+                & ~np.isnan(self.fan_total_efficiency)
+                & ~np.isnan(self.fan_design_pressure_rise)
+                & ~np.isnan(self.fan_design_airflow)
+        )
+        power[from_pressure_rise] = (
+                self.fan_design_airflow[from_pressure_rise]
+                * self.fan_design_pressure_rise[from_pressure_rise]
+                / self.fan_total_efficiency[from_pressure_rise]
+        )
+        return power
+
+    def pump_power(self):
+        """
+        Returns the power of each pump, or NaN where it cannot be determined, as RCTDetailedReport.determine_pump_power
+        would.
+        """
+        power = np.full(len(self.pump_design_electric_power), _nan)
+        from_design_electric_power = self.pump_has_design_electric_power
+        power[from_design_electric_power] = self.pump_design_electric_power[from_design_electric_power]
+
+        from_head = (
+                ~from_design_electric_power
+                & ~np.isnan(self.pump_design_flow)
+                & ~np.isnan(self.pump_design_head)
+                & ~np.isnan(self.pump_impeller_efficiency)
+                & ~np.isnan(self.pump_motor_efficiency)
+        )
+        power[from_head] = (
+                self.pump_design_flow[from_head]
+                * self.pump_design_head[from_head]
+                / (self.pump_impeller_efficiency[from_head] * self.pump_motor_efficiency[from_head])
+        )
+        return power
+
+    def summarize_fans(self, rmd_building_summary):
+        """
+        Adds the fan power and air flow totals to an RMD summary, with the same results as summarize_rmd_zone_data,
+        summarize_rmd_terminal_data and summarize_rmd_system_data, and the power of each fan to fan_powers_by_fan_type.
+        """
+        fan_controls = list(self.fan_control_codes)
+        power = self.fan_power()
+        has_power = ~np.isnan(power)
+        # Fans of zero power are left out of the totals, as by `if fan_power:`
+        counted = has_power & (power != 0)
+
+        rmd_building_summary.total_fan_power += _sequential_sum(power[counted])
+
+        # Add the fan controls in the order the summarize_* methods do. An HVAC system adds its fan control before its
+        # fans, while zonal exhaust and terminal fans add "Undefined" with the first one that has power.
+        # Controls registered at the same row keep their order of registration.
+        control_order = [
+            (row, 0, registration, code)
+            for registration, (code, row) in enumerate(self.fan_control_registrations.items())
+        ]
+        counted_outside_systems = np.flatnonzero(counted & ~self.fan_in_systems)
+        if len(counted_outside_systems):
+            row = int(counted_outside_systems[0])
+            control_order.append((row, 1, 0, int(self.fan_controls[row])))
+        for _, _, _, code in sorted(control_order):
+            rmd_building_summary.fan_power_by_fan_type(fan_controls[code])
+        for code in self.fan_control_registrations:
+            rmd_building_summary.air_flow_by_fan_type(fan_controls[code])
+
+        self.add_fan_type_totals(rmd_building_summary.fan_power_by_fan_type, power, counted)
+        self.add_fan_type_totals(
+            rmd_building_summary.air_flow_by_fan_type,
+            self.fan_design_airflow,
+            self.fan_in_systems & ~np.isnan(self.fan_design_airflow),
+        )
+
+        for fan_type, fan_type_name in enumerate(FAN_TYPES):
+            rmd_building_summary.fan_powers_by_fan_type[fan_type_name].extend(
+                power[has_power & (self.fan_types == fan_type)].tolist()
+            )
+
+    def add_fan_type_totals(self, fan_type_totals, values, mask):
+        """
+        Adds the masked fan values to the FanTypeTotals of their fan control, returned by fan_type_totals(fan_control).
+        """
+        groups = self.fan_controls[mask] * len(FAN_TYPES) + self.fan_types[mask]
+        if not len(groups):
+            return
+        sums = np.bincount(groups, weights=values[mask])
+        fan_controls = list(self.fan_control_codes)
+        for group in np.unique(groups).tolist():
+            fan_control, fan_type = divmod(group, len(FAN_TYPES))
+            totals = fan_type_totals(fan_controls[fan_control]).totals
+            totals[fan_type] += float(sums[group])
@@ -0,0 +1,39 @@
+import gzip
+import lzma
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _open_zstandard(file_path):
+    if zstandard is None:
+        raise ImportError("The zstandard package is required to read .json.zst files.")
+    return zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True)
+
+
+compressed_file_openers = {
+    ".json.gz": gzip.open,
+    ".json.xz": lzma.open,
+    ".json.zst": _open_zstandard,
+}
+
+
+def is_json_file(file_path):
+    """Returns True for plain and compressed JSON file extensions."""
+    return file_path.endswith(".json") or is_compressed_json_file(file_path)
+
+
+def is_compressed_json_file(file_path):
+    return file_path.endswith(tuple(compressed_file_openers))
+
+
+def open_json_file(file_path):
+    """
+    Opens a JSON file for binary reading. Compressed files are decompressed incrementally as they are read.
+    """
+    for extension, opener in compressed_file_openers.items():
+        if file_path.endswith(extension):
+            return opener(file_path)
+    return open(file_path, "rb")
@@ -0,0 +1,426 @@
+import re
+from array import array
+from collections import Counter
+from typing import NamedTuple
+
+from rctreportviewer.columnar import np
+
+# Parts of messages that vary between the evaluations of a rule: the ids of model objects, as in "id:Zone 1 missing:x"
+# and "zones:Zone 1 is missing x", and numbers. Messages that differ only in these are counted under one template.
+_message_id_patterns = (
+    (re.compile(r"\bid:.*? missing:"), "id:{id} missing:"),
+    (re.compile(r"^(\w+):.*? is missing "), r"\1:{id} is missing "),
+)
+_message_number_pattern = re.compile(r"(?<![\w.-])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w-]|\.\d)")
+
+# Outcomes of an evaluation, by their int8 outcome code. Any other outcome is coded after these as it appears.
+OUTCOMES = ("PASS", "FAILED", "NOT_APPLICABLE", "UNDETERMINED")
+
+
+def _hashable(value):
+    """Returns a key for a JSON value that is hashable, and equal only for equal values of the same types."""
+    if isinstance(value, list):
+        return list, tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return dict, tuple((key, _hashable(item)) for key, item in value.items())
+    return type(value), value
+
+
+class InternTable:
+    """
+    Assigns integer codes to JSON values in order of first appearance, and keeps a single copy of each distinct value.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, values=()):
+        self.codes = {}
+        self.values = []
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        # Strings are their own key, other values are keyed by type as well, so that e.g. 1 and True stay apart
+        key = value if type(value) is str else _hashable(value)
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value):
+        """Returns the code of value, or None if no equal value has been coded."""
+        return self.codes.get(value if type(value) is str else _hashable(value))
+
+    def intern(self, value):
+        """Returns the single copy kept of a value equal to value."""
+        return self.values[self.code(value)]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getstate__(self):
+        # The keys are rebuilt rather than pickled
+        return self.values
+
+    def __setstate__(self, values):
+        self.codes = {}
+        self.values = []
+        for value in values:
+            self.code(value)
+
+
+class MessageTable(InternTable):
+    """
+    An InternTable of the messages of evaluations, which also keeps the messages that each distinct messages value
+    reads as, as a set and in order of first appearance, and their display text, so they are built once per distinct
+    value rather than per evaluation.
+    """
+
+    __slots__ = ("message_sets", "message_lists", "texts", "templates")
+
+    def __init__(self, values=()):
+        self.message_sets = []  # By code, built as they are first asked for
+        self.message_lists = []
+        self.texts = []
+        self.templates = {}  # Message -> template
+        super().__init__(values)
+
+    def _describe(self, code):
+        while len(self.texts) <= code:
+            messages = _messages(self.values[len(self.texts)])
+            # The text joins the set, as the messages were displayed before they were interned
+            message_set = set(messages)
+            self.message_sets.append(frozenset(message_set))
+            self.message_lists.append(messages)
+            self.texts.append(", ".join(message_set))
+
+    def message_set(self, code):
+        """Returns the set of messages of the messages value with a code, as a frozenset."""
+        self._describe(code)
+        return self.message_sets[code]
+
+    def text(self, messages):
+        """Returns the messages of an evaluation as they are displayed, joined by commas."""
+        code = self.code(messages)
+        self._describe(code)
+        return self.texts[code]
+
+    def count(self, code_counts, message_counts):
+        """
+        Adds the number of evaluations of each message to message_counts, from the number of evaluations of each
+        messages value by code. Each message of a value is counted once, as read into its message set, and new
+        messages are added in order of first appearance, as in the messages value.
+
+        Args:
+            code_counts (dict): Code of a messages value -> number of evaluations, e.g. a Counter of the codes.
+            message_counts (Counter): Message -> number of evaluations.
+        """
+        for code, count in code_counts.items():
+            self._describe(code)
+            message_counts.update(dict.fromkeys(self.message_lists[code], count))
+
+    def template(self, message):
+        """Returns message with the object ids and numbers in it replaced by placeholders."""
+        template = self.templates.get(message)
+        if template is None:
+            template = str(message)
+            for pattern, replacement in _message_id_patterns:
+                template = pattern.sub(replacement, template)
+            template = self.templates[message] = _message_number_pattern.sub("{n}", template)
+        return template
+
+    def template_counts(self, message_counts):
+        """Returns template -> number of evaluations, from the message -> number of evaluations of message_counts."""
+        template_counts = Counter()
+        for message, count in message_counts.items():
+            template_counts[self.template(message)] += count
+        return template_counts
+
+    def __setstate__(self, values):
+        self.message_sets = []
+        self.message_lists = []
+        self.texts = []
+        self.templates = {}
+        super().__setstate__(values)
+
+
+class CalculatedValues(NamedTuple):
+    """Calculated values selected from an EvaluationTable, as numpy arrays with one item per calculated value."""
+
+    evaluation: object  # Row of the evaluation in the table
+    rule_index: object  # Index of the rule of the evaluation
+    data_group_id: object  # data_group_id of the evaluation, as an object array
+    value: object  # The value as a float64, or NaN when it is not a number
+    unit: object  # Unit of the value, as an object array
+    raw: object  # The value as in the evaluation report, as an object array
+
+
+class EvaluationTable:
+    """
+    The evaluations of the detailed evaluation report, stored in columns with one row per evaluation: the index of its
+    rule, and the codes of its data_group_id, outcome and messages. The calculated values of the evaluations are
+    stored in columns of their own, with one row per calculated value, and the rows of an evaluation's calculated
+    values start at its calculated value offset.
+
+    Each distinct data_group_id, messages, variable, value and unit is stored once in an InternTable, so the table
+    holds a few bytes per evaluation instead of the parsed evaluation objects. The counts and rule outcomes of
+    RCTDetailedReport.extract_evaluation_data are reductions over the columns.
+    """
+
+    def __init__(self):
+        self.rules = []  # Members of each rule other than its evaluations, by rule index
+        self.rule_indexes = {}  # rule_id -> index of the first rule with that id
+        self.data_group_ids = InternTable()
+        self.outcomes = InternTable(OUTCOMES)
+        self.messages = MessageTable()
+        self.variables = InternTable()
+        self.values = InternTable()
+        self.units = InternTable()
+
+        # Evaluation columns
+        self.rule_index = array("i")
+        self.data_group = array("i")
+        self.outcome = array("b")
+        self.message = array("i")
+        self.calculated_value_offsets = array("q", [0])  # One more than the evaluations, ending at the last one
+        # Rule index -> first evaluation row, plus the number of evaluations
+        self.evaluation_offsets = array("q", [0])
+
+        # Calculated value columns
+        self.variable = array("i")
+        self.value = array("i")
+        self.unit = array("i")
+        self._numbers = None  # Number of each distinct value, see numbers
+
+    def add_rule(self, rule):
+        """Appends a rule of the evaluation report and its evaluations to the table."""
+        rule_index = len(self.rules)
+        self.rules.append({key: value for key, value in rule.items() if key != "evaluations"})
+        self.rule_indexes.setdefault(rule["rule_id"], rule_index)
+
+        data_group_code = self.data_group_ids.code
+        outcome_code = self.outcomes.code
+        message_code = self.messages.code
+        variable_code = self.variables.code
+        value_code = self.values.code
+        unit_code = self.units.code
+        for evaluation in rule["evaluations"]:
+            self.rule_index.append(rule_index)
+            self.data_group.append(data_group_code(evaluation.get("data_group_id")))
+            self.outcome.append(outcome_code(evaluation["outcome"]))
+            self.message.append(message_code(evaluation["messages"]))
+            for calculated_value in evaluation.get("calculated_values") or ():
+                self.variable.append(variable_code(calculated_value["variable"]))
+                self.value.append(value_code(calculated_value["value"]))
+                self.unit.append(unit_code(calculated_value.get("unit")))
+            self.calculated_value_offsets.append(len(self.variable))
+        self.evaluation_offsets.append(len(self.rule_index))
+
+    def rule(self, rule_id):
+        """Returns the first rule with rule_id as in the evaluation report, rebuilt from the table."""
+        rule_index = self.rule_indexes[rule_id]
+        return {**self.rules[rule_index], "evaluations": self.evaluations(rule_index)}
+
+    def evaluations(self, rule_index):
+        """Returns the evaluations of a rule, rebuilt from the table."""
+        data_group_ids = self.data_group_ids.values
+        outcomes = self.outcomes.values
+        messages = self.messages.values
+        variables = self.variables.values
+        values = self.values.values
+        units = self.units.values
+        calculated_value_offsets = self.calculated_value_offsets
+        evaluations = []
+        for row in range(self.evaluation_offsets[rule_index], self.evaluation_offsets[rule_index + 1]):
+            evaluations.append(
+                {
+                    "data_group_id": data_group_ids[self.data_group[row]],
+                    "outcome": outcomes[self.outcome[row]],
+                    "messages": messages[self.message[row]],
+                    "calculated_values": [
+                        {
+                            "variable": variables[self.variable[value_row]],
+                            "value": values[self.value[value_row]],
+                            "unit": units[self.unit[value_row]],
+                        }
+                        for value_row in range(calculated_value_offsets[row], calculated_value_offsets[row + 1])
+                    ],
+                }
+            )
+        return evaluations
+
+    def numbers(self):
+        """
+        Returns the number that each distinct calculated value reads as, by value code, as a float64 numpy array. Each
+        value is parsed once; values that are neither numbers nor numeric strings, including booleans, are NaN.
+        """
+        if self._numbers is None or len(self._numbers) != len(self.values):
+            self._numbers = np.array([_number(value) for value in self.values.values], dtype=np.float64)
+        return self._numbers
+
+    def calculated_values(self, variable, rule_id=None):
+        """
+        Returns the calculated values of a variable as CalculatedValues, in the order of the evaluations.
+
+        Args:
+            variable (str): Name of the calculated value, e.g. "lpd_allowance_b".
+            rule_id (str): Only the values of the rules with this rule_id are returned, if given.
+        """
+        variable_code = self.variables.find(variable)
+        if variable_code is None:
+            rows = np.zeros(0, dtype=np.int64)
+        else:
+            rows = np.flatnonzero(np.frombuffer(self.variable, dtype=np.int32) == variable_code)
+        offsets = np.frombuffer(self.calculated_value_offsets, dtype=np.int64)
+        evaluation = np.searchsorted(offsets, rows, side="right") - 1
+        rule_index = np.frombuffer(self.rule_index, dtype=np.int32)[evaluation]
+        if rule_id is not None:
+            selected = np.array([rule["rule_id"] == rule_id for rule in self.rules], dtype=bool)[rule_index]
+            rows, evaluation, rule_index = rows[selected], evaluation[selected], rule_index[selected]
+        data_group = np.frombuffer(self.data_group, dtype=np.int32)[evaluation]
+        value = np.frombuffer(self.value, dtype=np.int32)[rows]
+        return CalculatedValues(
+            evaluation=evaluation,
+            rule_index=rule_index,
+            data_group_id=_object_array(self.data_group_ids.values)[data_group],
+            value=self.numbers()[value],
+            unit=_object_array(self.units.values)[np.frombuffer(self.unit, dtype=np.int32)[rows]],
+            raw=_object_array(self.values.values)[value],
+        )
+
+    def rule_groups(self):
+        """Returns the index of the first rule with the same rule_id for each rule, as a numpy array."""
+        return np.array([self.rule_indexes[rule["rule_id"]] for rule in self.rules], dtype=np.int64)
+
+    def display_outcomes(self, outcome_display_names):
+        """
+        Returns the display outcome names, and the code in those names of each evaluation's outcome, as a numpy array.
+        Outcomes without a display name are displayed as None.
+        """
+        names = list(dict.fromkeys([*outcome_display_names.values(), None]))
+        codes = np.array(
+            [names.index(outcome_display_names.get(outcome)) for outcome in self.outcomes.values], dtype=np.int64
+        )
+        return names, codes[np.frombuffer(self.outcome, dtype=np.int8)]
+
+    def outcome_counts(self, outcome_display_names):
+        """
+        Returns rule_id -> display outcome -> number of evaluations, with the outcomes of each rule in order of first
+        appearance.
+        """
+        names, display_outcome = self.display_outcomes(outcome_display_names)
+        rule_group = self.rule_groups()[np.frombuffer(self.rule_index, dtype=np.int32)]
+        counts = {rule_id: {} for rule_id in self.rule_indexes}
+        for rule_index, name_code, count in self._first_appearances(rule_group, display_outcome, len(names)):
+            counts[self.rules[rule_index]["rule_id"]][names[name_code]] = count
+        return counts
+
+    def message_counts(self):
+        """
+        Returns rule_id -> Counter of message -> number of evaluations, with the messages in order of first appearance.
+        Messages are read as in the message sets of RCTDetailedReport.extract_evaluation_data.
+        """
+        rule_group = self.rule_groups()[np.frombuffer(self.rule_index, dtype=np.int32)]
+        message = np.frombuffer(self.message, dtype=np.int32).astype(np.int64)
+        counts = {rule_id: Counter() for rule_id in self.rule_indexes}
+        for rule_index, message_code, count in self._first_appearances(rule_group, message, len(self.messages)):
+            self.messages.count({message_code: count}, counts[self.rules[rule_index]["rule_id"]])
+        return counts
+
+    def rule_ids_by_data_group_id(self, outcome_display_names):
+        """
+        Returns data_group_id -> display outcome -> ids of the rules evaluated for it, in order of first appearance.
+        A rule is listed once per data_group_id and outcome, unless its id is repeated by a later rule.
+        """
+        names, display_outcome = self.display_outcomes(outcome_display_names)
+        data_group = np.frombuffer(self.data_group, dtype=np.int32).astype(np.int64)
+        rule_index = np.frombuffer(self.rule_index, dtype=np.int32).astype(np.int64)
+        data_group_ids = self.data_group_ids.values
+        rule_ids_by_data_group_id = {}
+        for group, rule_index, _ in self._first_appearances(
+                data_group * len(names) + display_outcome, rule_index, len(self.rules)
+        ):
+            data_group_code, name_code = divmod(group, len(names))
+            data_group_id = data_group_ids[data_group_code]
+            if data_group_id is None:
+                continue
+            rule_id = self.rules[rule_index]["rule_id"]
+            rule_ids = rule_ids_by_data_group_id.setdefault(data_group_id, {}).setdefault(names[name_code], [])
+            if not rule_ids or rule_ids[-1] != rule_id:
+                rule_ids.append(rule_id)
+        return rule_ids_by_data_group_id
+
+    @staticmethod
+    def _first_appearances(groups, codes, code_count):
+        """
+        Yields each distinct (group, code) pair of the evaluations and its number of evaluations, in order of first
+        appearance.
+        """
+        if not len(groups):
+            return
+        keys = groups * code_count + codes
+        unique_keys, first_rows, counts = np.unique(keys, return_index=True, return_counts=True)
+        order = np.argsort(first_rows, kind="stable")
+        for key, count in zip(unique_keys[order].tolist(), counts[order].tolist()):
+            group, code = divmod(key, code_count)
+            yield group, code, count
+
+    def outcomes_present(self, outcome_display_names):
+        """Returns display outcome -> boolean numpy array of the rules with an evaluation of that outcome."""
+        names, display_outcome = self.display_outcomes(outcome_display_names)
+        rule_index = np.frombuffer(self.rule_index, dtype=np.int32)
+        return {
+            name: np.bincount(rule_index[display_outcome == name_code], minlength=len(self.rules)) > 0
+            for name_code, name in enumerate(names)
+        }
+
+    def messages_equal(self, message_set):
+        """
+        Returns a boolean numpy array of the rules whose evaluations' messages are together message_set, with each
+        message read as in RCTDetailedReport.extract_evaluation_data.
+        """
+        subset = np.zeros(len(self.messages), dtype=bool)
+        equal = np.zeros(len(self.messages), dtype=bool)
+        for message_code in range(len(self.messages)):
+            messages = self.messages.message_set(message_code)
+            subset[message_code] = messages <= message_set
+            equal[message_code] = messages == message_set
+        rule_index = np.frombuffer(self.rule_index, dtype=np.int32)
+        message = np.frombuffer(self.message, dtype=np.int32)
+        not_subset_counts = np.bincount(rule_index, weights=~subset[message], minlength=len(self.rules))
+        equal_counts = np.bincount(rule_index, weights=equal[message], minlength=len(self.rules))
+        return (not_subset_counts == 0) & (equal_counts > 0)
+
+    def __len__(self):
+        return len(self.rule_index)
+
+
+def _number(value):
+    if type(value) is int or type(value) is float:
+        return float(value)
+    if type(value) is str:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return np.nan
+
+
+def _object_array(values):
+    # Built item by item so that list values stay items rather than becoming a dimension of the array
+    object_array = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        object_array[index] = value
+    return object_array
+
+
+def _messages(messages):
+    """Returns the messages that a messages value reads as, in order of first appearance and without repeats."""
+    if isinstance(messages, str):
+        return (messages,)
+    if isinstance(messages, dict):
+        return tuple(dict.fromkeys(f"{key}: {message}" for key, message in messages.items()))
+    if isinstance(messages, list):
+        return tuple(dict.fromkeys(messages))
+    return ()
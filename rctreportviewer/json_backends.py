@@ -0,0 +1,73 @@
+import json
+import mmap
+
+from rctreportviewer.compression import is_compressed_json_file, open_json_file
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+def _loads_stdlib(buffer):
+    # The stdlib parser only accepts str, so the whole file is copied into one. Decoding it straight from the mapped
+    # file at least avoids a second, intermediate bytes copy.
+    return json.loads(str(buffer, "utf-8"))
+
+
+def _loads_orjson(buffer):
+    return orjson.loads(buffer)
+
+
+def _loads_simdjson(buffer):
+    return simdjson.Parser().parse(buffer, recursive=True)
+
+
+# Installed backends, ordered from fastest to slowest. orjson and simdjson are opt-in: unlike the stdlib parser, which
+# is the default, they reject the NaN, Infinity and -Infinity literals that Python's json.dump writes for floats.
+json_backends = {}
+if orjson is not None:
+    json_backends["orjson"] = _loads_orjson
+if simdjson is not None:
+    json_backends["simdjson"] = _loads_simdjson
+json_backends["stdlib"] = _loads_stdlib
+
+
+def get_json_backend(name=None):
+    """
+    Returns the name of the JSON backend to use. When name is None the stdlib parser is selected, which accepts every
+    file that json.dump writes; see json_backends.
+    """
+    if name is None:
+        return "stdlib"
+    if name not in json_backends:
+        raise ValueError(
+            f"JSON backend '{name}' is not available. Choose from: {', '.join(json_backends)}"
+        )
+    return name
+
+
+def load_json_file(file_path, backend=None):
+    """
+    Memory-maps a JSON file and parses it with the selected backend. orjson and simdjson parse the mapped bytes
+    without copying them; the stdlib parser, the default, needs the whole file decoded into a str first, so it keeps
+    the cost of that copy. Compressed files are decompressed as a stream into one buffer.
+    """
+    loads = json_backends[get_json_backend(backend)]
+
+    if is_compressed_json_file(file_path):
+        with open_json_file(file_path) as file:
+            return loads(file.read())
+
+    with open(file_path, "rb") as file:
+        # Empty files cannot be memory-mapped; let the parser report the error instead
+        if not file.seek(0, 2):
+            return loads(b"")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as buffer:
+                return loads(buffer)
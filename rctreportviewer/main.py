@@ -1,14 +1,36 @@
+import copy
+import hashlib
 import json
-import pint
 import os
-
-from rctreportviewer.write_html import write_html_file
-
-path_to_ureg = os.path.join(
-    os.path.dirname(__file__),
-    "unit_registry.txt",
+import tempfile
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from rctreportviewer import columnar
+from rctreportviewer.cache import ResultCache, file_digest
+from rctreportviewer.collectors import collector_name, registered_collectors, walk_rmd
+from rctreportviewer.compression import is_compressed_json_file, is_json_file, open_json_file
+from rctreportviewer.evaluations import EvaluationTable, InternTable, MessageTable
+from rctreportviewer.json_backends import get_json_backend, load_json_file
+from rctreportviewer.merge import RPDMerge
+from rctreportviewer.object_index import ObjectIndex, ObjectIndexCollector
+from rctreportviewer.projection import RMD_PROJECTION, merge_projections, projecting_decoder
+from rctreportviewer.rules import RuleStore
+from rctreportviewer.streaming import TeeReader, iter_json_array, read_json_range
+from rctreportviewer.summary import (
+    EXHAUST,
+    FAN_TYPES,
+    RETURN_RELIEF,
+    SUPPLY,
+    TERMINAL_UNIT,
+    ZONAL_EXHAUST,
+    FanTypeTotals,
+    ModelSummary,
 )
-ureg = pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
+from rctreportviewer import units
+from rctreportviewer.units import unit_conversions
+from rctreportviewer.write_html import write_html_file
 
 
 class RCTDetailedReport:
@@ -26,33 +48,218 @@ class RCTDetailedReport:
         "NOT_APPLICABLE": "N/A",
         "UNDETERMINED": "Undetermined",
     }
+    # RMD types the report itself is built from, which are always summarized
+    required_rmd_types = ("PROPOSED", "BASELINE_0")
+    # Baseline RMD types, one per building orientation, whose results are averaged as Appendix G requires
+    baseline_orientation_rmd_types = ("BASELINE_0", "BASELINE_90", "BASELINE_180", "BASELINE_270")
+    # Energy and cost attributes of the model summary that are averaged over the baseline orientations
+    averaged_baseline_attributes = (
+        "total_energy",
+        "total_cost",
+        "energy_by_fuel_type",
+        "cost_by_fuel_type",
+        "energy_by_end_use",
+        "elec_by_end_use",
+        "gas_by_end_use",
+        "unmet_heating_hours",
+        "unmet_cooling_hours",
+    )
+    # Quantities of the model summary attributes, whose values are kept in their canonical_units and converted to a
+    # unit system when displayed
+    model_summary_quantities = {
+        "overall_wall_ua_by_building_segment": "ua",
+        "overall_wall_u_factor_by_building_segment": "u_factor",
+        "overall_roof_ua_by_building_segment": "ua",
+        "overall_roof_u_factor_by_building_segment": "u_factor",
+        "overall_window_ua_by_building_segment": "ua",
+        "overall_window_u_factor_by_building_segment": "u_factor",
+        "overall_skylight_ua_by_building_segment": "ua",
+        "overall_skylight_u_factor_by_building_segment": "u_factor",
+        "average_lighting_power_by_space_type": "power_density",
+        "total_floor_area_by_building_segment": "area",
+        "total_wall_area_by_building_segment": "area",
+        "total_roof_area_by_building_segment": "area",
+        "total_window_area_by_building_segment": "area",
+        "total_floor_area_by_space_type": "area",
+        "total_floor_area": "area",
+        "total_exterior_wall_area": "area",
+        "total_roof_area": "area",
+        "total_window_area": "area",
+        "total_zone_minimum_oa_flow": "air_flow",
+        "total_infiltration": "air_flow",
+        "total_air_flow_by_fan_control_by_fan_type": "air_flow",
+        "total_air_flow_by_fan_type": "air_flow",
+        "total_energy": "energy",
+        "energy_by_fuel_type": "energy",
+        "energy_by_end_use": "energy",
+        "elec_by_end_use": "electricity",
+        "gas_by_end_use": "gas",
+        "elec_by_end_use_eui": "eui",
+        "gas_by_end_use_eui": "eui",
+        "energy_by_end_use_eui": "eui",
+    }
+    # Types of the RMD objects whose evaluations are drilled down to, in the order they are listed
+    drilldown_object_types = ("Zone", "Space", "HeatingVentilatingAirConditioningSystem")
+    # Quantities of the drill-down attributes returned by summarize_object_attributes that are converted for display
+    drilldown_attribute_quantities = {
+        "floor_area": "area",
+        "lighting_power_density": "power_density",
+        "supply_air_flow": "air_flow",
+    }
+    # Attributes set by extract_evaluation_data, which are stored in and restored from the result cache
+    evaluation_result_attributes = (
+        "model_types",
+        "space_lpd_allowances",
+        "rule_ids_by_data_group_id",
+        "rules_passed",
+        "rules_failed",
+        "full_eval_rules_undetermined",
+        "appl_eval_rules_undetermined",
+        "rules_not_applicable",
+        "rule_evaluation_outcome_counts",
+        "rule_evaluation_message_counts",
+        "rule_evaluation_message_template_counts",
+        "message_table",
+        "rule_offsets",
+    )
 
     def __init__(
             self,
             detailed_evaluation_report_file_path: str,
             rpd_file_paths: list[str],
             output_file_path: str = "report.html",
+            stream_evaluation_report: bool = False,
+            rpd_workers: int = 0,
+            json_backend: str = None,
+            cache_dir: str = None,
+            cache_size: int = 1 << 30,
+            load_summarized_rmds_only: bool = False,
+            project_rpd_fields: bool = False,
+            rmd_types: list[str] = None,
+            columnar_summaries: bool = False,
+            rmd_collectors: list[type] = None,
+            columnar_evaluations: bool = None,
+            unit_systems: list[str] = None,
+            index_rmd_objects: bool = False,
     ):
         """
         Args:
             detailed_evaluation_report_file_path (str): Path to the JSON file.
             rpd_file_paths (List[str]): List of paths to the RPD file(s).
             output_file_path (str): Path to the output HTML file.
+            stream_evaluation_report (bool): Parse the evaluation report one rule at a time instead of loading it
+                whole. Rules are re-read from disk when the HTML is written.
+            rpd_workers (int): Number of worker processes used to load and summarize the RPD files, one task per
+                file and RMD type. Each worker returns only the model summaries and the top-level RPD members. 0 loads
+                the files serially.
+            json_backend (str): JSON parser used to load the files ("orjson", "simdjson" or "stdlib"). Defaults to
+                "stdlib". orjson and simdjson are faster, but fail on files with NaN or Infinity values, which the
+                stdlib parser accepts.
+            cache_dir (str): Directory of an on-disk cache of the RPD summaries and extracted evaluation data, keyed
+                by the content hash of each input file. Unchanged RPD files are then neither loaded nor summarized.
+            cache_size (int): Maximum size of the cache in bytes. The least recently used entries are evicted first.
+            load_summarized_rmds_only (bool): Stream the ruleset_model_descriptions of each RPD file and keep only the
+                RMDs whose type is summarized. The other RMDs are skipped while parsing and never held in memory.
+            project_rpd_fields (bool): Stream the ruleset_model_descriptions of each RPD file and keep only the RMD
+                attributes listed in projection.RMD_PROJECTION, which are the ones the summaries are built from.
+                Schedules, hourly arrays, geometry and other unused attributes are dropped while parsing.
+            rmd_types (list[str]): RMD types to summarize, from model_type_disp_map, e.g. ["PROPOSED", "BASELINE_0",
+                "BASELINE_90"]. Defaults to required_rmd_types, the ones the report is built from, which are always
+                summarized. With more than one baseline orientation, the report shows the baseline energy results
+                averaged over them. With rpd_workers set, each RMD type is summarized by its own worker, and with
+                load_summarized_rmds_only also set, each worker loads only the RMD it summarizes.
+            columnar_summaries (bool): Flatten the spaces, surfaces, fans and pumps of each RMD into numpy columns
+                and compute their power and totals with masked vector operations and grouped sums, instead of
+                accumulating them object by object. The results are the same. Off by default, as the rows are still
+                collected object by object, which leaves it no faster than the accumulation.
+            rmd_collectors (list[type]): RMDCollector subclasses whose metrics are collected from each summarized
+                RMD, in addition to those registered with collectors.register_collector. Their results are stored in
+                the collected_metrics of the model summaries, by collector name.
+            columnar_evaluations (bool): Store the rule evaluations in an EvaluationTable of integer-coded columns and
+                compute their counts and the rule outcomes with numpy reductions over it. The parsed rules are not
+                kept; they are rebuilt from the table when the HTML is written. Defaults to True when numpy is
+                installed.
+            unit_systems (list[str]): Unit systems to write the HTML in, from units.unit_systems ("IP" or "SI").
+                The first is written to output_file_path and each other one next to it, with the unit system added
+                to the file name, e.g. report_SI.html. The model data is kept in its RMD units and only converted
+                when written, so each unit system costs a rendering only. Defaults to ["IP"].
+            index_rmd_objects (bool): Index the objects of each summarized RMD by id, for find_rmd_object and the
+                drill-down of the evaluations by model object, which is written only when this is set. The index
+                holds an entry per space, surface, subsurface and terminal, so it is off by default.
         """
         self.detailed_evaluation_report_file_path = detailed_evaluation_report_file_path
         self.rpd_file_paths = rpd_file_paths
         self.output_file_path = output_file_path
+        if unit_systems is None:
+            unit_systems = ["IP"]
+        for unit_system in unit_systems:
+            if unit_system not in units.unit_systems:
+                raise ValueError(
+                    f"Unknown unit system '{unit_system}'. Choose from: {', '.join(units.unit_systems)}"
+                )
+        self.unit_systems = list(dict.fromkeys(unit_systems))
+        self.stream_evaluation_report = stream_evaluation_report
+        self.rpd_workers = rpd_workers
+        self.json_backend = get_json_backend(json_backend)
+        self.load_summarized_rmds_only = load_summarized_rmds_only
+        self.index_rmd_objects = index_rmd_objects
+        self.project_rpd_fields = project_rpd_fields
+        if columnar_summaries and columnar.np is None:
+            raise ImportError("The numpy package is required for columnar summaries.")
+        self.columnar_summaries = columnar_summaries
+        if columnar_evaluations is None:
+            columnar_evaluations = columnar.np is not None
+        elif columnar_evaluations and columnar.np is None:
+            raise ImportError("The numpy package is required for columnar evaluations.")
+        self.columnar_evaluations = columnar_evaluations
+        self.rmd_collectors = list(dict.fromkeys([*registered_collectors(), *(rmd_collectors or [])]))
+        if rmd_types is None:
+            rmd_types = self.required_rmd_types
+        for rmd_type in rmd_types:
+            if rmd_type not in self.model_type_disp_map:
+                raise ValueError(
+                    f"Unknown RMD type '{rmd_type}'. Choose from: {', '.join(self.model_type_disp_map)}"
+                )
+        # RMD type -> display name, in the order of model_type_disp_map
+        self.summarized_rmd_types = {
+            rmd_type: model_type
+            for rmd_type, model_type in self.model_type_disp_map.items()
+            if rmd_type in rmd_types or rmd_type in self.required_rmd_types
+        }
+        self.result_cache = ResultCache(cache_dir, cache_size) if cache_dir is not None else None
+        self.cached_evaluation_results = None
+        self.evaluation_cache_key = None
+        # RPD files are summarized one at a time, rather than merged first, when they are cached or run in workers
+        self.summarize_rpd_files_separately = bool(rpd_workers) or self.result_cache is not None
+        # Options passed on to summarize_rpd_file
+        self.rpd_summary_options = {
+            "json_backend": self.json_backend,
+            "load_summarized_rmds_only": load_summarized_rmds_only,
+            "project_rpd_fields": project_rpd_fields,
+            "columnar_summaries": columnar_summaries,
+            "rmd_collectors": self.rmd_collectors,
+            "index_rmd_objects": index_rmd_objects,
+        }
         self.rpd_data = None
+        self.merge_conflicts = []  # Conflicting top-level values found while merging the RPD files
         self.evaluation_data = None
+        self.rule_offsets = {}  # rule_id -> (offset, length) in the evaluation report when streaming
+        self.rule_source = None  # File the streamed rules are re-read from
+        self.rule_store = RuleStore()  # Rules of the evaluation report by rule_id, set by extract_evaluation_data
+        self.evaluation_table = None  # EvaluationTable of the rules with columnar_evaluations
 
         self.model_types = set()
         self.space_areas = {}
         self.baseline_space_space_types = {}
+        self.rmd_object_index = None  # ObjectIndex of the RMD being summarized, with index_rmd_objects
         self.space_lpd_allowances = {}
         self.baseline_total_lighting_power_allowance = 0
         self.baseline_lighting_power_allowance_by_space_type = {}
+        self.model_summaries = {}  # RMD type -> model summary
+        self.object_indexes = {}  # RMD type -> ObjectIndex of the summarized RMD
         self.proposed_model_summary = {}
         self.baseline_model_summary = {}
+        self.averaged_baseline_model_summary = None
 
         self.rules_passed = []  # ALL outcomes are PASS or N/A
         self.rules_failed = []  # ANY outcome is FAIL
@@ -60,27 +267,110 @@ class RCTDetailedReport:
         self.appl_eval_rules_undetermined = []  # ANY outcome is UNDETERMINED
         self.rules_not_applicable = []  # ALL outcomes are N/A
         self.rule_evaluation_outcome_counts = {}
-        self.rule_evaluation_message_counts = {}
+        self.rule_evaluation_message_counts = {}  # rule_id -> Counter of message -> number of evaluations
+        # rule_id -> Counter of message template -> number of evaluations, with object ids and numbers in the messages
+        # replaced by placeholders, see MessageTable.template
+        self.rule_evaluation_message_template_counts = {}
+        self.message_table = MessageTable()  # Distinct evaluation messages, with their message sets and display text
+        self.rule_ids_by_data_group_id = {}  # data_group_id -> outcome -> ids of the rules evaluated for it
+        self.object_drilldowns = {}  # data_group_id -> drill-down of the RMD object, see join_evaluations_to_objects
 
     @staticmethod
-    def load_file(file_path):
+    def verify_file_type(file_path):
+        # Verify the file path is to a JSON file extension
+        if not is_json_file(file_path):
+            raise ValueError("Invalid file type. Please provide a JSON file (.json, .json.gz, .json.xz or .json.zst).")
+
+    @staticmethod
+    def load_file(file_path, json_backend=None):
         """
         Reads a JSON file and returns the python equivalent data structure.
         """
-        # Verify the file path is to a JSON file extension
-        if not file_path.endswith(".json"):
-            raise ValueError("Invalid file type. Please provide a JSON file.")
+        RCTDetailedReport.verify_file_type(file_path)
 
-        with open(file_path, "r") as file:
-            data = json.load(file)
+        data = load_json_file(file_path, json_backend)
 
         return data
 
+    def load_rpd_file(self, file_path):
+        """
+        Reads an RPD file. When load_summarized_rmds_only is set, only the RMDs of a summarized type are decoded.
+        When project_rpd_fields is set, only the RMD attributes the summaries are built from are kept.
+        """
+        if not (self.load_summarized_rmds_only or self.project_rpd_fields):
+            return self.load_file(file_path, self.json_backend)
+
+        self.verify_file_type(file_path)
+        select = ("type", self.summarized_rmd_types) if self.load_summarized_rmds_only else None
+        decoder = (
+            projecting_decoder(
+                merge_projections(
+                    RMD_PROJECTION,
+                    *((ObjectIndexCollector.projection,) if self.index_rmd_objects else ()),
+                    *(collector.projection for collector in self.rmd_collectors),
+                )
+            )
+            if self.project_rpd_fields
+            else json.JSONDecoder()
+        )
+        rpd = {}
+        with open_json_file(file_path) as file:
+            rmds = [
+                rmd
+                for rmd, _, _ in iter_json_array(file, "ruleset_model_descriptions", rpd, select, decoder)
+            ]
+        rpd["ruleset_model_descriptions"] = rmds
+
+        return rpd
+
+    def stream_evaluation_report_file(self, file_path):
+        """
+        Reads the top-level members of the detailed evaluation report and returns them with "rules" replaced by a
+        generator that parses one rule at a time. The location of each rule is kept so it can be re-read later.
+        Compressed reports are decompressed into a temporary file as they are parsed so rules can be re-read by offset.
+        """
+        self.verify_file_type(file_path)
+
+        evaluation_data = {}
+        # Columnar evaluations are rendered from the evaluation table, so their rules are never re-read
+        if is_compressed_json_file(file_path) and not self.columnar_evaluations:
+            self.rule_source = tempfile.TemporaryFile()
+        else:
+            self.rule_source = file_path
+
+        def iter_rules():
+            with open_json_file(file_path) as file:
+                if not isinstance(self.rule_source, str):
+                    file = TeeReader(file, self.rule_source)
+                for rule, offset, length in iter_json_array(file, "rules", evaluation_data):
+                    self.rule_offsets.setdefault(rule["rule_id"], (offset, length))
+                    yield rule
+
+        evaluation_data["rules"] = iter_rules()
+        return evaluation_data
+
+    def get_rule(self, rule_id):
+        """
+        Returns the evaluation data of a single rule.
+        """
+        return self.rule_store[rule_id]
+
+    def read_table_rule(self, rule_id):
+        """Rebuilds a rule from the evaluation table."""
+        return self.evaluation_table.rule(rule_id)
+
+    def read_streamed_rule(self, rule_id):
+        """Re-reads a streamed rule from its location in the evaluation report."""
+        offset, length = self.rule_offsets[rule_id]
+        return read_json_range(self.rule_source, offset, length)
+
     @staticmethod
     def convert_unit(value, from_unit, to_unit):
-        """Convert a numerical value from one unit to another and return the magnitude."""
-        quantity = value * ureg[from_unit]
-        return quantity.to(ureg[to_unit]).magnitude
+        """
+        Convert a numerical value from one unit to another and return the magnitude, with the conversion factor of the
+        pair of units resolved through the unit registry once.
+        """
+        return unit_conversions.convert(value, from_unit, to_unit)
 
     @staticmethod
     def determine_fan_power(fan):
@@ -125,69 +415,14 @@ class RCTDetailedReport:
             )
 
     def summarize_rmd_data(self, rmd_data, model_type):
-        rmd_building_summary = {
-            "rmd_type": model_type,
-            "building_count": len(rmd_data.get("buildings", [])),
-            "building_segment_count": 0,
-            "zone_count": 0,
-            "space_count": 0,
-            "system_count": 0,
-            "boiler_count": len(rmd_data.get("boilers", [])),
-            "chiller_count": len(rmd_data.get("chillers", [])),
-            "heat_rejection_count": len(rmd_data.get("heat_rejections", [])),
-            "pump_count": len(rmd_data.get("pumps", [])),
-            "fluid_loop_types": {proposed_fluid_loop.get("type") for proposed_fluid_loop in
-                                 rmd_data.get("fluid_loops", [])},
-            "overall_wall_ua_by_building_segment": {},
-            "overall_wall_u_factor_by_building_segment": {},
-            "overall_roof_ua_by_building_segment": {},
-            "overall_roof_u_factor_by_building_segment": {},
-            "overall_window_ua_by_building_segment": {},
-            "overall_window_u_factor_by_building_segment": {},
-            "overall_skylight_ua_by_building_segment": {},
-            "overall_skylight_u_factor_by_building_segment": {},
-            "total_floor_area_by_building_segment": {},
-            "total_wall_area_by_building_segment": {},
-            "total_roof_area_by_building_segment": {},
-            "total_window_area_by_building_segment": {},
-            "total_skylight_area_by_building_segment": {},
-            "total_floor_area_by_space_type": {},
-            "total_occupants_by_space_type": {},
-            "total_lighting_power_by_space_type": {},
-            "total_miscellaneous_equipment_power_by_space_type": {},
-            "average_occupancy_by_space_type": {},
-            "average_lighting_power_by_space_type": {},
-            "average_miscellaneous_equipment_power_by_space_type": {},
-            "total_fan_power_by_fan_control_by_fan_type": {},
-            "total_air_flow_by_fan_control_by_fan_type": {},
-            "other_fan_power_by_fan_type": {},
-            "other_air_flow_by_fan_type": {},
-            "total_fan_power_by_fan_type": {},
-            "total_air_flow_by_fan_type": {},
-            "energy_by_fuel_type": {},
-            "cost_by_fuel_type": {},
-            "energy_by_end_use": {},
-            "elec_by_end_use": {},
-            "gas_by_end_use": {},
-            "energy_by_end_use_eui": {},
-            "elec_by_end_use_eui": {},
-            "gas_by_end_use_eui": {},
-            "total_floor_area": 0,
-            "total_exterior_wall_area": 0,
-            "total_roof_area": 0,
-            "total_window_area": 0,
-            "total_skylight_area": 0,
-            "total_occupants": 0,
-            "total_lighting_power": 0,
-            "total_equipment_power": 0,
-            "total_pump_power": 0,
-            "total_fan_power": 0,
-            "total_zone_minimum_oa_flow": 0,
-            "total_infiltration": 0,
-            "unmet_heating_hours": 0,
-            "unmet_cooling_hours": 0,
-            "total_energy": 0,
-            "total_cost": 0,
+        rmd_building_summary = ModelSummary(model_type)
+        rmd_building_summary.building_count = len(rmd_data.get("buildings", []))
+        rmd_building_summary.boiler_count = len(rmd_data.get("boilers", []))
+        rmd_building_summary.chiller_count = len(rmd_data.get("chillers", []))
+        rmd_building_summary.heat_rejection_count = len(rmd_data.get("heat_rejections", []))
+        rmd_building_summary.pump_count = len(rmd_data.get("pumps", []))
+        rmd_building_summary.fluid_loop_types = {
+            proposed_fluid_loop.get("type") for proposed_fluid_loop in rmd_data.get("fluid_loops", [])
         }
 
         output = rmd_data.get("output")
@@ -195,16 +430,40 @@ class RCTDetailedReport:
             self.summarize_output_data(output, rmd_building_summary)
 
         for building in rmd_data.get("buildings", []):
-            rmd_building_summary["building_segment_count"] += len(
+            rmd_building_summary.building_segment_count += len(
                 building.get("building_segments", [])
             )
 
             self.summarize_building_segment_data(building, rmd_building_summary)
 
-        for pump in rmd_data.get("pumps", []):
-            pump_power = self.determine_pump_power(pump)
-            if pump_power:
-                rmd_building_summary["total_pump_power"] += pump_power
+        # The built-in totals are accumulated by the loops above, and only the numpy columns, the object index and
+        # the metrics of the other collectors are collected in a walk of the RMD, when there are any
+        collectors = []
+        if self.rmd_object_index is not None:
+            collectors.append(ObjectIndexCollector(self.rmd_object_index))
+        columns = None
+        if self.columnar_summaries:
+            columns = columnar.RMDColumns()
+            collectors.append(columns)
+        metric_collectors = {
+            collector_name(collector_class): collector_class() for collector_class in self.rmd_collectors
+        }
+        collectors.extend(metric_collectors.values())
+        if collectors:
+            walk_rmd(rmd_data, collectors)
+
+        if columns is not None:
+            columns.summarize(rmd_building_summary, self.space_areas, self.baseline_space_space_types)
+        else:
+            for pump in rmd_data.get("pumps", []):
+                pump_power = self.determine_pump_power(pump)
+                if pump_power is not None:
+                    rmd_building_summary.pump_powers.append(pump_power)
+                if pump_power:
+                    rmd_building_summary.total_pump_power += pump_power
+
+        for name, collector in metric_collectors.items():
+            rmd_building_summary.collected_metrics[name] = collector.result()
 
         return rmd_building_summary
 
@@ -212,139 +471,123 @@ class RCTDetailedReport:
     def summarize_output_data(output, rmd_building_summary):
         output_instance = output.get("output_instance")
         if output_instance is not None:
-            rmd_building_summary["unmet_heating_hours"] += output_instance.get(
+            rmd_building_summary.unmet_heating_hours += output_instance.get(
                 "unmet_heating_hours", 0
             )
-            rmd_building_summary["unmet_cooling_hours"] += output_instance.get(
+            rmd_building_summary.unmet_cooling_hours += output_instance.get(
                 "unmet_cooling_hours", 0
             )
 
+            energy_by_fuel_type = rmd_building_summary.energy_by_fuel_type
+            cost_by_fuel_type = rmd_building_summary.cost_by_fuel_type
             source_results = output_instance.get("annual_source_results", [])
             for source_result in source_results:
                 source = source_result.get("energy_source")
 
-                rmd_building_summary["total_energy"] += source_result.get("annual_consumption", 0)
-                rmd_building_summary["total_cost"] += source_result.get("annual_cost", 0)
-                rmd_building_summary["energy_by_fuel_type"][source] = (
-                    rmd_building_summary["energy_by_fuel_type"].get(source, 0)
-                    + source_result.get("annual_consumption", 0)
-                )
-                rmd_building_summary["cost_by_fuel_type"][source] = (
-                    rmd_building_summary["cost_by_fuel_type"].get(source, 0)
-                    + source_result.get("annual_cost", 0)
+                rmd_building_summary.total_energy += source_result.get("annual_consumption", 0)
+                rmd_building_summary.total_cost += source_result.get("annual_cost", 0)
+                energy_by_fuel_type[source] = (
+                    energy_by_fuel_type.get(source, 0) + source_result.get("annual_consumption", 0)
                 )
+                cost_by_fuel_type[source] = cost_by_fuel_type.get(source, 0) + source_result.get("annual_cost", 0)
 
+            energy_by_end_use = rmd_building_summary.energy_by_end_use
+            elec_by_end_use = rmd_building_summary.elec_by_end_use
+            gas_by_end_use = rmd_building_summary.gas_by_end_use
             end_use_results = output_instance.get("annual_end_use_results", [])
             for end_use in end_use_results:
                 end_use_name = end_use.get("type")
 
-                rmd_building_summary["total_energy"] += end_use.get("annual_site_energy_use", 0)
-                rmd_building_summary["energy_by_end_use"][end_use_name] = (
-                    rmd_building_summary["energy_by_end_use"].get(end_use_name, 0)
-                    + end_use.get("annual_site_energy_use", 0)
+                rmd_building_summary.total_energy += end_use.get("annual_site_energy_use", 0)
+                energy_by_end_use[end_use_name] = (
+                    energy_by_end_use.get(end_use_name, 0) + end_use.get("annual_site_energy_use", 0)
                 )
 
                 source = end_use.get("energy_source")
                 if source == "ELECTRICITY":
-                    rmd_building_summary["elec_by_end_use"][end_use_name] = (
-                        rmd_building_summary["elec_by_end_use"].get(end_use_name, 0)
-                        + end_use.get("annual_site_energy_use", 0)
+                    elec_by_end_use[end_use_name] = (
+                        elec_by_end_use.get(end_use_name, 0) + end_use.get("annual_site_energy_use", 0)
                     )
                 elif source == "NATURAL_GAS":
-                    rmd_building_summary["gas_by_end_use"][end_use_name] = (
-                        rmd_building_summary["gas_by_end_use"].get(end_use_name, 0)
-                        + end_use.get("annual_site_energy_use", 0)
+                    gas_by_end_use[end_use_name] = (
+                        gas_by_end_use.get(end_use_name, 0) + end_use.get("annual_site_energy_use", 0)
                     )
 
     def summarize_building_segment_data(self, building, rmd_building_summary):
         for building_segment in building.get(
                 "building_segments", []
         ):
-            rmd_building_summary["zone_count"] += len(
-                building_segment.get("zones", [])
-            )
-            rmd_building_summary["system_count"] += len(
-                building_segment.get(
-                    "heating_ventilating_air_conditioning_systems", []
-                )
-            )
-
-            self.summarize_rmd_zone_data(building_segment, rmd_building_summary)
-
-            self.summarize_rmd_system_data(building_segment, rmd_building_summary)
-
-    def summarize_rmd_zone_data(self, building_segment, rmd_building_summary):
-        for zone in building_segment.get("zones", []):
-            rmd_building_summary["space_count"] += len(
-                zone.get("spaces", [])
-            )
+            zones = building_segment.get("zones", [])
+            hvac_systems = building_segment.get("heating_ventilating_air_conditioning_systems", [])
+            rmd_building_summary.zone_count += len(zones)
+            rmd_building_summary.system_count += len(hvac_systems)
+
+            # The code of the building segment in the summary's per-segment totals, looked up once for all its zones
+            segment = rmd_building_summary.building_segment_index.code(building_segment.get("id"))
+            for zone in zones:
+                self.summarize_rmd_zone_data(segment, zone, rmd_building_summary)
+
+            # With columnar summaries the fans are summarized from the columns
+            if not self.columnar_summaries:
+                for hvac_system in hvac_systems:
+                    self.summarize_rmd_system_data(hvac_system, rmd_building_summary)
+
+    def summarize_rmd_zone_data(self, segment, zone, rmd_building_summary):
+        """
+        Adds a zone, with its spaces, surfaces and terminals, to the summary. segment is the zone's building segment
+        code in the summary's building_segment_index.
+        """
+        rmd_building_summary.space_count += len(
+            zone.get("spaces", [])
+        )
 
-            infiltration = zone.get("infiltration")
-            if infiltration and "flow_rate" in infiltration:
-                rmd_building_summary[
-                    "total_infiltration"
-                ] += infiltration["flow_rate"]
+        infiltration = zone.get("infiltration")
+        if infiltration and "flow_rate" in infiltration:
+            rmd_building_summary.total_infiltration += infiltration["flow_rate"]
 
+        # With columnar summaries the spaces, surfaces and fans of the whole RMD are summarized at once from its
+        # columns
+        if not self.columnar_summaries:
             zonal_exhaust_fan = zone.get("zonal_exhaust_fan")
             if zonal_exhaust_fan:
                 fan_power = self.determine_fan_power(zonal_exhaust_fan)
+                if fan_power is not None:
+                    rmd_building_summary.fan_powers_by_fan_type["Zonal Exhaust"].append(fan_power)
                 if fan_power:
-                    if "Undefined" not in rmd_building_summary[
-                        "total_fan_power_by_fan_control_by_fan_type"
-                    ]:
-                        rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                            "Undefined"
-                        ] = {
-                            "Supply": 0,
-                            "Return/Relief": 0,
-                            "Exhaust": 0,
-                            "Zonal Exhaust": 0,
-                            "Terminal Unit": 0,
-                        }
+                    rmd_building_summary.fan_power_by_fan_type("Undefined").totals[ZONAL_EXHAUST] += fan_power
+                    rmd_building_summary.total_fan_power += fan_power
 
-                    rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"]["Undefined"]["Zonal Exhaust"] += fan_power
-                    rmd_building_summary["total_fan_power"] += fan_power
+            self.summarize_rmd_space_data(segment, zone, rmd_building_summary)
 
-            self.summarize_rmd_space_data(building_segment, zone, rmd_building_summary)
+            self.summarize_rmd_surface_data(segment, zone, rmd_building_summary)
 
-            self.summarize_rmd_surface_data(building_segment, zone, rmd_building_summary)
+        self.summarize_rmd_terminal_data(zone, rmd_building_summary)
 
-            self.summarize_rmd_terminal_data(zone, rmd_building_summary)
-
-    def summarize_rmd_space_data(self, building_segment, zone, rmd_building_summary):
+    def summarize_rmd_space_data(self, segment, zone, rmd_building_summary):
+        """
+        Adds the spaces of a zone to the summary. segment is the building segment's code in the summary's
+        building_segment_index.
+        """
+        space_type_index = rmd_building_summary.space_type_index
         for space in zone.get("spaces", []):
+            space_type = (
+                space_type_index.code(space["lighting_space_type"]) if "lighting_space_type" in space else None
+            )
+
             if "floor_area" in space:
-                rmd_building_summary[
-                    "total_floor_area"
-                ] += space["floor_area"]
-                rmd_building_summary[
-                    "total_floor_area_by_building_segment"
-                ][building_segment["id"]] = (
-                        rmd_building_summary[
-                            "total_floor_area_by_building_segment"
-                        ].get(building_segment["id"], 0)
-                        + space["floor_area"]
-                )
+                rmd_building_summary.total_floor_area += space["floor_area"]
+                rmd_building_summary.total_floor_area_by_building_segment.add(segment, space["floor_area"])
                 self.space_areas[space["id"]] = space[
                     "floor_area"
                 ]
-            if "lighting_space_type" in space and rmd_building_summary["rmd_type"] == "Baseline":
+            if space_type is not None and rmd_building_summary.rmd_type == "Baseline":
                 self.baseline_space_space_types[space["id"]] = space[
                     "lighting_space_type"
                 ]
             if "number_of_occupants" in space:
-                rmd_building_summary[
-                    "total_occupants"
-                ] += space["number_of_occupants"]
-                if "lighting_space_type" in space:
-                    rmd_building_summary[
-                        "total_occupants_by_space_type"
-                    ][space["lighting_space_type"]] = (
-                            rmd_building_summary[
-                                "total_occupants_by_space_type"
-                            ].get(space["lighting_space_type"], 0)
-                            + space.get("number_of_occupants", 0)
-                    )
+                rmd_building_summary.total_occupants += space["number_of_occupants"]
+                if space_type is not None:
+                    rmd_building_summary.total_occupants_by_space_type.add(space_type, space["number_of_occupants"])
 
             for interior_lighting in space.get(
                     "interior_lighting", [{"power_per_area": 0}]
@@ -353,27 +596,14 @@ class RCTDetailedReport:
                         "power_per_area" in interior_lighting
                         and "floor_area" in space
                 ):
-                    rmd_building_summary["total_lighting_power"] += (
+                    rmd_building_summary.total_lighting_power += (
                             interior_lighting["power_per_area"]
                             * space["floor_area"]
                     )
-                    if "lighting_space_type" in space:
-                        rmd_building_summary[
-                            "total_floor_area_by_space_type"
-                        ][space["lighting_space_type"]] = (
-                                rmd_building_summary[
-                                    "total_floor_area_by_space_type"
-                                ].get(space["lighting_space_type"], 0)
-                                + space["floor_area"]
-                        )
-                        rmd_building_summary[
-                            "total_lighting_power_by_space_type"
-                        ][space["lighting_space_type"]] = (
-                                rmd_building_summary[
-                                    "total_lighting_power_by_space_type"
-                                ].get(space["lighting_space_type"], 0)
-                                + interior_lighting["power_per_area"]
-                                * space["floor_area"]
+                    if space_type is not None:
+                        rmd_building_summary.total_floor_area_by_space_type.add(space_type, space["floor_area"])
+                        rmd_building_summary.total_lighting_power_by_space_type.add(
+                            space_type, interior_lighting["power_per_area"] * space["floor_area"]
                         )
 
             for miscellaneous_equipment in space.get(
@@ -383,81 +613,48 @@ class RCTDetailedReport:
                         "power" in miscellaneous_equipment
                         and "floor_area" in space
                 ):
-                    rmd_building_summary[
-                        "total_equipment_power"
-                    ] += miscellaneous_equipment["power"]
-                    if "lighting_space_type" in space:
-                        rmd_building_summary[
-                            "total_miscellaneous_equipment_power_by_space_type"
-                        ][space["lighting_space_type"]] = (
-                                rmd_building_summary[
-                                    "total_miscellaneous_equipment_power_by_space_type"
-                                ].get(space["lighting_space_type"], 0)
-                                + miscellaneous_equipment["power"]
+                    rmd_building_summary.total_equipment_power += miscellaneous_equipment["power"]
+                    if space_type is not None:
+                        rmd_building_summary.total_miscellaneous_equipment_power_by_space_type.add(
+                            space_type, miscellaneous_equipment["power"]
                         )
 
     @staticmethod
-    def summarize_rmd_surface_data(building_segment, zone, rmd_building_summary):
+    def summarize_rmd_surface_data(segment, zone, rmd_building_summary):
+        """
+        Adds the exterior surfaces of a zone to the summary. segment is the building segment's code in the summary's
+        building_segment_index.
+        """
         for surface in zone.get("surfaces", []):
             if (
                     surface.get("classification") == "WALL"
                     and surface.get("adjacent_to") == "EXTERIOR"
             ):
                 if "area" in surface:
-                    rmd_building_summary[
-                        "total_exterior_wall_area"
-                    ] += surface["area"]
-                    rmd_building_summary[
-                        "total_wall_area_by_building_segment"
-                    ][building_segment["id"]] = (
-                            rmd_building_summary[
-                                "total_wall_area_by_building_segment"
-                            ].get(building_segment["id"], 0)
-                            + surface["area"]
-                    )
+                    rmd_building_summary.total_exterior_wall_area += surface["area"]
+                    rmd_building_summary.total_wall_area_by_building_segment.add(segment, surface["area"])
                 construction = surface.get("construction")
                 if (
                         construction
                         and "u_factor" in construction
                 ):
-                    rmd_building_summary[
-                        "overall_wall_ua_by_building_segment"
-                    ][building_segment["id"]] = (
-                            rmd_building_summary[
-                                "overall_wall_ua_by_building_segment"
-                            ].get(building_segment["id"], 0)
-                            + construction["u_factor"]
-                            * surface["area"]
+                    rmd_building_summary.overall_wall_ua_by_building_segment.add(
+                        segment, construction["u_factor"] * surface["area"]
                     )
             if (
                     surface.get("classification") == "CEILING"
                     and surface.get("adjacent_to") == "EXTERIOR"
             ):
                 if "area" in surface:
-                    rmd_building_summary[
-                        "total_roof_area"
-                    ] += surface["area"]
-                    rmd_building_summary[
-                        "total_roof_area_by_building_segment"
-                    ][building_segment["id"]] = (
-                            rmd_building_summary[
-                                "total_roof_area_by_building_segment"
-                            ].get(building_segment["id"], 0)
-                            + surface["area"]
-                    )
+                    rmd_building_summary.total_roof_area += surface["area"]
+                    rmd_building_summary.total_roof_area_by_building_segment.add(segment, surface["area"])
                 construction = surface.get("construction")
                 if (
                         construction
                         and "u_factor" in construction
                 ):
-                    rmd_building_summary[
-                        "overall_roof_ua_by_building_segment"
-                    ][building_segment["id"]] = (
-                            rmd_building_summary[
-                                "overall_roof_ua_by_building_segment"
-                            ].get(building_segment["id"], 0)
-                            + construction["u_factor"]
-                            * surface["area"]
+                    rmd_building_summary.overall_roof_ua_by_building_segment.add(
+                        segment, construction["u_factor"] * surface["area"]
                     )
 
             for subsurface in surface.get(
@@ -469,26 +666,13 @@ class RCTDetailedReport:
                         == "WINDOW"
                 ):
                     if "glazed_area" in subsurface:
-                        rmd_building_summary[
-                            "total_window_area"
-                        ] += subsurface["glazed_area"]
-                        rmd_building_summary[
-                            "total_window_area_by_building_segment"
-                        ][building_segment["id"]] = (
-                                rmd_building_summary[
-                                    "total_window_area_by_building_segment"
-                                ].get(building_segment["id"], 0)
-                                + subsurface["glazed_area"]
+                        rmd_building_summary.total_window_area += subsurface["glazed_area"]
+                        rmd_building_summary.total_window_area_by_building_segment.add(
+                            segment, subsurface["glazed_area"]
                         )
                     if "u_factor" in subsurface:
-                        rmd_building_summary[
-                            "overall_window_ua_by_building_segment"
-                        ][building_segment["id"]] = (
-                                rmd_building_summary[
-                                    "overall_window_ua_by_building_segment"
-                                ].get(building_segment["id"], 0)
-                                + subsurface["u_factor"]
-                                * subsurface["glazed_area"]
+                        rmd_building_summary.overall_window_ua_by_building_segment.add(
+                            segment, subsurface["u_factor"] * subsurface["glazed_area"]
                         )
                 elif (
                         surface.get("adjacent_to") == "EXTERIOR"
@@ -496,148 +680,218 @@ class RCTDetailedReport:
                         == "SKYLIGHT"
                 ):
                     if "glazed_area" in subsurface:
-                        rmd_building_summary[
-                            "total_skylight_area"
-                        ] += subsurface["glazed_area"]
-                        rmd_building_summary[
-                            "total_skylight_area_by_building_segment"
-                        ][building_segment["id"]] = (
-                                rmd_building_summary[
-                                    "total_skylight_area_by_building_segment"
-                                ].get(building_segment["id"], 0)
-                                + subsurface["glazed_area"]
+                        rmd_building_summary.total_skylight_area += subsurface["glazed_area"]
+                        rmd_building_summary.total_skylight_area_by_building_segment.add(
+                            segment, subsurface["glazed_area"]
                         )
                     if "u_factor" in subsurface:
-                        rmd_building_summary[
-                            "overall_skylight_ua_by_building_segment"
-                        ][building_segment["id"]] = (
-                                rmd_building_summary[
-                                    "overall_skylight_ua_by_building_segment"
-                                ].get(building_segment["id"], 0)
-                                + subsurface["u_factor"]
-                                * subsurface["glazed_area"]
+                        rmd_building_summary.overall_skylight_ua_by_building_segment.add(
+                            segment, subsurface["u_factor"] * subsurface["glazed_area"]
                         )
 
     def summarize_rmd_terminal_data(self, zone, rmd_building_summary):
         for terminal in zone["terminals"]:
             if "minimum_outdoor_airflow" in terminal:
-                rmd_building_summary[
-                    "total_zone_minimum_oa_flow"
-                ] += terminal["minimum_outdoor_airflow"]
+                rmd_building_summary.total_zone_minimum_oa_flow += terminal["minimum_outdoor_airflow"]
 
-            if "fan" in terminal:
+            if "fan" in terminal and not self.columnar_summaries:
                 fan_power = self.determine_fan_power(terminal["fan"])
+                if fan_power is not None:
+                    rmd_building_summary.fan_powers_by_fan_type["Terminal Unit"].append(fan_power)
                 if fan_power:
-                    if "Undefined" not in rmd_building_summary[
-                        "total_fan_power_by_fan_control_by_fan_type"
-                    ]:
-                        rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                            "Undefined"
-                        ] = {
-                            "Supply": 0,
-                            "Return/Relief": 0,
-                            "Exhaust": 0,
-                            "Zonal Exhaust": 0,
-                            "Terminal Unit": 0,
-                        }
-
-                    rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"]["Undefined"]["Terminal Unit"] += fan_power
-                    rmd_building_summary["total_fan_power"] += fan_power
-
-    def summarize_rmd_system_data(self, building_segment, rmd_building_summary):
-        for hvac_system in building_segment.get(
-                "heating_ventilating_air_conditioning_systems", []
-        ):
-            hvac_fan_system = hvac_system.get("fan_system")
-            if hvac_fan_system:
-                supply_fan_controls = hvac_fan_system.get(
-                    "fan_control",
-                    "Undefined"
+                    rmd_building_summary.fan_power_by_fan_type("Undefined").totals[TERMINAL_UNIT] += fan_power
+                    rmd_building_summary.total_fan_power += fan_power
+
+    def summarize_rmd_system_data(self, hvac_system, rmd_building_summary):
+        """Adds the fans of an HVAC system to the summary."""
+        hvac_fan_system = hvac_system.get("fan_system")
+        if hvac_fan_system:
+            supply_fan_controls = hvac_fan_system.get(
+                "fan_control",
+                "Undefined"
+            )
+            if supply_fan_controls == "CONSTANT":
+                occupied_operation = hvac_fan_system.get(
+                    "operation_during_occupied", "Undefined"
                 )
-                if supply_fan_controls == "CONSTANT":
-                    occupied_operation = hvac_fan_system.get(
-                        "operation_during_occupied", "Undefined"
-                    )
-                    if occupied_operation == "CYCLING":
-                        supply_fan_controls = "Constant Cycling"
-
-                if supply_fan_controls not in rmd_building_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ]:
-                    rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                        supply_fan_controls
-                    ] = {
-                        "Supply": 0,
-                        "Return/Relief": 0,
-                        "Exhaust": 0,
-                        "Zonal Exhaust": 0,
-                        "Terminal Unit": 0,
-                    }
-                if supply_fan_controls not in rmd_building_summary[
-                    "total_air_flow_by_fan_control_by_fan_type"
-                ]:
-                    rmd_building_summary["total_air_flow_by_fan_control_by_fan_type"][
-                        supply_fan_controls
-                    ] = {
-                        "Supply": 0,
-                        "Return/Relief": 0,
-                        "Exhaust": 0,
-                        "Zonal Exhaust": 0,
-                        "Terminal Unit": 0,
-                    }
-
-                for fan in hvac_fan_system.get("supply_fans", []):
-                    fan_power = self.determine_fan_power(fan)
-                    if fan_power:
-                        rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                            supply_fan_controls]["Supply"] += fan_power
-                        rmd_building_summary["total_fan_power"] += fan_power
-                    if "design_airflow" in fan:
-                        rmd_building_summary["total_air_flow_by_fan_control_by_fan_type"][
-                            supply_fan_controls
-                        ]["Supply"] += fan["design_airflow"]
-
-                for fan in hvac_fan_system.get("return_fans", []) + hvac_fan_system.get(
-                        "relief_fans", []):
-                    fan_power = self.determine_fan_power(fan)
-                    if fan_power:
-                        rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                            supply_fan_controls]["Return/Relief"] += fan_power
-                        rmd_building_summary["total_fan_power"] += fan_power
-                    if "design_airflow" in fan:
-                        rmd_building_summary["total_air_flow_by_fan_control_by_fan_type"][
-                            supply_fan_controls
-                        ]["Return/Relief"] += fan["design_airflow"]
-
-                for fan in hvac_fan_system.get("exhaust_fans", []):
+                if occupied_operation == "CYCLING":
+                    supply_fan_controls = "Constant Cycling"
+
+            fan_powers_by_fan_type = rmd_building_summary.fan_powers_by_fan_type
+            fan_power_totals = rmd_building_summary.fan_power_by_fan_type(supply_fan_controls).totals
+            air_flow_totals = rmd_building_summary.air_flow_by_fan_type(supply_fan_controls).totals
+
+            for fan_type, fans in (
+                    (SUPPLY, hvac_fan_system.get("supply_fans", [])),
+                    (
+                            RETURN_RELIEF,
+                            hvac_fan_system.get("return_fans", []) + hvac_fan_system.get("relief_fans", []),
+                    ),
+                    (EXHAUST, hvac_fan_system.get("exhaust_fans", [])),
+            ):
+                for fan in fans:
                     fan_power = self.determine_fan_power(fan)
+                    if fan_power is not None:
+                        fan_powers_by_fan_type[FAN_TYPES[fan_type]].append(fan_power)
                     if fan_power:
-                        rmd_building_summary["total_fan_power_by_fan_control_by_fan_type"][
-                            supply_fan_controls]["Exhaust"] += fan_power
-                        rmd_building_summary["total_fan_power"] += fan_power
+                        fan_power_totals[fan_type] += fan_power
+                        rmd_building_summary.total_fan_power += fan_power
                     if "design_airflow" in fan:
-                        rmd_building_summary["total_air_flow_by_fan_control_by_fan_type"][
-                            supply_fan_controls
-                        ]["Exhaust"] += fan["design_airflow"]
+                        air_flow_totals[fan_type] += fan["design_airflow"]
 
     def load_files(self):
         """
         Loads the JSON files into memory that are needed to produce the HTML report.
         """
-        self.evaluation_data = self.load_file(self.detailed_evaluation_report_file_path)
-        self.rpd_data = [self.load_file(file_path) for file_path in self.rpd_file_paths]
+        if self.summarize_rpd_files_separately:
+            self.load_rpd_summaries()
+            return
+
+        self.load_evaluation_report()
+        self.rpd_data = [self.load_rpd_file(file_path) for file_path in self.rpd_file_paths]
+
+    def load_rpd_summaries(self):
+        """
+        Summarizes each RPD file on its own. Cached summaries are used for unchanged files, and the remaining files
+        are loaded and summarized in worker processes when rpd_workers is set, one task per file and RMD type.
+        """
+        results = {}
+        cache_keys = {}
+        if self.result_cache is not None:
+            # The summarized types and collectors are hashed, as their names would make the file names too long
+            summary_contents = [
+                *self.summarized_rmd_types,
+                *(f"{collector.__module__}.{collector.__qualname__}" for collector in self.rmd_collectors),
+                *(("object-index",) if self.index_rmd_objects else ()),
+            ]
+            summary_digest = hashlib.blake2b("\n".join(summary_contents).encode(), digest_size=10).hexdigest()
+            for file_path in self.rpd_file_paths:
+                cache_keys[file_path] = f"rpd-{file_digest(file_path)}-{summary_digest}"
+                cached = self.result_cache.get(cache_keys[file_path])
+                if cached is not None:
+                    results[file_path] = cached
+
+        pending_file_paths = [file_path for file_path in self.rpd_file_paths if file_path not in results]
+        rmd_types = tuple(self.summarized_rmd_types)
+        if self.rpd_workers and pending_file_paths:
+            # Each type gets its own task so that the types of a single file are summarized in parallel. With
+            # selective loading a worker also decodes only the RMD it summarizes.
+            tasks = [(file_path, (rmd_type,)) for file_path in pending_file_paths for rmd_type in rmd_types]
+
+            # The evaluation report is loaded here while the workers parse and summarize the RPD files
+            with ProcessPoolExecutor(max_workers=min(self.rpd_workers, len(tasks))) as executor:
+                futures = [
+                    executor.submit(summarize_rpd_file, file_path, task_rmd_types, **self.rpd_summary_options)
+                    for file_path, task_rmd_types in tasks
+                ]
+                self.load_evaluation_report()
+                for (file_path, _), future in zip(tasks, futures):
+                    result = future.result()
+                    if file_path in results:
+                        results[file_path]["summaries"].update(result["summaries"])
+                    else:
+                        results[file_path] = result
+        else:
+            self.load_evaluation_report()
+            for file_path in pending_file_paths:
+                results[file_path] = summarize_rpd_file(file_path, rmd_types, **self.rpd_summary_options)
+
+        if self.result_cache is not None:
+            for file_path in pending_file_paths:
+                self.result_cache.set(cache_keys[file_path], results[file_path])
+
+        self.rpd_data = [results[file_path] for file_path in self.rpd_file_paths]
+
+    def load_evaluation_report(self):
+        file_path = self.detailed_evaluation_report_file_path
+        if self.result_cache is not None:
+            if self.columnar_evaluations:
+                mode = "columnar"
+            else:
+                mode = "stream" if self.stream_evaluation_report else "full"
+            self.evaluation_cache_key = f"evaluation-{mode}-{file_digest(file_path)}"
+            # A compressed report has to be decompressed again to re-read the streamed rules from their offsets
+            if self.columnar_evaluations or not (self.stream_evaluation_report and is_compressed_json_file(file_path)):
+                self.cached_evaluation_results = self.result_cache.get(self.evaluation_cache_key)
+
+        if self.cached_evaluation_results is not None and self.columnar_evaluations:
+            # The rules are rendered from the cached evaluation table, so nothing is parsed here
+            self.evaluation_data = dict(self.cached_evaluation_results["evaluation_header"])
+        elif self.cached_evaluation_results is not None and self.stream_evaluation_report:
+            # The rules are read from their cached offsets when the HTML is written, so nothing is parsed here
+            self.evaluation_data = dict(self.cached_evaluation_results["evaluation_header"])
+            self.rule_source = file_path
+        elif self.stream_evaluation_report:
+            self.evaluation_data = self.stream_evaluation_report_file(file_path)
+        else:
+            self.evaluation_data = self.load_file(file_path, self.json_backend)
 
     def extract_evaluation_data(self):
         """
         Extracts select evaluation data from the overall data structure for reformatting and easy presentation.
         """
+        if self.columnar_evaluations:
+            self.rule_store = RuleStore(self.read_table_rule)
+        else:
+            # Streamed rules are re-read by offset rather than kept
+            self.rule_store = RuleStore(self.read_streamed_rule if self.stream_evaluation_report else None)
+
+        if self.cached_evaluation_results is not None:
+            for attribute, value in self.cached_evaluation_results["results"].items():
+                setattr(self, attribute, value)
+            if self.columnar_evaluations:
+                for rule in self.evaluation_table.rules:
+                    self.rule_store.add(rule["rule_id"])
+            elif self.stream_evaluation_report:
+                for rule_id in self.rule_offsets:
+                    self.rule_store.add(rule_id)
+            else:
+                for rule in self.evaluation_data["rules"]:
+                    self.rule_store.add(rule["rule_id"], rule)
+            return
+
+        if self.columnar_evaluations:
+            self.extract_columnar_evaluation_data()
+        else:
+            self.extract_rule_evaluation_data()
+        self.rule_evaluation_message_template_counts = {
+            rule_id: self.message_table.template_counts(message_counts)
+            for rule_id, message_counts in self.rule_evaluation_message_counts.items()
+        }
+
+        # Read after the rules so that every top-level member has been parsed when the report is streamed
         for rpd_file in self.evaluation_data["rpd_files"]:
             self.model_types.add(
                 self.model_type_disp_map.get(rpd_file["ruleset_model_type"])
             )
 
+        if self.result_cache is not None:
+            self.result_cache.set(
+                self.evaluation_cache_key,
+                {
+                    "evaluation_header": {key: value for key, value in self.evaluation_data.items() if key != "rules"},
+                    "results": {
+                        attribute: getattr(self, attribute)
+                        for attribute in (
+                            *self.evaluation_result_attributes,
+                            *(("evaluation_table",) if self.columnar_evaluations else ()),
+                        )
+                    },
+                },
+            )
+
+    def extract_rule_evaluation_data(self):
+        """
+        Extracts the rule outcomes and the evaluation counts from the rules of the evaluation report, one evaluation
+        at a time.
+        """
+        # Each distinct messages value, data_group_id and variable name is kept once and shared by the evaluations
+        message_table = self.message_table
+        data_group_ids = InternTable()
+        variables = InternTable()
         for rule in self.evaluation_data["rules"]:
             rule_id = rule["rule_id"]
+            self.rule_store.add(rule_id, rule)
             eval_type = rule["evaluation_type"]
             outcomes = set()
             messages = set()
@@ -646,20 +900,28 @@ class RCTDetailedReport:
             if rule_id not in self.rule_evaluation_outcome_counts:
                 self.rule_evaluation_outcome_counts[rule_id] = {}
             if rule_id not in self.rule_evaluation_message_counts:
-                self.rule_evaluation_message_counts[rule_id] = {}
+                self.rule_evaluation_message_counts[rule_id] = Counter()
+            message_codes = []
 
             for evaluation in rule["evaluations"]:
                 outcome = self.outcome_disp_map.get(evaluation["outcome"])
                 outcomes.add(outcome)
 
-                if isinstance(evaluation["messages"], str):
-                    messages.add(evaluation["messages"])
-                if isinstance(evaluation["messages"], dict):
-                    for key, message in evaluation["messages"].items():
-                        messages.add(f"{key}: {message}")
-                if isinstance(evaluation["messages"], list):
-                    for message in evaluation["messages"]:
-                        messages.add(message)
+                message_code = message_table.code(evaluation["messages"])
+                evaluation["messages"] = message_table.values[message_code]
+                messages |= message_table.message_set(message_code)
+                message_codes.append(message_code)
+
+                data_group_id = evaluation.get("data_group_id")
+                if data_group_id is not None:
+                    data_group_id = evaluation["data_group_id"] = data_group_ids.intern(data_group_id)
+                    rule_ids = self.rule_ids_by_data_group_id.setdefault(data_group_id, {}).setdefault(outcome, [])
+                    # The evaluations of a rule are consecutive, so each rule is listed once per object and outcome
+                    if not rule_ids or rule_ids[-1] != rule_id:
+                        rule_ids.append(rule_id)
+
+                for calc_value in evaluation.get("calculated_values") or ():
+                    calc_value["variable"] = variables.intern(calc_value["variable"])
 
                 # Update outcome counts
                 if outcome in self.rule_evaluation_outcome_counts[rule_id]:
@@ -667,13 +929,6 @@ class RCTDetailedReport:
                 else:
                     self.rule_evaluation_outcome_counts[rule_id][outcome] = 1
 
-                # Update message counts
-                for message in evaluation["messages"]:
-                    if message in self.rule_evaluation_message_counts[rule_id]:
-                        self.rule_evaluation_message_counts[rule_id][message] += 1
-                    else:
-                        self.rule_evaluation_message_counts[rule_id][message] = 1
-
                 if rule_id == "6-4" and "calculated_values" in evaluation:
                     lpd_allowance_calc_value = next(
                         calc_value
@@ -685,6 +940,9 @@ class RCTDetailedReport:
                             lpd_allowance_calc_value["value"]
                         )
 
+            # Count the messages of each distinct messages value once for the rule
+            message_table.count(Counter(message_codes), self.rule_evaluation_message_counts[rule_id])
+
             # Determine rule status
             if outcomes == {"Failing"} and messages == {" ::TOLERANCE::"}:
                 self.rules_passed.append(rule_id)
@@ -699,61 +957,271 @@ class RCTDetailedReport:
             elif outcomes == {"N/A"}:
                 self.rules_not_applicable.append(rule_id)
 
+    def extract_columnar_evaluation_data(self):
+        """
+        Extracts the same data as extract_rule_evaluation_data from an EvaluationTable of the rules, with the counts
+        and rule outcomes computed by reductions over its columns. The table is kept to render the rules from, instead
+        of the parsed rules.
+        """
+        np = columnar.np
+        table = self.evaluation_table = EvaluationTable()
+        self.message_table = table.messages
+        for rule in self.evaluation_data["rules"]:
+            table.add_rule(rule)
+            self.rule_store.add(rule["rule_id"])
+        self.evaluation_data["rules"] = []
+
+        self.rule_evaluation_outcome_counts = table.outcome_counts(self.outcome_disp_map)
+        self.rule_evaluation_message_counts = table.message_counts()
+        self.rule_ids_by_data_group_id = table.rule_ids_by_data_group_id(self.outcome_disp_map)
+
+        # The first lpd_allowance_b of each evaluation of rule 6-4, parsed once for all the evaluations
+        allowances = table.calculated_values("lpd_allowance_b", rule_id="6-4")
+        first_values = np.unique(allowances.evaluation, return_index=True)[1]
+        for data_group_id, allowance in zip(
+                allowances.data_group_id[first_values].tolist(), allowances.value[first_values].tolist()
+        ):
+            self.space_lpd_allowances[data_group_id] = allowance
+
+        # The rule status conditions of extract_rule_evaluation_data, as masks over the rules
+        present = table.outcomes_present(self.outcome_disp_map)
+        failing = present["Failing"]
+        undetermined = present["Undetermined"]
+        passing = present["Passing"]
+        not_applicable = present["N/A"]
+        other = present[None]
+        evaluation_types = np.array([rule["evaluation_type"] for rule in table.rules], dtype=object)
+
+        passed_within_tolerance = (
+                failing & ~undetermined & ~passing & ~not_applicable & ~other
+                & table.messages_equal({" ::TOLERANCE::"})
+        )
+        failed = failing & ~passed_within_tolerance
+        full_undetermined = ~failing & undetermined & (evaluation_types == "FULL")
+        applicability_undetermined = ~failing & undetermined & (evaluation_types == "APPLICABILITY")
+        passed = passed_within_tolerance | (passing & ~failing & ~undetermined & ~other)
+        only_not_applicable = not_applicable & ~failing & ~undetermined & ~passing & ~other
+
+        rule_ids = [rule["rule_id"] for rule in table.rules]
+        self.rules_passed.extend(rule_ids[rule_index] for rule_index in np.flatnonzero(passed))
+        self.rules_failed.extend(rule_ids[rule_index] for rule_index in np.flatnonzero(failed))
+        self.full_eval_rules_undetermined.extend(
+            rule_ids[rule_index] for rule_index in np.flatnonzero(full_undetermined)
+        )
+        self.appl_eval_rules_undetermined.extend(
+            rule_ids[rule_index] for rule_index in np.flatnonzero(applicability_undetermined)
+        )
+        self.rules_not_applicable.extend(rule_ids[rule_index] for rule_index in np.flatnonzero(only_not_applicable))
+
     def extract_model_data(self):
-        if len(self.rpd_data) == 1:
-            self.rpd_data = self.rpd_data[0]
+        if self.summarize_rpd_files_separately:
+            self.extract_summarized_model_data()
             return
 
-        merged = self.rpd_data[0]
+        self.merge_rpd_data(self.rpd_data)
+        self.apply_rmd_summaries(self.summarize_rmds(self.rpd_data["ruleset_model_descriptions"]))
 
-        for rpd in self.rpd_data[1:]:
-            # Extend the ruleset_model_descriptions list
-            merged["ruleset_model_descriptions"].extend(rpd["ruleset_model_descriptions"])
+    def extract_summarized_model_data(self):
+        """
+        Combines the per-file results returned by summarize_rpd_file. As with the merged path, the first model of
+        each type found in file order is used.
+        """
+        rpd_summaries = self.rpd_data
+        self.merge_rpd_data([result["rpd"] for result in rpd_summaries])
 
-            for key in rpd:
-                if key == "ruleset_model_descriptions":
-                    continue  # already handled
+        rmd_summaries = {}
+        for result in rpd_summaries:
+            for rmd_type, rmd_summary in result["summaries"].items():
+                rmd_summaries.setdefault(rmd_type, rmd_summary)
 
-                val = rpd[key]
-                if key not in merged:
-                    merged[key] = val
-                    continue
+        self.apply_rmd_summaries(rmd_summaries)
 
-                # Merge non-list, non-dict values (e.g., strings and numbers)
-                if not isinstance(val, (list, dict)):
-                    if merged[key] != val:
-                        # TODO log this conflict visible to users
-                        print("Conflicting value for key:", key, " keeping the first occurrence")
-                        pass
-                    continue
+    def summarize_rmds(self, rmds):
+        """
+        Summarizes the first RMD of each summarized type.
 
-                # Merge dicts like metadata and output, or calendar and weather in older versions of the schema
-                if isinstance(val, dict):
-                    if not isinstance(merged[key], dict):
-                        continue  # mismatched types, skip or log error
-                    for subkey, subval in val.items():
-                        if subkey not in merged[key]:
-                            merged[key][subkey] = subval
-                        elif merged[key][subkey] != subval:
-                            # TODO log this conflict visible to users
-                            print("Conflicting value for key:", subkey, " keeping the first occurrence")
-                            pass
-
-        self.rpd_data = merged
-
-        proposed_rmd = next(
-            rmd
-            for rmd in self.rpd_data["ruleset_model_descriptions"]
-            if rmd["type"] == "PROPOSED"
-        )
-        self.proposed_model_summary = self.summarize_rmd_data(proposed_rmd, model_type="Proposed")
+        Returns:
+            dict: RMD type -> (summary, space_areas, baseline_space_space_types, object_index), with the space details
+                and the object index of that RMD alone. object_index is None unless index_rmd_objects is set.
+        """
+        rmd_summaries = {}
+        for rmd in rmds:
+            model_type = self.summarized_rmd_types.get(rmd["type"])
+            if model_type is None or rmd["type"] in rmd_summaries:
+                continue
+            self.space_areas = {}
+            self.baseline_space_space_types = {}
+            self.rmd_object_index = ObjectIndex() if self.index_rmd_objects else None
+            summary = self.summarize_rmd_data(rmd, model_type=model_type)
+            rmd_summaries[rmd["type"]] = (
+                summary, self.space_areas, self.baseline_space_space_types, self.rmd_object_index
+            )
 
-        baseline_rmd = next(
-            rmd
-            for rmd in self.rpd_data["ruleset_model_descriptions"]
-            if rmd["type"] == "BASELINE_0"
-        )
-        self.baseline_model_summary = self.summarize_rmd_data(baseline_rmd, model_type="Baseline")
+        self.space_areas = {}
+        self.baseline_space_space_types = {}
+        self.rmd_object_index = None
+        return rmd_summaries
+
+    def apply_rmd_summaries(self, rmd_summaries):
+        """
+        Sets the model summaries from the results of summarize_rmds, and averages the baseline orientations.
+        """
+        for rmd_type in self.summarized_rmd_types:
+            if rmd_type not in rmd_summaries:
+                continue
+            summary, space_areas, space_space_types, object_index = rmd_summaries[rmd_type]
+            self.model_summaries[rmd_type] = summary
+            if object_index is not None:
+                self.object_indexes[rmd_type] = object_index
+            # Only the proposed and baseline space details are used, applied in that order so the baseline values
+            # take precedence
+            if rmd_type in self.required_rmd_types:
+                self.space_areas.update(space_areas)
+                self.baseline_space_space_types.update(space_space_types)
+
+        self.proposed_model_summary = self.model_summaries["PROPOSED"]
+        self.baseline_model_summary = self.model_summaries["BASELINE_0"]
+        self.averaged_baseline_model_summary = self.average_baseline_model_summaries()
+
+    def average_baseline_model_summaries(self):
+        """
+        Returns a copy of the baseline model summary with its energy and cost results averaged over the baseline
+        orientations that were summarized, which gives the baseline building performance of Appendix G. Returns None
+        when only one orientation was summarized.
+        """
+        orientation_summaries = [
+            self.model_summaries[rmd_type]
+            for rmd_type in self.baseline_orientation_rmd_types
+            if rmd_type in self.model_summaries
+        ]
+        if len(orientation_summaries) < 2:
+            return None
+
+        averaged_summary = copy.deepcopy(self.baseline_model_summary)
+        averaged_summary["rmd_type"] = "Baseline (Average)"
+        for key in self.averaged_baseline_attributes:
+            if isinstance(averaged_summary[key], Mapping):
+                totals = {}
+                for summary in orientation_summaries:
+                    for sub_key, value in summary[key].items():
+                        totals[sub_key] = totals.get(sub_key, 0) + value
+                averaged_summary[key] = {
+                    sub_key: total / len(orientation_summaries) for sub_key, total in totals.items()
+                }
+            else:
+                averaged_summary[key] = (
+                        sum(summary[key] for summary in orientation_summaries) / len(orientation_summaries)
+                )
+
+        return averaged_summary
+
+    def find_rmd_object(self, object_id, rmd_type=None):
+        """
+        Looks up an RMD object by id, such as the data_group_id of a rule evaluation.
+
+        Args:
+            object_id (str): Id of the object.
+            rmd_type (str): RMD type to look in. Defaults to the first summarized RMD type that has the id.
+
+        Returns:
+            IndexedObject: The object type, the ids of its parents and the object, or None when no summarized RMD has
+                the id or index_rmd_objects is not set. The object is None when the RPD files were summarized in
+                worker processes or cached.
+        """
+        if rmd_type is not None:
+            object_index = self.object_indexes.get(rmd_type)
+            return object_index.get(object_id) if object_index is not None else None
+        for object_index in self.object_indexes.values():
+            if object_id in object_index:
+                return object_index[object_id]
+        return None
+
+    @classmethod
+    def summarize_object_attributes(cls, object_type, rmd_object):
+        """
+        Returns the key attributes of a zone, space or HVAC system shown in its drill-down, in the units of the RMD,
+        or None for the other object types.
+        """
+        if object_type == "Zone" or object_type == "Space":
+            spaces = rmd_object.get("spaces", []) if object_type == "Zone" else [rmd_object]
+            floor_area = 0
+            lighting_power = 0
+            occupants = 0
+            for space in spaces:
+                space_floor_area = space.get("floor_area", 0)
+                floor_area += space_floor_area
+                for interior_lighting in space.get("interior_lighting", []):
+                    lighting_power += interior_lighting.get("power_per_area", 0) * space_floor_area
+                occupants += space.get("number_of_occupants", 0)
+            attributes = {
+                "floor_area": floor_area,
+                "lighting_power_density": lighting_power / floor_area if floor_area else 0,
+                "number_of_occupants": occupants,
+            }
+            if object_type == "Space" and "lighting_space_type" in rmd_object:
+                attributes["lighting_space_type"] = rmd_object["lighting_space_type"]
+            return attributes
+
+        if object_type == "HeatingVentilatingAirConditioningSystem":
+            fan_system = rmd_object.get("fan_system") or {}
+            fan_power = 0
+            for fan_list_key in ("supply_fans", "return_fans", "relief_fans", "exhaust_fans"):
+                for fan in fan_system.get(fan_list_key, []):
+                    fan_power += cls.determine_fan_power(fan) or 0
+            return {
+                "fan_control": fan_system.get("fan_control", "Undefined"),
+                "fan_power": fan_power,
+                "supply_air_flow": sum(fan.get("design_airflow", 0) for fan in fan_system.get("supply_fans", [])),
+            }
+
+        return None
+
+    def join_evaluations_to_objects(self):
+        """
+        Joins the rule evaluations to the zones, spaces and HVAC systems they were evaluated for, by data_group_id.
+        Each object found in the proposed or baseline model gets a drill-down with its type, the ids of its parents,
+        its key attributes in each of those models, and the ids of the rules evaluated for it by outcome. Without
+        index_rmd_objects there is no index to join to, and no drill-downs.
+        """
+        self.object_drilldowns = {}
+        for data_group_id, rule_ids_by_outcome in self.rule_ids_by_data_group_id.items():
+            for rmd_type in self.required_rmd_types:
+                object_index = self.object_indexes.get(rmd_type)
+                if object_index is None or data_group_id not in object_index:
+                    continue
+                indexed_object = object_index[data_group_id]
+                if indexed_object.object_type not in self.drilldown_object_types:
+                    continue
+                if data_group_id not in self.object_drilldowns:
+                    self.object_drilldowns[data_group_id] = {
+                        "object_type": indexed_object.object_type,
+                        "parent_ids": indexed_object.parent_ids,
+                        "attributes_by_model": {},
+                        "rule_ids_by_outcome": rule_ids_by_outcome,
+                    }
+                attributes = object_index.object_attributes(data_group_id, self.summarize_object_attributes)
+                if attributes is not None:
+                    # Copied, so that converting their units leaves the attributes kept in the index unchanged
+                    self.object_drilldowns[data_group_id]["attributes_by_model"][
+                        self.model_type_disp_map[rmd_type]
+                    ] = dict(attributes)
+
+    def iter_model_summaries(self):
+        """Yields every model summary, including the averaged baseline."""
+        yield from self.model_summaries.values()
+        if self.averaged_baseline_model_summary is not None:
+            yield self.averaged_baseline_model_summary
+
+    def merge_rpd_data(self, rpds):
+        """
+        Merges the RPDs loaded from rpd_file_paths into rpd_data. Conflicting values are logged and kept in
+        merge_conflicts for the report.
+        """
+        rpd_merge = RPDMerge()
+        for file_path, rpd in zip(self.rpd_file_paths, rpds):
+            rpd_merge.add(rpd, file_path)
+        self.rpd_data = rpd_merge.result()
+        self.merge_conflicts = rpd_merge.conflicts
 
     def perform_analytic_calculations(self):
         """
@@ -761,434 +1229,185 @@ class RCTDetailedReport:
         """
         # Calculate the LPD allowance based on evaluation data + RPD data combined
         for space_id in self.space_areas:
-            self.baseline_total_lighting_power_allowance += (
-                    self.space_lpd_allowances.get(space_id, 0)
-                    * self.convert_unit(self.space_areas[space_id], "m2", "ft2")
-            )
+            space_area = self.convert_unit(self.space_areas[space_id], "m2", "ft2")
+            self.baseline_total_lighting_power_allowance += self.space_lpd_allowances.get(space_id, 0) * space_area
             space_type = self.baseline_space_space_types.get(space_id)
             if space_type:
                 self.baseline_lighting_power_allowance_by_space_type[space_type] = (
                         self.baseline_lighting_power_allowance_by_space_type.get(space_type, 0)
-                        + self.space_lpd_allowances.get(space_id, 0)
-                        * self.convert_unit(self.space_areas[space_id], "m2", "ft2")
+                        + self.space_lpd_allowances.get(space_id, 0) * space_area
                 )
 
+        for model_summary in self.iter_model_summaries():
+            self.calculate_model_summary_details(model_summary)
+            self.calculate_model_summary_euis(model_summary)
+
+    @staticmethod
+    def calculate_model_summary_details(model_summary):
+        """
+        Calculates the averages and fan totals of a single model summary.
+        """
         # Calculate the average U-factors by building segment
-        for building_segment_id in self.baseline_model_summary[
+        for building_segment_id in model_summary[
             "overall_wall_ua_by_building_segment"
         ]:
-            self.baseline_model_summary["overall_wall_u_factor_by_building_segment"][
+            model_summary["overall_wall_u_factor_by_building_segment"][
                 building_segment_id
             ] = (
-                    self.baseline_model_summary["overall_wall_ua_by_building_segment"][
+                    model_summary["overall_wall_ua_by_building_segment"][
                         building_segment_id
                     ]
-                    / self.baseline_model_summary["total_wall_area_by_building_segment"][
+                    / model_summary["total_wall_area_by_building_segment"][
                         building_segment_id
                     ]
             )
-        for building_segment_id in self.baseline_model_summary[
+        for building_segment_id in model_summary[
             "overall_roof_ua_by_building_segment"
         ]:
-            self.baseline_model_summary["overall_roof_u_factor_by_building_segment"][
+            model_summary["overall_roof_u_factor_by_building_segment"][
                 building_segment_id
             ] = (
-                    self.baseline_model_summary["overall_roof_ua_by_building_segment"][
+                    model_summary["overall_roof_ua_by_building_segment"][
                         building_segment_id
                     ]
-                    / self.baseline_model_summary["total_roof_area_by_building_segment"][
+                    / model_summary["total_roof_area_by_building_segment"][
                         building_segment_id
                     ]
             )
-        for building_segment_id in self.baseline_model_summary[
+        for building_segment_id in model_summary[
             "overall_window_ua_by_building_segment"
         ]:
-            self.baseline_model_summary["overall_window_u_factor_by_building_segment"][
+            model_summary["overall_window_u_factor_by_building_segment"][
                 building_segment_id
             ] = (
-                    self.baseline_model_summary["overall_window_ua_by_building_segment"][
+                    model_summary["overall_window_ua_by_building_segment"][
                         building_segment_id
                     ]
-                    / self.baseline_model_summary["total_window_area_by_building_segment"][
+                    / model_summary["total_window_area_by_building_segment"][
                         building_segment_id
                     ]
             )
-        for building_segment_id in self.baseline_model_summary[
+        for building_segment_id in model_summary[
             "overall_skylight_ua_by_building_segment"
         ]:
-            self.baseline_model_summary["overall_skylight_u_factor_by_building_segment"][
-                building_segment_id
-            ] = (
-                    self.baseline_model_summary["overall_skylight_ua_by_building_segment"][
-                        building_segment_id
-                    ]
-                    / self.baseline_model_summary["total_skylight_area_by_building_segment"][
-                        building_segment_id
-                    ]
-            )
-        for building_segment_id in self.proposed_model_summary[
-            "overall_wall_ua_by_building_segment"
-        ]:
-            self.proposed_model_summary["overall_wall_u_factor_by_building_segment"][
-                building_segment_id
-            ] = (
-                    self.proposed_model_summary["overall_wall_ua_by_building_segment"][
-                        building_segment_id
-                    ]
-                    / self.proposed_model_summary["total_wall_area_by_building_segment"][
-                        building_segment_id
-                    ]
-            )
-        for building_segment_id in self.proposed_model_summary[
-            "overall_roof_ua_by_building_segment"
-        ]:
-            self.proposed_model_summary["overall_roof_u_factor_by_building_segment"][
-                building_segment_id
-            ] = (
-                    self.proposed_model_summary["overall_roof_ua_by_building_segment"][
-                        building_segment_id
-                    ]
-                    / self.proposed_model_summary["total_roof_area_by_building_segment"][
-                        building_segment_id
-                    ]
-            )
-        for building_segment_id in self.proposed_model_summary[
-            "overall_window_ua_by_building_segment"
-        ]:
-            self.proposed_model_summary["overall_window_u_factor_by_building_segment"][
+            model_summary["overall_skylight_u_factor_by_building_segment"][
                 building_segment_id
             ] = (
-                    self.proposed_model_summary["overall_window_ua_by_building_segment"][
+                    model_summary["overall_skylight_ua_by_building_segment"][
                         building_segment_id
                     ]
-                    / self.proposed_model_summary["total_window_area_by_building_segment"][
-                        building_segment_id
-                    ]
-            )
-        for building_segment_id in self.proposed_model_summary[
-            "overall_skylight_ua_by_building_segment"
-        ]:
-            self.proposed_model_summary["overall_skylight_u_factor_by_building_segment"][
-                building_segment_id
-            ] = (
-                    self.proposed_model_summary["overall_skylight_ua_by_building_segment"][
-                        building_segment_id
-                    ]
-                    / self.proposed_model_summary["total_skylight_area_by_building_segment"][
+                    / model_summary["total_skylight_area_by_building_segment"][
                         building_segment_id
                     ]
             )
 
         # Calculate the average LPD by lighting space type
-        for lighting_space_type in self.baseline_model_summary[
-            "total_lighting_power_by_space_type"
-        ]:
-            self.baseline_model_summary[
-                "average_lighting_power_by_space_type"
-            ][lighting_space_type] = (
-                    self.baseline_model_summary[
-                        "total_lighting_power_by_space_type"
-                    ][lighting_space_type]
-                    / self.baseline_model_summary[
-                        "total_floor_area_by_space_type"
-                    ][lighting_space_type]
-            )
-        for lighting_space_type in self.proposed_model_summary[
+        for lighting_space_type in model_summary[
             "total_lighting_power_by_space_type"
         ]:
-            self.proposed_model_summary[
+            model_summary[
                 "average_lighting_power_by_space_type"
             ][lighting_space_type] = (
-                    self.proposed_model_summary[
+                    model_summary[
                         "total_lighting_power_by_space_type"
                     ][lighting_space_type]
-                    / self.proposed_model_summary[
+                    / model_summary[
                         "total_floor_area_by_space_type"
                     ][lighting_space_type]
             )
 
         # Calculate the Other and Total fan summary details
-        self.baseline_model_summary["total_fan_power_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-        self.baseline_model_summary["total_air_flow_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-        self.proposed_model_summary["total_fan_power_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-        self.proposed_model_summary["total_air_flow_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
+        total_fan_power_by_fan_type = FanTypeTotals()
+        total_air_flow_by_fan_type = FanTypeTotals()
+        other_fan_power_by_fan_type = FanTypeTotals()
+        other_air_flow_by_fan_type = FanTypeTotals()
 
-        for fan_control in self.baseline_model_summary[
-            "total_fan_power_by_fan_control_by_fan_type"
-        ]:
-            for fan_type in self.baseline_model_summary[
-                "total_fan_power_by_fan_control_by_fan_type"
-            ][fan_control]:
-                self.baseline_model_summary["total_fan_power_by_fan_type"][
-                    fan_type
-                ] += self.baseline_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-                self.baseline_model_summary["total_fan_power"] += self.baseline_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-
-        for fan_control in self.baseline_model_summary[
-            "total_air_flow_by_fan_control_by_fan_type"
-        ]:
-            for fan_type in self.baseline_model_summary[
-                "total_air_flow_by_fan_control_by_fan_type"
-            ][fan_control]:
-                self.baseline_model_summary["total_air_flow_by_fan_type"][
-                    fan_type
-                ] += self.baseline_model_summary[
-                    "total_air_flow_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-
-        for fan_control in self.proposed_model_summary[
+        for fan_control, fan_type_totals in model_summary[
             "total_fan_power_by_fan_control_by_fan_type"
-        ]:
-            for fan_type in self.proposed_model_summary[
-                "total_fan_power_by_fan_control_by_fan_type"
-            ][fan_control]:
-                self.proposed_model_summary["total_fan_power_by_fan_type"][
-                    fan_type
-                ] += self.proposed_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-                self.proposed_model_summary["total_fan_power"] += self.proposed_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-
-        for fan_control in self.proposed_model_summary[
-            "total_air_flow_by_fan_control_by_fan_type"
-        ]:
-            for fan_type in self.proposed_model_summary[
-                "total_air_flow_by_fan_control_by_fan_type"
-            ][fan_control]:
-                self.proposed_model_summary["total_air_flow_by_fan_type"][
-                    fan_type
-                ] += self.proposed_model_summary[
-                    "total_air_flow_by_fan_control_by_fan_type"
-                ][fan_control][fan_type]
-
-        self.baseline_model_summary["other_fan_power_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-
-        self.baseline_model_summary["other_air_flow_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
+        ].items():
+            for fan_type, fan_power in enumerate(fan_type_totals.totals):
+                total_fan_power_by_fan_type.totals[fan_type] += fan_power
+                model_summary["total_fan_power"] += fan_power
 
-        self.proposed_model_summary["other_fan_power_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-
-        self.proposed_model_summary["other_air_flow_by_fan_type"] = {
-            "Supply": 0,
-            "Return/Relief": 0,
-            "Exhaust": 0,
-            "Zonal Exhaust": 0,
-            "Terminal Unit": 0,
-        }
-
-        for fan_control in self.baseline_model_summary[
-            "total_fan_power_by_fan_control_by_fan_type"
-        ]:
-            if fan_control in ["Undefined", "INLET_VANE", "DISCHARGE_DAMPER", "OTHER"]:
-                for fan_type in self.baseline_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control]:
-                    self.baseline_model_summary["other_fan_power_by_fan_type"][
-                        fan_type
-                    ] += self.baseline_model_summary[
-                        "total_fan_power_by_fan_control_by_fan_type"
-                    ][fan_control][fan_type]
-
-        for fan_control in self.baseline_model_summary[
+        for fan_control, fan_type_totals in model_summary[
             "total_air_flow_by_fan_control_by_fan_type"
-        ]:
-            if fan_control in ["Undefined", "INLET_VANE", "DISCHARGE_DAMPER", "OTHER"]:
-                for fan_type in self.baseline_model_summary[
-                    "total_air_flow_by_fan_control_by_fan_type"
-                ][fan_control]:
-                    self.baseline_model_summary["other_air_flow_by_fan_type"][
-                        fan_type
-                    ] += self.baseline_model_summary[
-                        "total_air_flow_by_fan_control_by_fan_type"
-                    ][fan_control][fan_type]
-
-        for fan_control in self.proposed_model_summary[
+        ].items():
+            for fan_type, air_flow in enumerate(fan_type_totals.totals):
+                total_air_flow_by_fan_type.totals[fan_type] += air_flow
+
+        for fan_control, fan_type_totals in model_summary[
             "total_fan_power_by_fan_control_by_fan_type"
-        ]:
+        ].items():
             if fan_control in ["Undefined", "INLET_VANE", "DISCHARGE_DAMPER", "OTHER"]:
-                for fan_type in self.proposed_model_summary[
-                    "total_fan_power_by_fan_control_by_fan_type"
-                ][fan_control]:
-                    self.proposed_model_summary["other_fan_power_by_fan_type"][
-                        fan_type
-                    ] += self.proposed_model_summary[
-                        "total_fan_power_by_fan_control_by_fan_type"
-                    ][fan_control][fan_type]
-
-        for fan_control in self.proposed_model_summary[
+                for fan_type, fan_power in enumerate(fan_type_totals.totals):
+                    other_fan_power_by_fan_type.totals[fan_type] += fan_power
+
+        for fan_control, fan_type_totals in model_summary[
             "total_air_flow_by_fan_control_by_fan_type"
-        ]:
+        ].items():
             if fan_control in ["Undefined", "INLET_VANE", "DISCHARGE_DAMPER", "OTHER"]:
-                for fan_type in self.proposed_model_summary[
-                    "total_air_flow_by_fan_control_by_fan_type"
-                ][fan_control]:
-                    self.proposed_model_summary["other_air_flow_by_fan_type"][
-                        fan_type
-                    ] += self.proposed_model_summary[
-                        "total_air_flow_by_fan_control_by_fan_type"
-                    ][fan_control][fan_type]
-
-    def convert_model_data_units(self):
-        """
-        Converts the model data from the JSON files to the desired units.
-        """
-        units_dict = {
-            "overall_wall_ua_by_building_segment": ("W / K", "Btu / h / degR"),
-            "overall_wall_u_factor_by_building_segment": (
-                "W / m2 / K",
-                "Btu / h / ft2 / degR",
-            ),
-            "overall_roof_ua_by_building_segment": ("W / K", "Btu / h / degR"),
-            "overall_roof_u_factor_by_building_segment": (
-                "W / m2 / K",
-                "Btu / h / ft2 / degR",
-            ),
-            "overall_window_ua_by_building_segment": ("W / K", "Btu / h / degR"),
-            "overall_window_u_factor_by_building_segment": (
-                "W / m2 / K",
-                "Btu / h / ft2 / degR",
-            ),
-            "overall_skylight_ua_by_building_segment": ("W / K", "Btu / h / degR"),
-            "overall_skylight_u_factor_by_building_segment": (
-                "W / m2 / K",
-                "Btu / h / ft2 / degR",
-            ),
-            "average_lighting_power_by_space_type": ("W / m2", "W / ft2"),
-            "total_floor_area_by_building_segment": ("m2", "ft2"),
-            "total_wall_area_by_building_segment": ("m2", "ft2"),
-            "total_roof_area_by_building_segment": ("m2", "ft2"),
-            "total_window_area_by_building_segment": ("m2", "ft2"),
-            "total_floor_area_by_space_type": ("m2", "ft2"),
-            "total_floor_area": ("m2", "ft2"),
-            "total_exterior_wall_area": ("m2", "ft2"),
-            "total_roof_area": ("m2", "ft2"),
-            "total_window_area": ("m2", "ft2"),
-            "total_zone_minimum_oa_flow": ("L / s", "cfm"),
-            "total_infiltration": ("L / s", "cfm"),
-            "total_air_flow_by_fan_control_by_fan_type": ("L / s", "cfm"),
-            "total_air_flow_by_fan_type": ("L / s", "cfm"),
-            "total_energy": ("Btu", "kBtu"),
-            "energy_by_fuel_type": ("Btu", "kBtu"),
-            "energy_by_end_use": ("Btu", "kBtu"),
-            "elec_by_end_use": ("Btu", "kWh"),
-            "gas_by_end_use": ("Btu", "therm"),
-        }
+                for fan_type, air_flow in enumerate(fan_type_totals.totals):
+                    other_air_flow_by_fan_type.totals[fan_type] += air_flow
 
-        # Convert baseline model summary values
-        for key in self.baseline_model_summary:
-            if key in units_dict:
-                if isinstance(self.baseline_model_summary[key], dict):
-                    for sub_key in self.baseline_model_summary[key]:
-                        if isinstance(self.baseline_model_summary[key][sub_key], dict):
-                            for sub_sub_key in self.baseline_model_summary[key][sub_key]:
-                                self.baseline_model_summary[key][sub_key][sub_sub_key] = self.convert_unit(
-                                    self.baseline_model_summary[key][sub_key][sub_sub_key],
-                                    units_dict[key][0],
-                                    units_dict[key][1],
-                                )
-                        else:
-                            self.baseline_model_summary[key][sub_key] = self.convert_unit(
-                                self.baseline_model_summary[key][sub_key],
-                                units_dict[key][0],
-                                units_dict[key][1],
-                            )
-                else:
-                    self.baseline_model_summary[key] = self.convert_unit(
-                        self.baseline_model_summary[key],
-                        units_dict[key][0],
-                        units_dict[key][1],
-                    )
-
-        # Convert proposed model summary values
-        for key in self.proposed_model_summary:
-            if key in units_dict:
-                if isinstance(self.proposed_model_summary[key], dict):
-                    for sub_key in self.proposed_model_summary[key]:
-                        if isinstance(self.proposed_model_summary[key][sub_key], dict):
-                            for sub_sub_key in self.proposed_model_summary[key][sub_key]:
-                                self.proposed_model_summary[key][sub_key][sub_sub_key] = self.convert_unit(
-                                    self.proposed_model_summary[key][sub_key][sub_sub_key],
-                                    units_dict[key][0],
-                                    units_dict[key][1],
-                                )
-                        else:
-                            self.proposed_model_summary[key][sub_key] = self.convert_unit(
-                                self.proposed_model_summary[key][sub_key],
-                                units_dict[key][0],
-                                units_dict[key][1],
-                            )
-                else:
-                    self.proposed_model_summary[key] = self.convert_unit(
-                        self.proposed_model_summary[key],
-                        units_dict[key][0],
-                        units_dict[key][1],
-                    )
+        model_summary["total_fan_power_by_fan_type"] = total_fan_power_by_fan_type
+        model_summary["total_air_flow_by_fan_type"] = total_air_flow_by_fan_type
+        model_summary["other_fan_power_by_fan_type"] = other_fan_power_by_fan_type
+        model_summary["other_air_flow_by_fan_type"] = other_air_flow_by_fan_type
 
-        # Convert each end use by fuel type to EUI
-        for end_use in self.baseline_model_summary["elec_by_end_use"]:
-            self.baseline_model_summary["elec_by_end_use_eui"][end_use] = self.baseline_model_summary["elec_by_end_use"][end_use] * 3.412 / self.baseline_model_summary["total_floor_area"]
-        for end_use in self.baseline_model_summary["gas_by_end_use"]:
-            self.baseline_model_summary["gas_by_end_use_eui"][end_use] = self.baseline_model_summary["gas_by_end_use"][end_use] * 100 / self.baseline_model_summary["total_floor_area"]
-        for end_use in self.baseline_model_summary["energy_by_end_use"]:
-            self.baseline_model_summary["energy_by_end_use_eui"][end_use] = self.baseline_model_summary["energy_by_end_use"][end_use] / self.baseline_model_summary["total_floor_area"]
-        for end_use in self.proposed_model_summary["elec_by_end_use"]:
-            self.proposed_model_summary["elec_by_end_use_eui"][end_use] = self.proposed_model_summary["elec_by_end_use"][end_use] * 3.412 / self.proposed_model_summary["total_floor_area"]
-        for end_use in self.proposed_model_summary["gas_by_end_use"]:
-            self.proposed_model_summary["gas_by_end_use_eui"][end_use] = self.proposed_model_summary["gas_by_end_use"][end_use] * 100 / self.proposed_model_summary["total_floor_area"]
-        for end_use in self.proposed_model_summary["energy_by_end_use"]:
-            self.proposed_model_summary["energy_by_end_use_eui"][end_use] = self.proposed_model_summary["energy_by_end_use"][end_use] / self.proposed_model_summary["total_floor_area"]
+    @staticmethod
+    def calculate_model_summary_euis(model_summary):
+        """
+        Calculates the EUIs by end use of a single model summary, as its energy by end use per floor area in the
+        canonical units of eui.
+        """
+        for end_use in model_summary["elec_by_end_use"]:
+            model_summary["elec_by_end_use_eui"][end_use] = model_summary["elec_by_end_use"][end_use] / model_summary["total_floor_area"]
+        for end_use in model_summary["gas_by_end_use"]:
+            model_summary["gas_by_end_use_eui"][end_use] = model_summary["gas_by_end_use"][end_use] / model_summary["total_floor_area"]
+        for end_use in model_summary["energy_by_end_use"]:
+            model_summary["energy_by_end_use_eui"][end_use] = model_summary["energy_by_end_use"][end_use] / model_summary["total_floor_area"]
+
+    def unit_system_output_file_path(self, unit_system):
+        """Returns the path of the HTML file of a unit system, see unit_systems."""
+        if unit_system == self.unit_systems[0]:
+            return self.output_file_path
+        root, extension = os.path.splitext(self.output_file_path)
+        return f"{root}_{unit_system}{extension}"
+
+    def write_html_files(self):
+        """Writes the HTML file of each unit system, from the same model data."""
+        for unit_system in self.unit_systems:
+            write_html_file(self, units.unit_systems[unit_system], self.unit_system_output_file_path(unit_system))
 
     def run(self):
         self.load_files()
         self.extract_evaluation_data()
         self.extract_model_data()
+        self.join_evaluations_to_objects()
         self.perform_analytic_calculations()
-        self.convert_model_data_units()
-        write_html_file(self)
+        self.write_html_files()
+
+
+def summarize_rpd_file(file_path, rmd_types=None, **report_options):
+    """
+    Loads a single RPD file and summarizes the first RMD of each of rmd_types, or of every type when None. Runs in a
+    worker process, so the RMDs themselves are discarded and only the summaries and the remaining top-level members
+    are returned. report_options are passed on to RCTDetailedReport.
+    """
+    report = RCTDetailedReport(None, [file_path], **report_options)
+    if rmd_types is not None:
+        report.summarized_rmd_types = {rmd_type: report.model_type_disp_map[rmd_type] for rmd_type in rmd_types}
+    rpd = report.load_rpd_file(file_path)
+    summaries = {
+        rmd_type: (
+            summary,
+            space_areas,
+            space_space_types,
+            object_index.without_objects(report.summarize_object_attributes) if object_index is not None else None,
+        )
+        for rmd_type, (summary, space_areas, space_space_types, object_index) in report.summarize_rmds(
+            rpd.pop("ruleset_model_descriptions", [])
+        ).items()
+    }
+
+    return {"rpd": rpd, "summaries": summaries}
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class ChainedList(Sequence):
+    """
+    Read-only view of several lists as a single list. The lists are referenced rather than copied.
+    """
+
+    def __init__(self, lists):
+        self.lists = list(lists)
+
+    def __len__(self):
+        return sum(len(items) for items in self.lists)
+
+    def __iter__(self):
+        for items in self.lists:
+            yield from items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        for items in self.lists:
+            if 0 <= index < len(items):
+                return items[index]
+            index -= len(items)
+        raise IndexError("ChainedList index out of range")
+
+    def __repr__(self):
+        return f"ChainedList({self.lists!r})"
+
+
+def value_fingerprint(value):
+    """
+    Returns a compact stand-in for a JSON value that compares equal for equal values, so that nested objects are
+    serialized and hashed once instead of being compared member by member against every other file.
+    """
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    return value
+
+
+class RPDMerge:
+    """
+    Merges the RPDs of a project that were split across several files.
+
+    The ruleset_model_descriptions of all files are chained in file order without copying. Every other top-level
+    member keeps the value of the first file that has it; for objects such as metadata this applies to each of their
+    members. Values that differ from the kept one are not merged but recorded in the conflicts table, each as a dict
+    with the attribute path, and the kept and conflicting values and files.
+    """
+
+    def __init__(self):
+        self.merged_rpd = {}
+        self.rmd_lists = []
+        self.conflicts = []
+        self.sources = {}  # Attribute path -> file that provided the kept value
+        self.fingerprints = {}  # Attribute path -> fingerprint of the kept value, computed on first comparison
+
+    def add(self, rpd, file_path=None):
+        """Merges the next RPD file into the result."""
+        for key, value in rpd.items():
+            if key == "ruleset_model_descriptions":
+                self.rmd_lists.append(value)
+                self.merged_rpd.setdefault(key, None)
+                continue
+
+            if key not in self.merged_rpd:
+                # Objects are copied one level deep so that members merged from later files never alter the input
+                self.merged_rpd[key] = dict(value) if isinstance(value, dict) else value
+                self.sources[key] = file_path
+                continue
+
+            # Lists other than the RMDs keep the first occurrence
+            if isinstance(value, list):
+                continue
+
+            if not isinstance(value, dict):
+                self.compare(key, self.merged_rpd[key], value, file_path)
+                continue
+
+            # Merge objects like metadata and output, or calendar and weather in older versions of the schema
+            merged_object = self.merged_rpd[key]
+            if not isinstance(merged_object, dict):
+                continue  # mismatched types keep the first occurrence
+            for subkey, subvalue in value.items():
+                path = f"{key}.{subkey}"
+                if subkey not in merged_object:
+                    merged_object[subkey] = subvalue
+                    self.sources[path] = file_path
+                else:
+                    self.compare(path, merged_object[subkey], subvalue, file_path)
+
+    def compare(self, path, kept_value, value, file_path):
+        if path not in self.fingerprints:
+            self.fingerprints[path] = value_fingerprint(kept_value)
+        if value_fingerprint(value) == self.fingerprints[path]:
+            return
+
+        kept_file_path = self.sources.get(path, self.sources.get(path.split(".")[0]))
+        logger.warning(
+            "Conflicting value for %s in %s; keeping the value from %s", path, file_path, kept_file_path
+        )
+        self.conflicts.append(
+            {
+                "attribute": path,
+                "kept_value": kept_value,
+                "kept_file_path": kept_file_path,
+                "conflicting_value": value,
+                "conflicting_file_path": file_path,
+            }
+        )
+
+    def result(self):
+        """Returns the merged RPD, with ruleset_model_descriptions as a ChainedList over the files' RMD lists."""
+        merged_rpd = dict(self.merged_rpd)
+        merged_rpd["ruleset_model_descriptions"] = ChainedList(self.rmd_lists)
+        return merged_rpd
@@ -0,0 +1,157 @@
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from rctreportviewer.collectors import RMDCollector
+
+# Lists of objects at the top level of an RMD that are indexed, and their schema object type
+_rmd_object_lists = (
+    ("boilers", "Boiler"),
+    ("chillers", "Chiller"),
+    ("heat_rejections", "HeatRejection"),
+    ("pumps", "Pump"),
+    ("fluid_loops", "FluidLoop"),
+)
+
+
+class IndexedObject(NamedTuple):
+    """An RMD object found by id in an ObjectIndex."""
+
+    object_type: str  # Schema object type, e.g. "Zone" or "HeatingVentilatingAirConditioningSystem"
+    parent_ids: tuple  # Ids of the enclosing objects, from the building down
+    object: dict  # The object itself, or None when the RMD was summarized in another process
+
+
+class ObjectIndex(Mapping):
+    """
+    Index of the objects of an RMD by id: the buildings, building segments, zones, spaces, surfaces, subsurfaces,
+    terminals and HVAC systems, and the boilers, chillers, heat rejections, pumps and fluid loops of the RMD. Reads
+    like a dict of id -> IndexedObject. Ids should be unique within an RMD; when one is repeated the first object
+    found keeps it.
+    """
+
+    def __init__(self):
+        # Id -> (object type, parent ids, object). Plain tuples are stored, as they are faster to build than an
+        # IndexedObject for each object of the RMD.
+        self.objects = {}
+        self.attributes = {}  # Id -> attributes kept by without_objects
+
+    def add(self, object_id, object_type, parent_ids, rmd_object):
+        if object_id is not None and object_id not in self.objects:
+            self.objects[object_id] = (object_type, parent_ids, rmd_object)
+
+    def add_all(self, rmd_objects, object_type, parent_ids):
+        """Adds a list of objects of the same type and parent."""
+        objects = self.objects
+        for rmd_object in rmd_objects:
+            object_id = rmd_object.get("id")
+            if object_id is not None and object_id not in objects:
+                objects[object_id] = (object_type, parent_ids, rmd_object)
+
+    def without_objects(self, summarize_attributes=None):
+        """
+        Returns a copy of the index without the object references, which can be pickled without the RMD.
+
+        Args:
+            summarize_attributes (callable): Called with the object type and object of each indexed object. The
+                attributes it returns are kept in the copy for object_attributes, unless it returns None.
+        """
+        index = ObjectIndex()
+        index.objects = {
+            object_id: (object_type, parent_ids, None)
+            for object_id, (object_type, parent_ids, _) in self.objects.items()
+        }
+        if summarize_attributes is not None:
+            for object_id, (object_type, _, rmd_object) in self.objects.items():
+                attributes = summarize_attributes(object_type, rmd_object)
+                if attributes is not None:
+                    index.attributes[object_id] = attributes
+        return index
+
+    def object_attributes(self, object_id, summarize_attributes):
+        """
+        Returns the attributes of an object summarized by summarize_attributes, or those kept by without_objects once
+        the object itself is gone.
+        """
+        object_type, _, rmd_object = self.objects[object_id]
+        if rmd_object is None:
+            return self.attributes.get(object_id)
+        return summarize_attributes(object_type, rmd_object)
+
+    def __getitem__(self, object_id):
+        return IndexedObject._make(self.objects[object_id])
+
+    def __contains__(self, object_id):
+        return object_id in self.objects
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __repr__(self):
+        return f"ObjectIndex({len(self.objects)} objects)"
+
+
+class ObjectIndexCollector(RMDCollector):
+    """Adds the objects of an RMD to an ObjectIndex during the walk of the RMD."""
+
+    projection = {
+        "boilers": {"id": None},
+        "chillers": {"id": None},
+        "heat_rejections": {"id": None},
+        "pumps": {"id": None},
+        "fluid_loops": {"id": None},
+        "buildings": {
+            "id": None,
+            "building_segments": {
+                "id": None,
+                "zones": {
+                    "id": None,
+                    "spaces": {"id": None},
+                    "surfaces": {"id": None, "subsurfaces": {"id": None}},
+                    "terminals": {"id": None},
+                },
+                "heating_ventilating_air_conditioning_systems": {"id": None},
+            },
+        },
+    }
+
+    def __init__(self, index):
+        self.index = index
+        self.building_ids = ()
+        self.building_segment_ids = ()
+
+    def visit_rmd(self, rmd):
+        for key, object_type in _rmd_object_lists:
+            self.index.add_all(rmd.get(key, []), object_type, ())
+
+    def visit_building(self, building):
+        self.index.add(building.get("id"), "Building", (), building)
+        self.building_ids = (building.get("id"),)
+
+    def visit_building_segment(self, building_segment):
+        self.index.add(building_segment.get("id"), "BuildingSegment", self.building_ids, building_segment)
+        self.building_segment_ids = (*self.building_ids, building_segment.get("id"))
+        self.index.add_all(
+            building_segment.get("heating_ventilating_air_conditioning_systems", []),
+            "HeatingVentilatingAirConditioningSystem",
+            self.building_segment_ids,
+        )
+
+    def visit_zone(self, zone, building_segment):
+        # The objects of the zone are indexed here rather than visited one by one, which keeps the index cheap
+        # enough to build on every summary
+        index = self.index
+        index.add(zone.get("id"), "Zone", self.building_segment_ids, zone)
+        zone_ids = (*self.building_segment_ids, zone.get("id"))
+        index.add_all(zone.get("spaces", []), "Space", zone_ids)
+        surfaces = zone.get("surfaces", [])
+        index.add_all(surfaces, "Surface", zone_ids)
+        for surface in surfaces:
+            if "subsurfaces" in surface:
+                index.add_all(surface["subsurfaces"], "Subsurface", (*zone_ids, surface.get("id")))
+        index.add_all(zone.get("terminals", []), "Terminal", zone_ids)
+
+    def result(self):
+        return self.index
@@ -0,0 +1,125 @@
+import json
+
+# Attributes read by RCTDetailedReport.determine_fan_power
+_fan_projection = {
+    "design_electric_power": None,
+    "shaft_power": None,
+    "motor_efficiency": None,
+    "total_efficiency": None,
+    "design_pressure_rise": None,
+    "design_airflow": None,
+}
+
+# Attributes of an RMD read by the summarize_* methods of RCTDetailedReport. Each key maps to None for a value that is
+# kept as is, or to the projection of the object, or of each object in the array, stored under it. Lists that are
+# only counted (boilers, chillers, heat_rejections) are kept with their objects projected to nothing.
+RMD_PROJECTION = {
+    "type": None,
+    "boilers": {},
+    "chillers": {},
+    "heat_rejections": {},
+    "fluid_loops": {"type": None},
+    "pumps": {
+        "design_electric_power": None,
+        "design_flow": None,
+        "design_head": None,
+        "impeller_efficiency": None,
+        "motor_efficiency": None,
+    },
+    "output": {
+        "output_instance": {
+            "unmet_heating_hours": None,
+            "unmet_cooling_hours": None,
+            "annual_source_results": {
+                "energy_source": None,
+                "annual_consumption": None,
+                "annual_cost": None,
+            },
+            "annual_end_use_results": {
+                "type": None,
+                "energy_source": None,
+                "annual_site_energy_use": None,
+            },
+        },
+    },
+    "buildings": {
+        "building_segments": {
+            "id": None,
+            "zones": {
+                "infiltration": {"flow_rate": None},
+                "zonal_exhaust_fan": _fan_projection,
+                "spaces": {
+                    "id": None,
+                    "floor_area": None,
+                    "lighting_space_type": None,
+                    "number_of_occupants": None,
+                    "interior_lighting": {"power_per_area": None},
+                    "miscellaneous_equipment": {"power": None},
+                },
+                "surfaces": {
+                    "classification": None,
+                    "adjacent_to": None,
+                    "area": None,
+                    "construction": {"u_factor": None},
+                    "subsurfaces": {
+                        "classification": None,
+                        "glazed_area": None,
+                        "u_factor": None,
+                    },
+                },
+                "terminals": {
+                    "minimum_outdoor_airflow": None,
+                    "fan": _fan_projection,
+                },
+            },
+            "heating_ventilating_air_conditioning_systems": {
+                "fan_system": {
+                    "fan_control": None,
+                    "operation_during_occupied": None,
+                    "supply_fans": _fan_projection,
+                    "return_fans": _fan_projection,
+                    "relief_fans": _fan_projection,
+                    "exhaust_fans": _fan_projection,
+                },
+            },
+        },
+    },
+}
+
+
+def projection_keys(projection):
+    """Returns the set of every key named at any level of a projection."""
+    keys = set()
+    for key, child_projection in projection.items():
+        keys.add(key)
+        if child_projection:
+            keys |= projection_keys(child_projection)
+    return keys
+
+
+def merge_projections(*projections):
+    """Returns a projection that keeps every attribute kept by any of projections."""
+    merged = {}
+    for projection in projections:
+        for key, child_projection in projection.items():
+            if key not in merged:
+                merged[key] = child_projection
+            elif merged[key] is None or child_projection is None:
+                merged[key] = None
+            else:
+                merged[key] = merge_projections(merged[key], child_projection)
+    return merged
+
+
+def projecting_decoder(projection=RMD_PROJECTION):
+    """
+    Returns a JSON decoder that drops the members of every object whose key is not named in the projection, as soon as
+    the object is decoded. Keys are matched by name at any level rather than by path, so the result can hold a few
+    more members than the projection describes, but never fewer.
+    """
+    keys = frozenset(projection_keys(projection))
+
+    def project_object(pairs):
+        return {key: value for key, value in pairs if key in keys}
+
+    return json.JSONDecoder(object_pairs_hook=project_object)
@@ -0,0 +1,39 @@
+class RuleStore:
+    """
+    The rules of the detailed evaluation report by rule_id, and their rule ids grouped by section number, e.g. "5" for
+    rule "5-12". When a rule id is repeated the first rule is kept.
+
+    Rules that are streamed are not kept; read_rule is called to re-read one instead.
+    """
+
+    def __init__(self, read_rule=None):
+        self.rules = {}  # rule_id -> rule, unless read_rule is set
+        self.sections = {}  # rule_id -> section number
+        self.rule_ids_by_section = {}  # Section number -> rule ids, in report order
+        self.read_rule = read_rule
+
+    def add(self, rule_id, rule=None):
+        if rule_id in self.sections:
+            return
+        if self.read_rule is None:
+            self.rules[rule_id] = rule
+        section = rule_id.split("-")[0]
+        self.sections[rule_id] = section
+        self.rule_ids_by_section.setdefault(section, []).append(rule_id)
+
+    def section(self, rule_id):
+        """Returns the section number of a rule."""
+        return self.sections[rule_id]
+
+    def __getitem__(self, rule_id):
+        if self.read_rule is not None:
+            if rule_id not in self.sections:
+                raise KeyError(rule_id)
+            return self.read_rule(rule_id)
+        return self.rules[rule_id]
+
+    def __contains__(self, rule_id):
+        return rule_id in self.sections
+
+    def __len__(self):
+        return len(self.sections)
@@ -0,0 +1,287 @@
+import codecs
+import json
+import re
+
+CHUNK_SIZE = 1 << 20
+
+_decoder = json.JSONDecoder()
+# Decodes a value while dropping every object as soon as it is built, to step over values that are not needed
+_skipping_decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+_whitespace = re.compile(r"[ \t\n\r]*")
+_number_continuation = re.compile(r"[0-9.eE+\-]*\Z")
+
+
+class _JSONStreamReader:
+    """
+    Reads JSON values one at a time from a binary file object, keeping only the unparsed tail of the file in memory.
+    """
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.offset_pos = 0  # Position in the buffer up to which the consumed text is counted in buffer_offset
+        self.buffer_offset = 0  # Byte offset of buffer[offset_pos] within the file
+        self.keep_from = None  # Position in the buffer from which the text is kept on fill, see read_raw_value
+        self.eof = False
+        # Containers nested less deeply than this are decoded item by item right away. It grows whenever a container
+        # turns out to be cut off at the end of the buffer, since its siblings are then likely to be as large.
+        self.item_by_item_depth = 0
+
+    def fill(self, min_size=0):
+        """
+        Discards the consumed part of the buffer and appends at least one more chunk of the file.
+        Returns False once the end of the file has been reached.
+        """
+        if self.eof:
+            return False
+
+        self.count_consumed()
+        start = self.pos if self.keep_from is None else self.keep_from
+
+        chunk = self.file.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[start:] + self.text_decoder.decode(chunk, final=self.eof)
+        self.pos -= start
+        self.offset_pos = self.pos
+        if self.keep_from is not None:
+            self.keep_from = 0
+        return True
+
+    def count_consumed(self):
+        """
+        Adds the UTF-8 length of the text consumed since the last count to buffer_offset. Only the newly consumed text
+        is encoded, so counting stays linear in the size of the file however often the offset is read.
+        """
+        consumed = self.buffer[self.offset_pos:self.pos]
+        self.buffer_offset += len(consumed) if consumed.isascii() else len(consumed.encode("utf-8"))
+        self.offset_pos = self.pos
+
+    def tell(self):
+        """Returns the byte offset of the current read position within the file."""
+        self.count_consumed()
+        return self.buffer_offset
+
+    def peek(self):
+        """Skips whitespace and returns the next character without consuming it."""
+        while True:
+            self.pos = _whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise json.JSONDecodeError("Unexpected end of JSON input", self.buffer, self.pos)
+
+    def expect(self, *chars):
+        """Consumes the next non-whitespace character, which must be one of chars."""
+        char = self.peek()
+        if char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting {' or '.join(repr(c) for c in chars)}", self.buffer, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def decode_value(self, decoder=_decoder, depth=0):
+        """Decodes the next complete JSON value, reading more of the file as needed."""
+        if depth < self.item_by_item_depth and self.peek() in "[{":
+            return self.decode_container(decoder, depth)
+        self.peek()
+        # Top up the buffer first so that only values larger than half a chunk can be cut off at its end
+        if len(self.buffer) - self.pos < self.chunk_size // 2:
+            self.fill()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # Most likely the value is cut off at the end of the buffer. Containers are decoded item by item so
+                # that only the item at the end of the buffer has to be decoded again.
+                if self.buffer[self.pos] in "[{":
+                    self.item_by_item_depth = max(self.item_by_item_depth, depth + 1)
+                    return self.decode_container(decoder, depth)
+                # Grow the buffer geometrically so that re-decoding a long scalar stays linear in its size
+                self.fill(min_size=len(self.buffer) - self.pos)
+                continue
+            # A number at the end of the buffer may continue in the next chunk, e.g. "12." followed by "5"
+            if (
+                    isinstance(value, (int, float))
+                    and not self.eof
+                    and _number_continuation.match(self.buffer, end)
+            ):
+                self.fill(min_size=len(self.buffer) - self.pos)
+                continue
+            self.pos = end
+            return value
+
+    def decode_container(self, decoder, depth=0):
+        """Decodes the next JSON array or object one item at a time, with the same result as decoder."""
+        keep = decoder is not _skipping_decoder
+        if self.expect("[", "{") == "[":
+            items = []
+            if self.peek() == "]":
+                self.pos += 1
+                return items if keep else None
+            while True:
+                item = self.decode_value(decoder, depth + 1)
+                if keep:
+                    items.append(item)
+                if self.expect(",", "]") == "]":
+                    return items if keep else None
+
+        pairs = []
+        if self.peek() != "}":
+            while True:
+                key = self.decode_value()
+                self.expect(":")
+                value = self.decode_value(decoder, depth + 1)
+                if keep:
+                    pairs.append((key, value))
+                if self.expect(",", "}") == "}":
+                    break
+        else:
+            self.pos += 1
+
+        if decoder.object_pairs_hook is not None:
+            return decoder.object_pairs_hook(pairs)
+        return dict(pairs)
+
+    def skip_value(self, depth=0):
+        """Consumes the next JSON value without keeping any of the objects in it."""
+        self.decode_value(_skipping_decoder, depth)
+
+    def read_raw_value(self):
+        """Consumes the next JSON value without keeping any of the objects in it, and returns its JSON text."""
+        self.peek()
+        self.keep_from = self.pos
+        try:
+            self.skip_value(depth=1)
+            return self.buffer[self.keep_from:self.pos]
+        finally:
+            self.keep_from = None
+
+    def decode_selected_object(self, key, values, decoder=_decoder):
+        """
+        Decodes the next JSON object member by member with decoder, provided its `key` member is one of values.
+        Otherwise the remaining members are skipped as soon as `key` is read and None is returned. The members before
+        `key` are kept as JSON text until then, and only decoded if the object is selected.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return None
+
+        data = {}
+        raw_members = []  # (key, JSON text) of the members before `key`
+        selected = None  # Whether the object is selected, once its `key` member has been read
+        while True:
+            member_key = self.decode_value()
+            self.expect(":")
+            if selected is None and member_key == key:
+                value = self.decode_value(decoder, depth=1)
+                selected = value in values
+                if selected:
+                    for raw_key, text in raw_members:
+                        data[raw_key] = decoder.raw_decode(text)[0]
+                    data[member_key] = value
+                raw_members = None
+            elif selected is None:
+                raw_members.append((member_key, self.read_raw_value()))
+            elif selected:
+                data[member_key] = self.decode_value(decoder, depth=1)
+            else:
+                self.skip_value(depth=1)
+            if self.expect(",", "}") == "}":
+                break
+
+        if not selected:
+            return None
+        if decoder.object_pairs_hook is not None:
+            return decoder.object_pairs_hook(list(data.items()))
+        return data
+
+
+def iter_json_array(file, array_key, header=None, select=None, decoder=_decoder):
+    """
+    Iterates over the items of one array member of a top-level JSON object without loading the whole document.
+
+    Args:
+        file: A binary file object positioned at the start of the JSON document.
+        array_key (str): Key of the top-level member whose array items are yielded one at a time.
+        header (dict): Optional dict that receives every other top-level member as it is decoded.
+        select (tuple): Optional (key, values) pair. Only object items whose `key` member is one of values are
+            decoded and yielded; the rest are skipped while parsing. The members that come before `key` in an item
+            are scanned without being decoded and kept as JSON text, which is decoded only if the item is selected.
+        decoder (json.JSONDecoder): Decoder for the array items, e.g. one with an object_pairs_hook. The header
+            members are always decoded as plain JSON.
+
+    Yields:
+        tuple: (item, offset, length) where offset and length locate the item's JSON text in the file in bytes.
+    """
+    if header is None:
+        header = {}
+    reader = _JSONStreamReader(file)
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode_value()
+        reader.expect(":")
+        if key == array_key:
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    reader.peek()
+                    offset = reader.tell()
+                    if select is None:
+                        item = reader.decode_value(decoder)
+                    else:
+                        item = reader.decode_selected_object(*select, decoder)
+                    if item is not None:
+                        yield item, offset, reader.tell() - offset
+                    if reader.expect(",", "]") == "]":
+                        break
+        else:
+            header[key] = reader.decode_value()
+
+        if reader.expect(",", "}") == "}":
+            break
+
+
+class TeeReader:
+    """
+    Wraps a binary file object and copies everything read from it to a second, writable file object.
+    """
+
+    def __init__(self, file, copy):
+        self.file = file
+        self.copy = copy
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        self.copy.write(data)
+        return data
+
+
+def read_json_range(source, offset, length):
+    """
+    Decodes a single JSON value located at a known byte range of a file, as reported by iter_json_array.
+
+    Args:
+        source: Path to the file, or a seekable binary file object.
+        offset (int): Byte offset of the value.
+        length (int): Length of the value in bytes.
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            return read_json_range(file, offset, length)
+
+    source.seek(offset)
+    return json.loads(source.read(length))
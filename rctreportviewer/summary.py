@@ -0,0 +1,320 @@
+from collections.abc import Mapping, MutableMapping
+
+# Fan types, in the order of the fan summary tables, and their indexes in FanTypeTotals
+FAN_TYPES = ("Supply", "Return/Relief", "Exhaust", "Zonal Exhaust", "Terminal Unit")
+SUPPLY = 0
+RETURN_RELIEF = 1
+EXHAUST = 2
+ZONAL_EXHAUST = 3
+TERMINAL_UNIT = 4
+_fan_type_indexes = {fan_type: index for index, fan_type in enumerate(FAN_TYPES)}
+
+
+class CategoryIndex:
+    """
+    Assigns integer codes to the names of a category, such as building segment ids or lighting space types, in order
+    of first appearance. The Totals of a summary that share a category share its index, so a name is hashed once per
+    object summarized rather than once per total updated.
+    """
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self):
+        self.codes = {}
+        self.names = []
+
+    def code(self, name):
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def __len__(self):
+        return len(self.names)
+
+
+class Totals(MutableMapping):
+    """
+    Totals by the names of a category, stored in a list indexed by their CategoryIndex codes. Reads like a dict of
+    name -> total, with the names in the order they were first added to these totals.
+    """
+
+    __slots__ = ("index", "totals", "last_code", "order")
+
+    def __init__(self, index):
+        self.index = index
+        self.totals = ()  # Total by code, None for codes that were never added. A list once a total is added.
+        self.last_code = -1  # Highest code added
+        # Codes in order of first addition. Only kept once a code is added after a higher one; until then the order
+        # is that of the codes.
+        self.order = None
+
+    def add(self, code, value):
+        """Adds value to the total of a category code."""
+        totals = self.totals
+        if code >= len(totals):
+            totals = self.totals = [*totals, *[None] * (len(self.index) - len(totals))]
+        total = totals[code]
+        if total is None:
+            self.add_code(code)
+            # Starts from 0 like dict.get(name, 0) + value, so that integers and floats total the same way
+            totals[code] = 0 + value
+        else:
+            totals[code] = total + value
+
+    def add_code(self, code):
+        if code > self.last_code and self.order is None:
+            self.last_code = code
+            return
+        if self.order is None:
+            self.order = self.codes()
+        self.order.append(code)
+
+    def codes(self):
+        """Returns the codes that have a total, in order of first addition."""
+        if self.order is not None:
+            return list(self.order)
+        return [code for code, total in enumerate(self.totals) if total is not None]
+
+    def __getitem__(self, name):
+        code = self.index.codes.get(name)
+        if code is None or code >= len(self.totals) or self.totals[code] is None:
+            raise KeyError(name)
+        return self.totals[code]
+
+    def __setitem__(self, name, value):
+        code = self.index.code(name)
+        totals = self.totals
+        if code >= len(totals):
+            totals = self.totals = [*totals, *[None] * (len(self.index) - len(totals))]
+        if totals[code] is None:
+            self.add_code(code)
+        totals[code] = value
+
+    def __delitem__(self, name):
+        code = self.index.codes.get(name)
+        if code is None or code >= len(self.totals) or self.totals[code] is None:
+            raise KeyError(name)
+        self.order = self.codes()
+        self.order.remove(code)
+        self.totals[code] = None
+
+    def __contains__(self, name):
+        code = self.index.codes.get(name)
+        return code is not None and code < len(self.totals) and self.totals[code] is not None
+
+    def __iter__(self):
+        names = self.index.names
+        return (names[code] for code in self.codes())
+
+    def __len__(self):
+        if self.order is not None:
+            return len(self.order)
+        return len(self.totals) - self.totals.count(None)
+
+    def __repr__(self):
+        return f"Totals({dict(self)!r})"
+
+
+class FanTypeTotals(MutableMapping):
+    """
+    Totals for each of FAN_TYPES, stored in a list indexed by fan type. Reads like a dict of fan type -> total.
+    """
+
+    __slots__ = ("totals",)
+
+    def __init__(self):
+        self.totals = [0] * len(FAN_TYPES)
+
+    def __getitem__(self, fan_type):
+        return self.totals[_fan_type_indexes[fan_type]]
+
+    def __setitem__(self, fan_type, value):
+        self.totals[_fan_type_indexes[fan_type]] = value
+
+    def __delitem__(self, fan_type):
+        raise TypeError("The fan types of FanTypeTotals are fixed")
+
+    def __contains__(self, fan_type):
+        return fan_type in _fan_type_indexes
+
+    def __iter__(self):
+        return iter(FAN_TYPES)
+
+    def __len__(self):
+        return len(FAN_TYPES)
+
+    def __repr__(self):
+        return f"FanTypeTotals({dict(self)!r})"
+
+
+class ModelSummary(Mapping):
+    """
+    Summary of a single RMD, as built by RCTDetailedReport.summarize_rmd_data. The values are slots rather than dict
+    members, and totals by building segment, space type and fan type are array-backed Totals and FanTypeTotals.
+
+    The summary can still be read and updated like a dict by attribute name, e.g. summary["total_floor_area"], which
+    is how the report and the unit conversion access it.
+    """
+
+    fields = (
+        "rmd_type",
+        "building_count",
+        "building_segment_count",
+        "zone_count",
+        "space_count",
+        "system_count",
+        "boiler_count",
+        "chiller_count",
+        "heat_rejection_count",
+        "pump_count",
+        "fluid_loop_types",
+        "overall_wall_ua_by_building_segment",
+        "overall_wall_u_factor_by_building_segment",
+        "overall_roof_ua_by_building_segment",
+        "overall_roof_u_factor_by_building_segment",
+        "overall_window_ua_by_building_segment",
+        "overall_window_u_factor_by_building_segment",
+        "overall_skylight_ua_by_building_segment",
+        "overall_skylight_u_factor_by_building_segment",
+        "total_floor_area_by_building_segment",
+        "total_wall_area_by_building_segment",
+        "total_roof_area_by_building_segment",
+        "total_window_area_by_building_segment",
+        "total_skylight_area_by_building_segment",
+        "total_floor_area_by_space_type",
+        "total_occupants_by_space_type",
+        "total_lighting_power_by_space_type",
+        "total_miscellaneous_equipment_power_by_space_type",
+        "average_occupancy_by_space_type",
+        "average_lighting_power_by_space_type",
+        "average_miscellaneous_equipment_power_by_space_type",
+        "total_fan_power_by_fan_control_by_fan_type",
+        "total_air_flow_by_fan_control_by_fan_type",
+        "other_fan_power_by_fan_type",
+        "other_air_flow_by_fan_type",
+        "total_fan_power_by_fan_type",
+        "total_air_flow_by_fan_type",
+        "fan_powers_by_fan_type",
+        "pump_powers",
+        "energy_by_fuel_type",
+        "cost_by_fuel_type",
+        "energy_by_end_use",
+        "elec_by_end_use",
+        "gas_by_end_use",
+        "energy_by_end_use_eui",
+        "elec_by_end_use_eui",
+        "gas_by_end_use_eui",
+        "total_floor_area",
+        "total_exterior_wall_area",
+        "total_roof_area",
+        "total_window_area",
+        "total_skylight_area",
+        "total_occupants",
+        "total_lighting_power",
+        "total_equipment_power",
+        "total_pump_power",
+        "total_fan_power",
+        "total_zone_minimum_oa_flow",
+        "total_infiltration",
+        "unmet_heating_hours",
+        "unmet_cooling_hours",
+        "total_energy",
+        "total_cost",
+        "collected_metrics",
+    )
+    _field_set = frozenset(fields)
+    __slots__ = fields + ("building_segment_index", "space_type_index")
+
+    def __init__(self, rmd_type):
+        self.building_segment_index = CategoryIndex()
+        self.space_type_index = CategoryIndex()
+
+        self.rmd_type = rmd_type
+        self.building_count = 0
+        self.building_segment_count = 0
+        self.zone_count = 0
+        self.space_count = 0
+        self.system_count = 0
+        self.boiler_count = 0
+        self.chiller_count = 0
+        self.heat_rejection_count = 0
+        self.pump_count = 0
+        self.fluid_loop_types = set()
+
+        for field in self.fields:
+            if field.endswith("_by_building_segment"):
+                setattr(self, field, Totals(self.building_segment_index))
+            elif field.endswith("_by_space_type"):
+                setattr(self, field, Totals(self.space_type_index))
+            elif field.endswith("_by_fan_type") and "_by_fan_control_" not in field:
+                setattr(self, field, FanTypeTotals())
+
+        # Fan type -> power of each fan whose power could be determined, and the same for pumps, for distributions
+        self.fan_powers_by_fan_type = {fan_type: [] for fan_type in FAN_TYPES}
+        self.pump_powers = []
+
+        # Fan control -> FanTypeTotals
+        self.total_fan_power_by_fan_control_by_fan_type = {}
+        self.total_air_flow_by_fan_control_by_fan_type = {}
+
+        self.energy_by_fuel_type = {}
+        self.cost_by_fuel_type = {}
+        self.energy_by_end_use = {}
+        self.elec_by_end_use = {}
+        self.gas_by_end_use = {}
+        self.energy_by_end_use_eui = {}
+        self.elec_by_end_use_eui = {}
+        self.gas_by_end_use_eui = {}
+
+        self.total_floor_area = 0
+        self.total_exterior_wall_area = 0
+        self.total_roof_area = 0
+        self.total_window_area = 0
+        self.total_skylight_area = 0
+        self.total_occupants = 0
+        self.total_lighting_power = 0
+        self.total_equipment_power = 0
+        self.total_pump_power = 0
+        self.total_fan_power = 0
+        self.total_zone_minimum_oa_flow = 0
+        self.total_infiltration = 0
+        self.unmet_heating_hours = 0
+        self.unmet_cooling_hours = 0
+        self.total_energy = 0
+        self.total_cost = 0
+        self.collected_metrics = {}  # Collector name -> result of the RMDCollectors of the report
+
+    def fan_power_by_fan_type(self, fan_control):
+        """Returns the fan power totals of a fan control, adding zero totals for a new one."""
+        fan_type_totals = self.total_fan_power_by_fan_control_by_fan_type.get(fan_control)
+        if fan_type_totals is None:
+            fan_type_totals = self.total_fan_power_by_fan_control_by_fan_type[fan_control] = FanTypeTotals()
+        return fan_type_totals
+
+    def air_flow_by_fan_type(self, fan_control):
+        """Returns the air flow totals of a fan control, adding zero totals for a new one."""
+        fan_type_totals = self.total_air_flow_by_fan_control_by_fan_type.get(fan_control)
+        if fan_type_totals is None:
+            fan_type_totals = self.total_air_flow_by_fan_control_by_fan_type[fan_control] = FanTypeTotals()
+        return fan_type_totals
+
+    def __getitem__(self, field):
+        if field not in self._field_set:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in self._field_set:
+            raise KeyError(field)
+        setattr(self, field, value)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f"ModelSummary({self.rmd_type!r})"
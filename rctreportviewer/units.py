@@ -0,0 +1,268 @@
+import os
+from collections.abc import Mapping
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+path_to_ureg = os.path.join(
+    os.path.dirname(__file__),
+    "unit_registry.txt",
+)
+# Folder in which pint caches the parsed definitions of unit_registry.txt, keyed by a hash of its content. ":auto:" is
+# pint's folder in the user cache directory; None parses the definitions every time the registry is built.
+ureg_cache_folder = ":auto:"
+
+_ureg = None
+
+
+class UnitSystem(NamedTuple):
+    """Units that the quantities of the report are displayed in, such as "area" or "air_flow"."""
+
+    name: str
+    units: dict  # Quantity -> pint unit its values are converted to from their canonical unit
+    labels: dict  # Quantity -> HTML label of its unit. Also labels units derived from others, e.g. fan_efficacy
+
+
+# Unit that the report keeps the values of each quantity in, which are those of the RMDs. The values are converted to
+# a unit system only when they are displayed.
+canonical_units = {
+    "area": "m2",
+    "power_density": "W / m2",
+    "air_flow": "L / s",
+    "ua": "W / K",
+    "u_factor": "W / m2 / K",
+    "energy": "Btu",
+    "electricity": "Btu",
+    "gas": "Btu",
+    "eui": "Btu / m2",
+}
+
+unit_systems = {
+    "IP": UnitSystem(
+        name="IP",
+        units={
+            "area": "ft2",
+            "power_density": "W / ft2",
+            "air_flow": "cfm",
+            "ua": "Btu / h / degR",
+            "u_factor": "Btu / h / ft2 / degR",
+            "energy": "kBtu",
+            "electricity": "kWh",
+            "gas": "therm",
+            "eui": "kBtu / ft2",
+        },
+        labels={
+            "area": "ft<sup>2</sup>",
+            "power_density": "W/ft<sup>2</sup>",
+            "occupancy_density": "ft<sup>2</sup>/person",
+            "air_flow": "CFM",
+            "fan_efficacy": "W/CFM",
+            "power": "W",
+            "energy": "kBtu",
+            "electricity": "kWh",
+            "gas": "Therms",
+            "eui": "kBtu/ft²",
+        },
+    ),
+    "SI": UnitSystem(
+        name="SI",
+        units={
+            "area": "m2",
+            "power_density": "W / m2",
+            "air_flow": "L / s",
+            "ua": "W / K",
+            "u_factor": "W / m2 / K",
+            "energy": "kWh",
+            "electricity": "kWh",
+            "gas": "kWh",
+            "eui": "kWh / m2",
+        },
+        labels={
+            "area": "m<sup>2</sup>",
+            "power_density": "W/m<sup>2</sup>",
+            "occupancy_density": "m<sup>2</sup>/person",
+            "air_flow": "L/s",
+            "fan_efficacy": "W/(L/s)",
+            "power": "W",
+            "energy": "kWh",
+            "electricity": "kWh",
+            "gas": "kWh",
+            "eui": "kWh/m²",
+        },
+    ),
+}
+
+
+def get_unit_registry():
+    """
+    Returns the pint unit registry of unit_registry.txt. It is built on first use rather than on import, so pint is
+    only imported once a value is converted, and its definitions are read from the pint disk cache when unchanged.
+    """
+    global _ureg
+    if _ureg is None:
+        import pint
+
+        try:
+            _ureg = pint.UnitRegistry(
+                path_to_ureg, autoconvert_offset_to_baseunit=True, cache_folder=ureg_cache_folder
+            )
+        except OSError:
+            # An unusable cache folder only costs the parse
+            _ureg = pint.UnitRegistry(path_to_ureg, autoconvert_offset_to_baseunit=True)
+    return _ureg
+
+
+def __getattr__(name):
+    # The registry is still available as units.ureg, built when first read
+    if name == "ureg":
+        return get_unit_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class UnitConversions:
+    """
+    Converts values between units of a pint unit registry. Each (from_unit, to_unit) pair is resolved through the
+    registry once, into the scale and offset of the conversion, and values are then converted with float arithmetic
+    instead of a pint Quantity per value.
+
+    A pair whose conversion through the registry is not of the form value * scale + offset is converted by pint for
+    every value.
+    """
+
+    def __init__(self, registry=None):
+        self._registry = registry  # The registry of get_unit_registry unless given, built when first needed
+        self.factors = {}  # (from_unit, to_unit) -> (scale, offset), or None if converted by pint
+
+    @property
+    def registry(self):
+        if self._registry is None:
+            self._registry = get_unit_registry()
+        return self._registry
+
+    def convert_with_registry(self, value, from_unit, to_unit):
+        """Converts a value through the unit registry, as the source of truth for the factors."""
+        quantity = value * self.registry[from_unit]
+        return quantity.to(self.registry[to_unit]).magnitude
+
+    def factor(self, from_unit, to_unit):
+        """Returns the (scale, offset) of the conversion from from_unit to to_unit, or None if it is not linear."""
+        key = (from_unit, to_unit)
+        if key not in self.factors:
+            offset = float(self.convert_with_registry(0.0, from_unit, to_unit))
+            scale = float(self.convert_with_registry(1.0, from_unit, to_unit)) - offset
+            check = float(self.convert_with_registry(1000.0, from_unit, to_unit))
+            linear = abs(1000.0 * scale + offset - check) <= 1e-9 * max(abs(check), 1.0)
+            self.factors[key] = (scale, offset) if linear else None
+        return self.factors[key]
+
+    def convert(self, value, from_unit, to_unit):
+        """Convert a numerical value from one unit to another and return the magnitude."""
+        factor = self.factors.get((from_unit, to_unit)) or self.factor(from_unit, to_unit)
+        if factor is None:
+            return self.convert_with_registry(value, from_unit, to_unit)
+        scale, offset = factor
+        return value * scale + offset
+
+    def convert_values(self, values, from_unit, to_unit):
+        """
+        Converts values that share a pair of units in one operation: a numpy array is returned for a numpy array, and
+        a list for any other sequence of numbers. Sequences are converted as numpy arrays when numpy is installed.
+        """
+        factor = self.factor(from_unit, to_unit)
+        is_array = np is not None and isinstance(values, np.ndarray)
+        if factor is None:
+            if is_array:
+                return self.convert_with_registry(values, from_unit, to_unit)
+            return [self.convert_with_registry(value, from_unit, to_unit) for value in values]
+        scale, offset = factor
+        if is_array:
+            return values * scale + offset
+        if np is not None:
+            return (np.asarray(values, dtype=np.float64) * scale + offset).tolist()
+        return [value * scale + offset for value in values]
+
+    def convert_mappings(self, mappings, units):
+        """
+        Converts values of any number of mappings in place, such as model summaries. The values of each pair of units
+        are gathered from all the mappings and converted with one convert_values, so the cost is per pair of units
+        rather than per mapping or value.
+
+        Args:
+            mappings (iterable): Mappings that support item assignment.
+            units (dict): Key -> (from_unit, to_unit) of the values to convert. The value of a key is a number, or a
+                mapping whose numbers are converted, at any depth.
+        """
+        leaves_by_units = {}  # (from_unit, to_unit) -> ([(container, key)], [value])
+        for mapping in mappings:
+            for key, unit_pair in units.items():
+                if key in mapping:
+                    containers, values = leaves_by_units.setdefault(unit_pair, ([], []))
+                    _gather_leaves(mapping, key, containers, values)
+        for (from_unit, to_unit), (containers, values) in leaves_by_units.items():
+            if from_unit == to_unit:
+                continue
+            for (container, key), value in zip(containers, self.convert_values(values, from_unit, to_unit)):
+                container[key] = value
+
+    def views(self, mappings, quantities, unit_system):
+        """
+        Returns a UnitView of each of the mappings in a unit system, with the values of all the mappings converted in
+        one convert_mappings.
+
+        Args:
+            mappings (iterable): Mappings whose values are in their canonical_units, such as model summaries.
+            quantities (dict): Key -> quantity of the values to convert, e.g. {"total_floor_area": "area"}.
+            unit_system (UnitSystem): The unit system to view the values in.
+        """
+        mappings = list(mappings)
+        converted = [{key: _copy(mapping[key]) for key in quantities if key in mapping} for mapping in mappings]
+        self.convert_mappings(
+            converted,
+            {key: (canonical_units[quantity], unit_system.units[quantity]) for key, quantity in quantities.items()},
+        )
+        return [UnitView(mapping, values) for mapping, values in zip(mappings, converted)]
+
+
+class UnitView(Mapping):
+    """
+    Read-only view of a mapping, such as a model summary, in a unit system. The converted values are copies held by
+    the view, with nested mappings copied to dicts; the mapping itself keeps its canonical values. Other values read
+    through to the mapping.
+    """
+
+    def __init__(self, mapping, converted):
+        self.mapping = mapping
+        self.converted = converted  # Key -> converted value
+
+    def __getitem__(self, key):
+        if key in self.converted:
+            return self.converted[key]
+        return self.mapping[key]
+
+    def __iter__(self):
+        return iter(self.mapping)
+
+    def __len__(self):
+        return len(self.mapping)
+
+
+def _copy(value):
+    if isinstance(value, Mapping):
+        return {key: _copy(item) for key, item in value.items()}
+    return value
+
+
+def _gather_leaves(container, key, containers, values):
+    value = container[key]
+    if isinstance(value, Mapping):
+        for sub_key in value:
+            _gather_leaves(value, sub_key, containers, values)
+    else:
+        containers.append((container, key))
+        values.append(value)
+
+
+unit_conversions = UnitConversions()
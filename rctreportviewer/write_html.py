@@ -1,37 +1,293 @@
+import html
 import math
+import os
+
+from rctreportviewer.units import unit_conversions, unit_systems
+
+# Label, unit quantity and rounding of the attributes shown in the drill-down of evaluations by model object. The unit
+# is labeled in the unit system of the report. Attributes without a rounding are text.
+drilldown_attribute_formats = {
+    "floor_area": ("Area", "area", 0),
+    "lighting_power_density": ("Lighting Power Density", "power_density", 2),
+    "number_of_occupants": ("Occupants", None, 0),
+    "lighting_space_type": ("Space Type", None, None),
+    "fan_control": ("Fan Control", None, None),
+    "fan_power": ("Fan Power", "power", 0),
+    "supply_air_flow": ("Supply Air Flow", "air_flow", 0),
+}
+
+drilldown_object_type_names = {
+    "Zone": "Zone",
+    "Space": "Space",
+    "HeatingVentilatingAirConditioningSystem": "HVAC System",
+}
+
+
+def format_drilldown_attributes(attributes, unit_system):
+    """Returns the HTML lines of the drill-down attributes of a model object, with their units in unit_system."""
+    lines = []
+    for key, (label, quantity, digits) in drilldown_attribute_formats.items():
+        if key not in attributes:
+            continue
+        if digits is None:
+            value = html.escape(str(attributes[key]).replace("_", " ").title())
+        elif digits:
+            value = f"{round(attributes[key], digits):,}"
+        else:
+            value = f"{round(attributes[key]):,}"
+        lines.append(f"{label}: {value} {unit_system.labels.get(quantity, '')}".rstrip())
+    return "<br>".join(lines)
+
+
+def write_object_drilldowns(file, rct_detailed_report, unit_system):
+    """
+    Writes the rule evaluations joined to the zones, spaces and HVAC systems of the models, with the key attributes of
+    each object written once for all the rules evaluated for it, in unit_system.
+    """
+    drilldowns = rct_detailed_report.object_drilldowns
+    object_types = rct_detailed_report.drilldown_object_types
+    outcomes = ("Failing", "Undetermined", "Passing", "N/A")
+
+    # The attributes of all the objects are viewed in the unit system together
+    model_attributes = [
+        (data_group_id, model_type, attributes)
+        for data_group_id, drilldown in drilldowns.items()
+        for model_type, attributes in drilldown["attributes_by_model"].items()
+    ]
+    attribute_views = unit_conversions.views(
+        [attributes for _, _, attributes in model_attributes],
+        rct_detailed_report.drilldown_attribute_quantities,
+        unit_system,
+    )
+    attributes_by_model_by_id = {}
+    for (data_group_id, model_type, _), attributes in zip(model_attributes, attribute_views):
+        attributes_by_model_by_id.setdefault(data_group_id, {})[model_type] = attributes
+
+    file.write(
+        f"""
+                <div class="mb-3 me-4">
+                    <button class="btn btn-info collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapse-object-drilldown" aria-expanded="false">
+                        Evaluations by Model Object ({len(drilldowns)})
+                    </button>
+
+                    <div id="collapse-object-drilldown" class="accordion-collapse collapse">
+                        <div class="accordion-body">
+                            <table class="table table-sm table-borderless" style="width: 1400px;">
+                                <thead>
+                                    <tr style="border-bottom: 2px solid black;"><th>Object</th><th>Type</th><th>Location</th><th>Baseline</th><th>Proposed</th>{"".join(f"<th>{outcome}</th>" for outcome in outcomes)}</tr>
+                                </thead>
+                                <tbody>
+        """
+    )
+    for data_group_id, drilldown in sorted(
+            drilldowns.items(), key=lambda item: object_types.index(item[1]["object_type"])
+    ):
+        attributes_by_model = attributes_by_model_by_id.get(data_group_id, {})
+        rule_ids_by_outcome = drilldown["rule_ids_by_outcome"]
+        file.write(
+            f"""
+                                    <tr style="font-size: 12px; border-top: 1px solid #ccc;" class="lh-1"><td>{html.escape(str(data_group_id))}</td><td>{drilldown_object_type_names[drilldown["object_type"]]}</td><td>{html.escape(" / ".join(map(str, drilldown["parent_ids"])))}</td><td>{format_drilldown_attributes(attributes_by_model.get("Baseline", {}), unit_system)}</td><td>{format_drilldown_attributes(attributes_by_model.get("Proposed", {}), unit_system)}</td>{"".join(f"<td>{', '.join(rule_ids_by_outcome.get(outcome, []))}</td>" for outcome in outcomes)}</tr>
+            """
+        )
+    file.write(
+        """
+                                </tbody>
+                            </table>
+                        </div>
+                    </div>
+                </div>
+        """
+    )
+
+
+section_titles_with_colors = {
+    1: ("Design Model and Compliance Calculations", "#D8BFD8"),
+    2: ("Additions and Alterations", "#66b3ff"),
+    3: ("Space Use Classification", "#99ff99"),
+    4: ("Schedules", "#ffcc99"),
+    5: ("Envelope", "#f4a460"),
+    6: ("Lighting", "#ffd700"),
+    7: ("Thermal Blocks - HVAC Zones Designed", "#c2f0c2"),
+    8: ("Thermal Blocks - HVAC Zones Not Designed", "#f0c2c2"),
+    9: ("Thermal Blocks - Multifamily Residential Buildings", "#f0e68c"),
+    10: ("HVAC Systems", "#4682b4"),
+    11: ("Service Water Heating Systems", "#E97451"),
+    12: ("Receptacles and Other Loads", "#d3d3d3"),
+    13: ("Modeling Limitations to the Simulation Program", "#f4cccc"),
+    14: ("Exterior Conditions", "#87ceeb"),
+    15: ("Distribution Transformers", "#d9ead3"),
+    16: ("Elevators", "#c0c0c0"),
+    17: ("Refrigeration", "#5f9ea0"),
+    18: ("Baseline HVAC Selection", "#ead1dc"),
+    19: ("General Baseline HVAC System Requirements", "#778899"),
+    20: ("System-Specific Baseline HVAC System Requirements", "#ffdab9"),
+    21: ("Baseline HVAC - Water Side Requirements: Hot Water", "#ff6347"),
+    22: ("Baseline HVAC - Water Side Requirements: Chilled Water", "#6495ED"),
+    23: ("Baseline HVAC - Air Side Requirements", "#F0FFFF"),
+}
+
+# Style of the list item of a rule evaluation by its outcome, and of the evaluations with any other outcome
+evaluation_styles = {
+    "FAILED": "background-color: #ffcccc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ff0000;",
+    "PASS": "background-color: #ccffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #008000;",
+    "UNDETERMINED": "background-color: #ffffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ffcc00;",
+}
+default_evaluation_style = "padding-left: 10px; border: 2px solid #ccc; border-radius: 8px;"
+
+# Order in which the evaluations of a rule are listed by outcome, with any other outcome listed last
+outcome_order = {
+    "FAILED": 0,
+    "UNDETERMINED": 1,
+    "PASS": 2,
+    "NOT_APPLICABLE": 3,
+}
+
+calculated_values_header = """
+                                    <li><strong>Calculated Values:</strong>
+                                        <table class="mb-2 me-2 table table-sm table-bordered">
+                                            <thead>
+                                                <tr><th>Variable</th><th>Value</th>
+                                """
+
+# Size of the buffer of the HTML file. The rules are rendered into one string each, which are written to the file in
+# chunks of this size.
+output_buffer_size = 1 << 20
+
+
+def evaluation_sort_key(evaluation):
+    """Returns the key that the evaluations of a rule are listed by, see outcome_order."""
+    return outcome_order.get(evaluation["outcome"], 3)
+
+
+def render_evaluation(evaluation, message_table):
+    """Returns the HTML list item of a rule evaluation, with its messages and calculated values."""
+    outcome = evaluation["outcome"]
+    chunks = [
+        f"""
+                                <li style="{evaluation_styles.get(outcome, default_evaluation_style)}"  class="p-2 m-1">{evaluation['data_group_id']}
+                                    <ul>
+                                        <li><strong>Outcome:</strong> {outcome}</li>
+                                """
+    ]
+    if evaluation["messages"]:
+        chunks.append(f"<li><strong>Messages:</strong> {message_table.text(evaluation['messages'])}</li>")
+    calculated_values = evaluation["calculated_values"]
+    if calculated_values:
+        has_any_units = any(calculated_value.get("unit") for calculated_value in calculated_values)
+        chunks.append(calculated_values_header)
+        chunks.append("<th>Unit</th></tr></thead><tbody>" if has_any_units else "</tr></thead><tbody>")
+        empty_unit_cell = "<td></td>" if has_any_units else ""
+        for calculated_value in calculated_values:
+            value = calculated_value["value"]
+            unit = calculated_value.get("unit")
+            chunks.append(
+                f"""
+                                    <tr>
+                                    <td>{calculated_value['variable']}</td>
+                                    <td>{value[0] if len(value) == 1 else value}
+                                    </td>
+                                    {f"<td>{unit}</td>" if unit else empty_unit_cell}</tr>"""
+            )
+        chunks.append("</tbody></table></li>")
+    chunks.append("</ul></li>")
+    return "".join(chunks)
+
+
+def render_rule(rule_id, rule_data, outcome_counts, message_table):
+    """Returns the HTML table rows of a rule and its evaluations, listed by outcome."""
+    description = rule_data.get("description", "N/A")
+    standard_section = rule_data.get("standard_section", "N/A")
+    outcome_summary = " | ".join([f"{k}: {v}" for k, v in outcome_counts[rule_id].items()])
+    chunks = [
+        f"""
+                            <tr>
+                                <td class="rule-id" rowspan='2'>{rule_id}</td>
+                                <td>{description}</td>
+                                <td>{standard_section}</td>
+                                <td class="outcome-summary">{outcome_summary}</td>
+                            </tr>
+                            <tr>
+                                <td colspan='3'>
+                                    <button class="btn btn-primary" type="button" data-bs-toggle="collapse" data-bs-target="#eval_{rule_id}">
+                                        View Evaluations
+                                    </button>
+                                    <div class="collapse" id="eval_{rule_id}">
+                                        <ul>
+                        """
+    ]
+    for evaluation in sorted(rule_data["evaluations"], key=evaluation_sort_key):
+        chunks.append(render_evaluation(evaluation, message_table))
+    chunks.append("</ul></div></td></tr>")
+    return "".join(chunks)
 
 
-def write_html_file(rct_detailed_report):
+def write_rule_rows(file, rct_detailed_report, rule_ids, section_title_cell="td"):
+    """
+    Writes the table rows of rules and their evaluations, listed by outcome. The rules are grouped by section, in the
+    order of the rule_ids_by_section of the rule store, with a title row before each section. Each rule is rendered
+    into one string, so the file is written once per rule.
+
+    Args:
+        file (file): The HTML file.
+        rct_detailed_report (RCTDetailedReport): The report of the rules.
+        rule_ids (iterable): Ids of the rules to write.
+        section_title_cell (str): HTML tag of the cell of the section titles, "td" or "th".
+    """
+    message_table = rct_detailed_report.message_table  # Builds the text of each distinct messages value once
+    outcome_counts = rct_detailed_report.rule_evaluation_outcome_counts
+    rule_ids = set(rule_ids)
+    for section, section_rule_ids in rct_detailed_report.rule_store.rule_ids_by_section.items():
+        section_rule_ids = [rule_id for rule_id in section_rule_ids if rule_id in rule_ids]
+        if not section_rule_ids:
+            continue
+        section_title, section_color = section_titles_with_colors.get(int(section))
+        file.write(
+            f"""
+                            </tbody>
+                                <thead class="table-group-divider">
+                                    <tr>
+                                        <{section_title_cell} colspan="4" class="section-title sticky-top sticky-top-2" style="background-color: {section_color} !important;">{section_title}</{section_title_cell}>
+                                    </tr>
+                                </thead>
+                            <tbody>
+                            """
+        )
+        for rule_id in section_rule_ids:
+            file.write(render_rule(rule_id, rct_detailed_report.get_rule(rule_id), outcome_counts, message_table))
+
+
+def write_html_file(rct_detailed_report, unit_system=None, output_file_path=None):
     """
     Writes the extracted data to an HTML file for easy viewing with Bootstrap styling.
+
+    Args:
+        rct_detailed_report (RCTDetailedReport): The report, with its model data in canonical units.
+        unit_system (UnitSystem): Unit system the model data is written in. Defaults to IP.
+        output_file_path (str): Path of the HTML file. Defaults to the output_file_path of the report.
     """
-    section_titles_with_colors = {
-        1: ("Design Model and Compliance Calculations", "#D8BFD8"),
-        2: ("Additions and Alterations", "#66b3ff"),
-        3: ("Space Use Classification", "#99ff99"),
-        4: ("Schedules", "#ffcc99"),
-        5: ("Envelope", "#f4a460"),
-        6: ("Lighting", "#ffd700"),
-        7: ("Thermal Blocks - HVAC Zones Designed", "#c2f0c2"),
-        8: ("Thermal Blocks - HVAC Zones Not Designed", "#f0c2c2"),
-        9: ("Thermal Blocks - Multifamily Residential Buildings", "#f0e68c"),
-        10: ("HVAC Systems", "#4682b4"),
-        11: ("Service Water Heating Systems", "#E97451"),
-        12: ("Receptacles and Other Loads", "#d3d3d3"),
-        13: ("Modeling Limitations to the Simulation Program", "#f4cccc"),
-        14: ("Exterior Conditions", "#87ceeb"),
-        15: ("Distribution Transformers", "#d9ead3"),
-        16: ("Elevators", "#c0c0c0"),
-        17: ("Refrigeration", "#5f9ea0"),
-        18: ("Baseline HVAC Selection", "#ead1dc"),
-        19: ("General Baseline HVAC System Requirements", "#778899"),
-        20: ("System-Specific Baseline HVAC System Requirements", "#ffdab9"),
-        21: ("Baseline HVAC - Water Side Requirements: Hot Water", "#ff6347"),
-        22: ("Baseline HVAC - Water Side Requirements: Chilled Water", "#6495ED"),
-        23: ("Baseline HVAC - Air Side Requirements", "#F0FFFF"),
-    }
-
-    with open(rct_detailed_report.output_file_path, "w", encoding="utf-8") as file:
+    if unit_system is None:
+        unit_system = unit_systems["IP"]
+    if output_file_path is None:
+        output_file_path = rct_detailed_report.output_file_path
+    labels = unit_system.labels
+    # The model summaries in the unit system, converted once for the whole report
+    averaged_baseline_model_summary = rct_detailed_report.averaged_baseline_model_summary
+    baseline_model_summary, proposed_model_summary, *averaged_baseline_views = unit_conversions.views(
+        [rct_detailed_report.baseline_model_summary, rct_detailed_report.proposed_model_summary]
+        + ([averaged_baseline_model_summary] if averaged_baseline_model_summary is not None else []),
+        rct_detailed_report.model_summary_quantities,
+        unit_system,
+    )
+    # The energy results of the baseline are averaged over its orientations when more than one was summarized, which
+    # gives the baseline building performance of Appendix G
+    if averaged_baseline_views:
+        baseline_energy_summary = averaged_baseline_views[0]
+        baseline_energy_label = averaged_baseline_model_summary["rmd_type"]
+    else:
+        baseline_energy_summary = baseline_model_summary
+        baseline_energy_label = "Baseline"
+
+    with open(output_file_path, "w", encoding="utf-8", buffering=output_buffer_size) as file:
         file.write(
             """
         <html style="scrollbar-gutter: stable;">
@@ -68,6 +324,40 @@ def write_html_file(rct_detailed_report):
         """
         )
 
+        if rct_detailed_report.merge_conflicts:
+            file.write(
+                f"""
+                <div class="mb-3 me-4">
+                    <button class="btn btn-warning collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapse-merge-conflicts" aria-expanded="false">
+                        RPD Merge Conflicts ({len(rct_detailed_report.merge_conflicts)})
+                    </button>
+
+                    <div id="collapse-merge-conflicts" class="accordion-collapse collapse">
+                        <div class="accordion-body">
+                            <table class="table table-sm table-borderless" style="width: 1000px;">
+                                <thead>
+                                    <tr style="border-bottom: 2px solid black;"><th>Attribute</th><th>Kept Value</th><th>Kept From</th><th>Conflicting Value</th><th>Conflicting In</th></tr>
+                                </thead>
+                                <tbody>
+            """
+            )
+            for conflict in rct_detailed_report.merge_conflicts:
+                file.write(
+                    f"""
+                                    <tr style="font-size: 12px;" class="lh-1"><td>{html.escape(conflict["attribute"])}</td><td>{html.escape(str(conflict["kept_value"]))}</td><td>{html.escape(os.path.basename(str(conflict["kept_file_path"])))}</td><td>{html.escape(str(conflict["conflicting_value"]))}</td><td>{html.escape(os.path.basename(str(conflict["conflicting_file_path"])))}</td></tr>
+                    """
+                )
+            file.write(
+                """
+                                </tbody>
+                            </table>
+                            <p style="font-size: 0.75rem;" class="ms-2">*The value from the first RPD file listed is used</p>
+                        </div>
+                    </div>
+                </div>
+            """
+            )
+
         rule_categories = {
             "Failing": rct_detailed_report.rules_failed,
             "Passing": rct_detailed_report.rules_passed,
@@ -89,17 +379,17 @@ def write_html_file(rct_detailed_report):
                                     <tr style="border-bottom: 2px solid black;"><th class="col-4 text-end"></th><th class="col-4 text-center">Baseline</th><th class="col-4 text-center">Proposed</th></tr>
                                 </thead>
                                 <tbody>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Building Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["building_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["building_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Total Floor Area</td><td class="col-4 text-center">{round(rct_detailed_report.baseline_model_summary['total_floor_area']):,}</td><td class="col-4 text-center">{round(rct_detailed_report.proposed_model_summary["total_floor_area"]):,}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Building Area Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["building_segment_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["building_segment_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">System Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["system_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["system_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Zone Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["zone_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["zone_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Space Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["space_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["space_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Fluid Loops</td><td class="col-4 text-center">{", ".join(s.title() for s in rct_detailed_report.baseline_model_summary["fluid_loop_types"])}</td><td class="col-4 text-center">{", ".join(s.title() for s in rct_detailed_report.proposed_model_summary["fluid_loop_types"])}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Pump Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["pump_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["pump_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Boiler Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["boiler_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["boiler_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Chiller Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["chiller_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["chiller_count"]}</td></tr>
-                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Heat Rejection Qty</td><td class="col-4 text-center">{rct_detailed_report.baseline_model_summary["heat_rejection_count"]}</td><td class="col-4 text-center">{rct_detailed_report.proposed_model_summary["heat_rejection_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Building Qty</td><td class="col-4 text-center">{baseline_model_summary["building_count"]}</td><td class="col-4 text-center">{proposed_model_summary["building_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Total Floor Area</td><td class="col-4 text-center">{round(baseline_model_summary['total_floor_area']):,}</td><td class="col-4 text-center">{round(proposed_model_summary["total_floor_area"]):,}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Building Area Qty</td><td class="col-4 text-center">{baseline_model_summary["building_segment_count"]}</td><td class="col-4 text-center">{proposed_model_summary["building_segment_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">System Qty</td><td class="col-4 text-center">{baseline_model_summary["system_count"]}</td><td class="col-4 text-center">{proposed_model_summary["system_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Zone Qty</td><td class="col-4 text-center">{baseline_model_summary["zone_count"]}</td><td class="col-4 text-center">{proposed_model_summary["zone_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Space Qty</td><td class="col-4 text-center">{baseline_model_summary["space_count"]}</td><td class="col-4 text-center">{proposed_model_summary["space_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Fluid Loops</td><td class="col-4 text-center">{", ".join(s.title() for s in baseline_model_summary["fluid_loop_types"])}</td><td class="col-4 text-center">{", ".join(s.title() for s in proposed_model_summary["fluid_loop_types"])}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Pump Qty</td><td class="col-4 text-center">{baseline_model_summary["pump_count"]}</td><td class="col-4 text-center">{proposed_model_summary["pump_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Boiler Qty</td><td class="col-4 text-center">{baseline_model_summary["boiler_count"]}</td><td class="col-4 text-center">{proposed_model_summary["boiler_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Chiller Qty</td><td class="col-4 text-center">{baseline_model_summary["chiller_count"]}</td><td class="col-4 text-center">{proposed_model_summary["chiller_count"]}</td></tr>
+                                    <tr style="font-size: 12px;" class="lh-1"><td class="col-3 text-end">Heat Rejection Qty</td><td class="col-4 text-center">{baseline_model_summary["heat_rejection_count"]}</td><td class="col-4 text-center">{proposed_model_summary["heat_rejection_count"]}</td></tr>
                                 </tbody>
                             </table>
                         </div>
@@ -128,11 +418,11 @@ def write_html_file(rct_detailed_report):
 
                             <div class="form-check form-switch mb-3" style="margin-left: 725px;">
                               <input class="form-check-input" type="checkbox" id="unitToggle" onchange="toggleUnits()">
-                              <label class="form-check-label" for="unitToggle">Show EUI (kBtu/ft²)</label>
+                              <label class="form-check-label" for="unitToggle">Show EUI ({labels["eui"]})</label>
                             </div>
 
                             <div class="mb-3" style="position: relative; left: 260px;">
-                              <span id="baselineTotal" class="me-4 fw-bold">Baseline Total: </span>
+                              <span id="baselineTotal" class="me-4 fw-bold">{baseline_energy_label} Total: </span>
                               <span id="proposedTotal" class="fw-bold">Proposed Total: </span>
                             </div>
 
@@ -172,16 +462,16 @@ def write_html_file(rct_detailed_report):
                                         <th colspan="3" style="border: 2px solid black;">Fenestration</th>
                                     </tr>
                                     <tr class="text-center">
-                                        <th style="border: 2px solid black;">Area (ft<sup>2</sup>)</th>
+                                        <th style="border: 2px solid black;">Area ({labels["area"]})</th>
                                         <th style="border: 2px solid black;"> % </th>
                                         <th style="border: 2px solid black;"> U-Factor </th>
-                                        <th style="border: 2px solid black;">Area (ft<sup>2</sup>)</th>
+                                        <th style="border: 2px solid black;">Area ({labels["area"]})</th>
                                         <th style="border: 2px solid black;"> % </th>
                                         <th style="border: 2px solid black;"> U-Factor </th>
-                                        <th style="border: 2px solid black;">Area (ft<sup>2</sup>)</th>
+                                        <th style="border: 2px solid black;">Area ({labels["area"]})</th>
                                         <th style="border: 2px solid black;"> % </th>
                                         <th style="border: 2px solid black;"> U-Factor </th>
-                                        <th style="border: 2px solid black;">Area (ft<sup>2</sup>)</th>
+                                        <th style="border: 2px solid black;">Area ({labels["area"]})</th>
                                         <th style="border: 2px solid black;"> % </th>
                                         <th style="border: 2px solid black;"> U-Factor </th>
                                     </tr>
@@ -189,51 +479,51 @@ def write_html_file(rct_detailed_report):
                                 <tbody style="border: 2px solid black;">
             """)
 
-        for building_segment_id in rct_detailed_report.baseline_model_summary["total_floor_area_by_building_segment"]:
-            if building_segment_id in rct_detailed_report.baseline_model_summary["total_roof_area_by_building_segment"]:
+        for building_segment_id in baseline_model_summary["total_floor_area_by_building_segment"]:
+            if building_segment_id in baseline_model_summary["total_roof_area_by_building_segment"]:
                 file.write(
                     f"""
                                     <tr style="font-size: 12px;" class="lh-1 text-center">
                                         <td>{building_segment_id}</td>
                                         <td style="border-right: 2px solid black;">Roof</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_roof_area_by_building_segment'].get(building_segment_id, 0) - rct_detailed_report.baseline_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)):,}</td>
-                                        <td>{round((rct_detailed_report.baseline_model_summary['total_roof_area_by_building_segment'].get(building_segment_id, 0) - rct_detailed_report.baseline_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)) / rct_detailed_report.baseline_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["overall_roof_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0) / rct_detailed_report.baseline_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary["overall_skylight_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_roof_area_by_building_segment"].get(building_segment_id, 0) - rct_detailed_report.proposed_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)):,}</td>
-                                        <td>{round((rct_detailed_report.proposed_model_summary["total_roof_area_by_building_segment"].get(building_segment_id, 0) - rct_detailed_report.proposed_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)) / rct_detailed_report.proposed_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["overall_roof_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0) / rct_detailed_report.proposed_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["overall_skylight_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(baseline_model_summary['total_roof_area_by_building_segment'].get(building_segment_id, 0) - baseline_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)):,}</td>
+                                        <td>{round((baseline_model_summary['total_roof_area_by_building_segment'].get(building_segment_id, 0) - baseline_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)) / baseline_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(baseline_model_summary["overall_roof_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(baseline_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round(baseline_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0) / baseline_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary["overall_skylight_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(proposed_model_summary["total_roof_area_by_building_segment"].get(building_segment_id, 0) - proposed_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)):,}</td>
+                                        <td>{round((proposed_model_summary["total_roof_area_by_building_segment"].get(building_segment_id, 0) - proposed_model_summary['total_skylight_area_by_building_segment'].get(building_segment_id, 0)) / proposed_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(proposed_model_summary["overall_roof_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(proposed_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round(proposed_model_summary["total_skylight_area_by_building_segment"].get(building_segment_id, 0) / proposed_model_summary['total_roof_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(proposed_model_summary["overall_skylight_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
                                     </tr>
                     """
                 )
-            if building_segment_id in rct_detailed_report.baseline_model_summary["total_wall_area_by_building_segment"]:
+            if building_segment_id in baseline_model_summary["total_wall_area_by_building_segment"]:
                 file.write(
                     f"""
                                     <tr style="font-size: 12px;" class="lh-1 text-center">
                                         <td>{building_segment_id}</td>
                                         <td style="border-right: 2px solid black;">Ext. Wall</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_wall_area_by_building_segment'].get(building_segment_id, 0) - rct_detailed_report.baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round((rct_detailed_report.baseline_model_summary['total_wall_area_by_building_segment'].get(building_segment_id, 0) - rct_detailed_report.baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)) / rct_detailed_report.baseline_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["overall_wall_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0) / rct_detailed_report.baseline_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary["overall_window_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_wall_area_by_building_segment"].get(building_segment_id, 0) - rct_detailed_report.proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round((rct_detailed_report.proposed_model_summary["total_wall_area_by_building_segment"].get(building_segment_id, 0) - rct_detailed_report.proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)) / rct_detailed_report.proposed_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["overall_wall_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0) / rct_detailed_report.proposed_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary["overall_window_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(baseline_model_summary['total_wall_area_by_building_segment'].get(building_segment_id, 0) - baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round((baseline_model_summary['total_wall_area_by_building_segment'].get(building_segment_id, 0) - baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)) / baseline_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(baseline_model_summary["overall_wall_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round(baseline_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0) / baseline_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary["overall_window_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(proposed_model_summary["total_wall_area_by_building_segment"].get(building_segment_id, 0) - proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round((proposed_model_summary["total_wall_area_by_building_segment"].get(building_segment_id, 0) - proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)) / proposed_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(proposed_model_summary["overall_wall_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
+                                        <td>{round(proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0)):,}</td>
+                                        <td>{round(proposed_model_summary["total_window_area_by_building_segment"].get(building_segment_id, 0) / proposed_model_summary['total_wall_area_by_building_segment'][building_segment_id] * 100, 1)}</td>
+                                        <td>{round(proposed_model_summary["overall_window_u_factor_by_building_segment"].get(building_segment_id, 0), 3)}</td>
                                     </tr>
                     """
                 )
 
-        file.write("""          </tbody>
+        file.write(f"""          </tbody>
                             </table>
                             <p style="font-size: 0.75rem;" class="ms-2">*U-Factors represent area-weighted averages for the corresponding Building Area & Surface Type</p>
                         </div>
@@ -256,46 +546,46 @@ def write_html_file(rct_detailed_report):
                                     </tr>
                                     <tr class="text-center">
                                         <th style="border: 2px solid black;">Space Type</th>
-                                        <th style="border: 2px solid black;">Area (ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Occupancy Density (ft<sup>2</sup>/person)</th>
-                                        <th style="border: 2px solid black;">Equipment Power Density (W/ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Allowed Lighting Power Density (W/ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Lighting Power Density (W/ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Lighting Power Density (W/ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Equipment Power Density (W/ft<sup>2</sup>)</th>
-                                        <th style="border: 2px solid black;">Occupancy Density (ft<sup>2</sup>/person)</th>
+                                        <th style="border: 2px solid black;">Area ({labels["area"]})</th>
+                                        <th style="border: 2px solid black;">Occupancy Density ({labels["occupancy_density"]})</th>
+                                        <th style="border: 2px solid black;">Equipment Power Density ({labels["power_density"]})</th>
+                                        <th style="border: 2px solid black;">Allowed Lighting Power Density ({labels["power_density"]})</th>
+                                        <th style="border: 2px solid black;">Lighting Power Density ({labels["power_density"]})</th>
+                                        <th style="border: 2px solid black;">Lighting Power Density ({labels["power_density"]})</th>
+                                        <th style="border: 2px solid black;">Equipment Power Density ({labels["power_density"]})</th>
+                                        <th style="border: 2px solid black;">Occupancy Density ({labels["occupancy_density"]})</th>
                                     </tr>
                                 </thead>
                                 <tbody style="border: 2px solid black;">
         """)
 
-        for space_type in rct_detailed_report.baseline_model_summary["total_floor_area_by_space_type"]:
+        for space_type in baseline_model_summary["total_floor_area_by_space_type"]:
             file.write(
                 f"""
                                     <tr style="font-size: 12px;" class="lh-1 text-center">
                                         <td>{space_type.replace("_", " ").title()}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_floor_area_by_space_type'].get(space_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_floor_area_by_space_type'][space_type] / rct_detailed_report.baseline_model_summary['total_occupants_by_space_type'].get(space_type, math.inf))}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_miscellaneous_equipment_power_by_space_type'].get(space_type, 0) / rct_detailed_report.baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
-                                        <td>{round(rct_detailed_report.baseline_lighting_power_allowance_by_space_type.get(space_type, 0) / rct_detailed_report.baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_lighting_power_by_space_type'].get(space_type, 0) / rct_detailed_report.baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_lighting_power_by_space_type'].get(space_type, 0) / rct_detailed_report.proposed_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_miscellaneous_equipment_power_by_space_type'].get(space_type, 0) / rct_detailed_report.proposed_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_floor_area_by_space_type'][space_type] / rct_detailed_report.proposed_model_summary['total_occupants_by_space_type'].get(space_type, math.inf))}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_floor_area_by_space_type'].get(space_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_floor_area_by_space_type'][space_type] / baseline_model_summary['total_occupants_by_space_type'].get(space_type, math.inf))}</td>
+                                        <td>{round(baseline_model_summary['total_miscellaneous_equipment_power_by_space_type'].get(space_type, 0) / baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
+                                        <td>{round(rct_detailed_report.baseline_lighting_power_allowance_by_space_type.get(space_type, 0) / baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_lighting_power_by_space_type'].get(space_type, 0) / baseline_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_lighting_power_by_space_type'].get(space_type, 0) / proposed_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_miscellaneous_equipment_power_by_space_type'].get(space_type, 0) / proposed_model_summary['total_floor_area_by_space_type'][space_type], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_floor_area_by_space_type'][space_type] / proposed_model_summary['total_occupants_by_space_type'].get(space_type, math.inf))}</td>
                                     </tr>
                 """
             )
         file.write(f"""
                                     <tr  style="font-size: 12px; border-top: 1px solid black;" class="lh-1 fw-bold text-center">
                                         <td>Total</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_floor_area']):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_floor_area'] / rct_detailed_report.baseline_model_summary['total_occupants'], 2)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_equipment_power'] / rct_detailed_report.baseline_model_summary['total_floor_area'], 2)}</td>
-                                        <td>{round(rct_detailed_report.baseline_total_lighting_power_allowance / rct_detailed_report.baseline_model_summary['total_floor_area'], 2)}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_lighting_power'] / rct_detailed_report.baseline_model_summary['total_floor_area'], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_lighting_power'] / rct_detailed_report.proposed_model_summary['total_floor_area'], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_equipment_power'] / rct_detailed_report.proposed_model_summary['total_floor_area'], 2)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_floor_area'] / rct_detailed_report.proposed_model_summary['total_occupants'], 2)}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_floor_area']):,}</td>
+                                        <td>{round(baseline_model_summary['total_floor_area'] / baseline_model_summary['total_occupants'], 2)}</td>
+                                        <td>{round(baseline_model_summary['total_equipment_power'] / baseline_model_summary['total_floor_area'], 2)}</td>
+                                        <td>{round(rct_detailed_report.baseline_total_lighting_power_allowance / baseline_model_summary['total_floor_area'], 2)}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_lighting_power'] / baseline_model_summary['total_floor_area'], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_lighting_power'] / proposed_model_summary['total_floor_area'], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_equipment_power'] / proposed_model_summary['total_floor_area'], 2)}</td>
+                                        <td>{round(proposed_model_summary['total_floor_area'] / proposed_model_summary['total_occupants'], 2)}</td>
                                     </tr>
         """)
         file.write(f"""
@@ -313,7 +603,7 @@ def write_html_file(rct_detailed_report):
                     <div id="collapse-hvac-summary" class="accordion-collapse collapse">
                         <div class="accordion-body">
                             <h3>Baseline HVAC Fan Summary</h3>
-                            <p><strong>Outdoor Airflow:</strong> {round(rct_detailed_report.baseline_model_summary['total_zone_minimum_oa_flow']):,} CFM</p>
+                            <p><strong>Outdoor Airflow:</strong> {round(baseline_model_summary['total_zone_minimum_oa_flow']):,} {labels["air_flow"]}</p>
                             <table class="table table-sm table-borderless fan-summary" style="width: 1250px;">
                                 <thead>
                                     <tr class="text-center">
@@ -326,24 +616,24 @@ def write_html_file(rct_detailed_report):
                                         <th style="border: 2px solid black; width: 18%;" colspan="4">Total</th>
                                     </tr>
                                     <tr class="text-center">
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
                                         <th style="border: 2px solid black;">% of Subtotal kW</th>
                                     </tr>
                                 </thead>
@@ -355,25 +645,25 @@ def write_html_file(rct_detailed_report):
                 f"""
                                     <tr style="font-size: 12px;" class="text-center">
                                         <td style="border-right: 2px solid black;">{fan_type}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['other_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.baseline_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['other_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / (rct_detailed_report.baseline_model_summary['total_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(100 * rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / sum(rct_detailed_report.baseline_model_summary["total_fan_power_by_fan_type"].values()))}</td>
+                                        <td>{round(baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / (baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / (baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / (baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / (baseline_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(baseline_model_summary['other_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(baseline_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / (baseline_model_summary['other_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(baseline_model_summary['total_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / (baseline_model_summary['total_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(100 * baseline_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / sum(baseline_model_summary["total_fan_power_by_fan_type"].values()))}</td>
                                     </tr>
                 """
             )
@@ -407,22 +697,22 @@ def write_html_file(rct_detailed_report):
                                     <tr style="font-size: 12px; border-top: 1px solid black;" class="text-center">
                                         <td style="border-right: 2px solid black;">Terminal Units</td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['other_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['other_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.baseline_model_summary['total_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(baseline_model_summary['total_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
                                         <td style="background: black;"></td>
                                         <td style="background: black;"></td>
                                     </tr>
@@ -432,7 +722,7 @@ def write_html_file(rct_detailed_report):
                             </table>
 
                             <h3>Proposed HVAC Fan Summary</h3>
-                            <p><strong>Outdoor Airflow:</strong> {round(rct_detailed_report.baseline_model_summary['total_zone_minimum_oa_flow']):,} CFM</p>
+                            <p><strong>Outdoor Airflow:</strong> {round(baseline_model_summary['total_zone_minimum_oa_flow']):,} {labels["air_flow"]}</p>
                             <table class="table table-sm table-borderless fan-summary" style="width: 1250px;">
                                 <thead>
                                     <tr class="text-center">
@@ -445,24 +735,24 @@ def write_html_file(rct_detailed_report):
                                         <th style="border: 2px solid black; width: 18%;" colspan="4">Total</th>
                                     </tr>
                                     <tr class="text-center">
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
-                                        <th style="border: 2px solid black;">CFM</th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["air_flow"]}</th>
                                         <th style="border: 2px solid black;">kW</th>
-                                        <th style="border: 2px solid black;">W/CFM<sub>s</sub></th>
+                                        <th style="border: 2px solid black;">{labels["fan_efficacy"]}<sub>s</sub></th>
                                         <th style="border: 2px solid black;">% of Subtotal kW</th>
                                     </tr>
                                 </thead>
@@ -474,25 +764,25 @@ def write_html_file(rct_detailed_report):
                 f"""
                                     <tr style="font-size: 12px;" class="text-center">
                                         <td style="border-right: 2px solid black;">{fan_type}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['other_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td style="border-right: 2px solid black;">{round(rct_detailed_report.proposed_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['other_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / (rct_detailed_report.proposed_model_summary['total_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
-                                        <td>{round(100 * rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / sum(rct_detailed_report.proposed_model_summary["total_fan_power_by_fan_type"].values()))}</td>
+                                        <td>{round(proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get(fan_type, 0) / (proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get(fan_type, 0) / (proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get(fan_type, 0) / (proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get(fan_type, 0) / (proposed_model_summary['total_air_flow_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(proposed_model_summary['other_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td style="border-right: 2px solid black;">{round(proposed_model_summary['other_fan_power_by_fan_type'].get(fan_type, 0) / (proposed_model_summary['other_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(proposed_model_summary['total_air_flow_by_fan_type'].get(fan_type, 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / 1000, 2):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / (proposed_model_summary['total_air_flow_by_fan_type'].get("Supply", 99999999) or 99999999), 4)}</td>
+                                        <td>{round(100 * proposed_model_summary['total_fan_power_by_fan_type'].get(fan_type, 0) / sum(proposed_model_summary["total_fan_power_by_fan_type"].values()))}</td>
                                     </tr>
                 """
             )
@@ -526,22 +816,22 @@ def write_html_file(rct_detailed_report):
                                     <tr style="font-size: 12px; border-top: 1px solid black;" class="text-center">
                                         <td>Terminal Units</td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("CONSTANT", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("VARIABLE_SPEED_DRIVE", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("MULTISPEED", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_control_by_fan_type'].get("Constant Cycling", {}).get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['other_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['other_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
                                         <td style="border-right: 2px solid black; background: black;"></td>
                                         <td style="background: black;"></td>
-                                        <td>{round(rct_detailed_report.proposed_model_summary['total_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
+                                        <td>{round(proposed_model_summary['total_fan_power_by_fan_type'].get("Terminal Unit", 0)):,}</td>
                                         <td style="background: black;"></td>
                                         <td style="background: black;"></td>
                                     </tr>
@@ -555,6 +845,9 @@ def write_html_file(rct_detailed_report):
             """
                    )
 
+        if rct_detailed_report.object_drilldowns:
+            write_object_drilldowns(file, rct_detailed_report, unit_system)
+
         for category, rules in rule_categories.items():
             btn_class = (
                 "btn-danger"
@@ -598,138 +891,7 @@ def write_html_file(rct_detailed_report):
             )
 
             if category == "Undetermined":
-                sections_seen = set()
-                for rule_id in rct_detailed_report.full_eval_rules_undetermined:
-                    rule_data = next(
-                        rule
-                        for rule in rct_detailed_report.evaluation_data["rules"]
-                        if rule["rule_id"] == rule_id
-                    )
-                    section = rule_id.split("-")[0]
-                    if section not in sections_seen:
-                        sections_seen.add(section)
-                        section_title = section_titles_with_colors.get(
-                            int(section)
-                        )[0]
-                        section_color = section_titles_with_colors.get(
-                            int(section)
-                        )[1]
-                        file.write(
-                            f"""
-                            </tbody>
-                                <thead class="table-group-divider">
-                                    <tr>
-                                        <td colspan="4" class="section-title sticky-top sticky-top-2" style="background-color: {section_color} !important;">{section_title}</td>
-                                    </tr>
-                                </thead>
-                            <tbody>
-                            """
-                        )
-
-                    description = rule_data.get("description", "N/A")
-                    standard_section = rule_data.get("standard_section", "N/A")
-                    outcome_summary = " | ".join([f"{k}: {v}" for k, v in rct_detailed_report.rule_evaluation_outcome_counts[rule_id].items()])
-
-                    file.write(
-                        f"""
-                            <tr>
-                                <td class="rule-id" rowspan='2'>{rule_id}</td>
-                                <td>{description}</td>
-                                <td>{standard_section}</td>
-                                <td class="outcome-summary">{outcome_summary}</td>
-                            </tr>
-                            <tr>
-                                <td colspan='3'>
-                                    <button class="btn btn-primary" type="button" data-bs-toggle="collapse" data-bs-target="#eval_{rule_id}">
-                                        View Evaluations
-                                    </button>
-                                    <div class="collapse" id="eval_{rule_id}">
-                                        <ul>
-                        """
-                    )
-                    outcome_order = {
-                        "FAILED": 0,
-                        "UNDETERMINED": 1,
-                        "PASS": 2,
-                        "NOT_APPLICABLE": 3,
-                    }
-
-                    # Sort evaluations based on outcome priority
-                    sorted_evaluations = sorted(
-                        rule_data["evaluations"],
-                        key=lambda e: outcome_order.get(e["outcome"], 3),
-                    )
-
-                    for evaluation in sorted_evaluations:
-                        has_any_units = False
-                        styles = {
-                            "FAILED": "background-color: #ffcccc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ff0000;",
-                            "PASS": "background-color: #ccffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #008000;",
-                            "UNDETERMINED": "background-color: #ffffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ffcc00;",
-                            "DEFAULT": "padding-left: 10px; border: 2px solid #ccc; border-radius: 8px;",
-                        }
-
-                        # Select the appropriate style based on outcome
-                        li_style = styles.get(
-                            evaluation["outcome"], styles["DEFAULT"]
-                        )
-                        file.write(
-                            f"""
-                                <li style=\"{li_style}\"  class=\"p-2 m-1\">{evaluation['data_group_id']}
-                                    <ul>
-                                        <li><strong>Outcome:</strong> {evaluation['outcome']}</li>
-                                """
-                        )
-                        if evaluation["messages"]:
-                            messages = set()
-                            if isinstance(evaluation["messages"], str):
-                                messages.add(evaluation["messages"])
-                            if isinstance(evaluation["messages"], dict):
-                                for key, message in evaluation["messages"].items():
-                                    messages.add(f"{key}: {message}")
-                            if isinstance(evaluation["messages"], list):
-                                for message in evaluation["messages"]:
-                                    messages.add(message)
-                            file.write(
-                                f"<li><strong>Messages:</strong> {', '.join(messages)}</li>"
-                            )
-                        if evaluation["calculated_values"]:
-                            file.write(
-                                """
-                                    <li><strong>Calculated Values:</strong>
-                                        <table class="mb-2 me-2 table table-sm table-bordered">
-                                            <thead>
-                                                <tr><th>Variable</th><th>Value</th>
-                                """
-                            )
-                            if any(
-                                    cv.get("unit")
-                                    for cv in evaluation["calculated_values"]
-                            ):
-                                has_any_units = True
-                                file.write("<th>Unit</th>")
-                            file.write("</tr></thead><tbody>")
-
-                            for calculated_value in evaluation["calculated_values"]:
-                                file.write(
-                                    f"""
-                                    <tr>
-                                    <td>{calculated_value['variable']}</td>
-                                    <td>{calculated_value['value'][0] if len(calculated_value['value']) == 1
-                                    else calculated_value['value']}
-                                    </td>
-                                    """
-                                )
-                                if calculated_value.get("unit"):
-                                    file.write(
-                                        f"<td>{calculated_value['unit']}</td>"
-                                    )
-                                elif has_any_units:
-                                    file.write("<td></td>")
-                                file.write("</tr>")
-                            file.write("</tbody></table></li>")
-                        file.write("</ul></li>")
-                    file.write("</ul></div></td></tr>")
+                write_rule_rows(file, rct_detailed_report, rct_detailed_report.full_eval_rules_undetermined)
                 file.write(
                     f"""
                         </tbody>
@@ -748,271 +910,9 @@ def write_html_file(rct_detailed_report):
                             <tbody>
                     """
                 )
-                sections_seen = set()
-                for rule_id in rct_detailed_report.appl_eval_rules_undetermined:
-                    rule_data = next(
-                        rule
-                        for rule in rct_detailed_report.evaluation_data["rules"]
-                        if rule["rule_id"] == rule_id
-                    )
-                    section = rule_id.split("-")[0]
-                    if section not in sections_seen:
-                        sections_seen.add(section)
-                        section_title = section_titles_with_colors.get(
-                            int(section)
-                        )[0]
-                        section_color = section_titles_with_colors.get(
-                            int(section)
-                        )[1]
-                        file.write(
-                            f"""
-                            </tbody>
-                                <thead class="table-group-divider">
-                                    <tr>
-                                        <td colspan="4" class="section-title sticky-top sticky-top-2" style="background-color: {section_color} !important;">{section_title}</td>
-                                    </tr>
-                                </thead>
-                            <tbody>
-                            """
-                        )
-
-                    description = rule_data.get("description", "N/A")
-                    standard_section = rule_data.get("standard_section", "N/A")
-                    outcome_summary = " | ".join([f"{k}: {v}" for k, v in rct_detailed_report.rule_evaluation_outcome_counts[rule_id].items()])
-
-                    file.write(
-                        f"""
-                            <tr>
-                                <td class="rule-id" rowspan='2'>{rule_id}</td>
-                                <td>{description}</td>
-                                <td>{standard_section}</td>
-                                <td class="outcome-summary">{outcome_summary}</td>
-                            </tr>
-                            <tr>
-                                <td colspan='3'>
-                                    <button class="btn btn-primary" type="button" data-bs-toggle="collapse" data-bs-target="#eval_{rule_id}">
-                                        View Evaluations
-                                    </button>
-                                    <div class="collapse" id="eval_{rule_id}">
-                                        <ul>
-                            """
-                    )
-                    outcome_order = {
-                        "FAILED": 0,
-                        "UNDETERMINED": 1,
-                        "PASS": 2,
-                        "NOT_APPLICABLE": 3,
-                    }
-
-                    # Sort evaluations based on outcome priority
-                    sorted_evaluations = sorted(
-                        rule_data["evaluations"],
-                        key=lambda e: outcome_order.get(e["outcome"], 3),
-                    )
-
-                    for evaluation in sorted_evaluations:
-                        has_any_units = False
-                        styles = {
-                            "FAILED": "background-color: #ffcccc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ff0000;",
-                            "PASS": "background-color: #ccffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #008000;",
-                            "UNDETERMINED": "background-color: #ffffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ffcc00;",
-                            "DEFAULT": "padding-left: 10px; border: 2px solid #ccc; border-radius: 8px;",
-                        }
-
-                        # Select the appropriate style based on outcome
-                        li_style = styles.get(
-                            evaluation["outcome"], styles["DEFAULT"]
-                        )
-                        file.write(
-                            f"""
-                                <li style=\"{li_style}\"  class=\"p-2 m-1\">{evaluation['data_group_id']}
-                                    <ul>
-                                        <li><strong>Outcome:</strong> {evaluation['outcome']}</li>
-                                """
-                        )
-                        if evaluation["messages"]:
-                            messages = set()
-                            if isinstance(evaluation["messages"], str):
-                                messages.add(evaluation["messages"])
-                            if isinstance(evaluation["messages"], dict):
-                                for key, message in evaluation["messages"].items():
-                                    messages.add(f"{key}: {message}")
-                            if isinstance(evaluation["messages"], list):
-                                for message in evaluation["messages"]:
-                                    messages.add(message)
-                            file.write(
-                                f"<li><strong>Messages:</strong> {', '.join(messages)}</li>"
-                            )
-                        if evaluation["calculated_values"]:
-                            file.write(
-                                """
-                                    <li><strong>Calculated Values:</strong>
-                                        <table class="mb-2 me-2 table table-sm table-bordered">
-                                            <thead>
-                                                <tr><th>Variable</th><th>Value</th>
-                                """
-                            )
-                            if any(
-                                    cv.get("unit")
-                                    for cv in evaluation["calculated_values"]
-                            ):
-                                has_any_units = True
-                                file.write("<th>Unit</th>")
-                            file.write("</tr></thead><tbody>")
-
-                            for calculated_value in evaluation["calculated_values"]:
-                                file.write(
-                                    f"""
-                                    <tr>
-                                    <td>{calculated_value['variable']}</td>
-                                    <td>{calculated_value['value'][0] if len(calculated_value['value']) == 1
-                                    else calculated_value['value']}
-                                    </td>
-                                    """
-                                )
-                                if calculated_value.get("unit"):
-                                    file.write(
-                                        f"<td>{calculated_value['unit']}</td>"
-                                    )
-                                elif has_any_units:
-                                    file.write("<td></td>")
-                                file.write("</tr>")
-                            file.write("</tbody></table></li>")
-                        file.write("</ul></li>")
-                    file.write("</ul></div></td></tr>")
+                write_rule_rows(file, rct_detailed_report, rct_detailed_report.appl_eval_rules_undetermined)
             else:
-                sections_seen = set()
-                for rule_id in rules:
-                    rule_data = next(
-                        rule
-                        for rule in rct_detailed_report.evaluation_data["rules"]
-                        if rule["rule_id"] == rule_id
-                    )
-                    section = rule_id.split("-")[0]
-                    if section not in sections_seen:
-                        sections_seen.add(section)
-                        section_title = section_titles_with_colors.get(
-                            int(section)
-                        )[0]
-                        section_color = section_titles_with_colors.get(
-                            int(section)
-                        )[1]
-                        file.write(
-                            f"""
-                            </tbody>
-                                <thead class="table-group-divider">
-                                    <tr>
-                                        <th colspan="4" class="section-title sticky-top sticky-top-2" style="background-color: {section_color} !important;">{section_title}</th>
-                                    </tr>
-                                </thead>
-                            <tbody>
-                            """
-                        )
-
-                    description = rule_data.get("description", "N/A")
-                    standard_section = rule_data.get("standard_section", "N/A")
-                    outcome_summary = " | ".join([f"{k}: {v}" for k, v in rct_detailed_report.rule_evaluation_outcome_counts[rule_id].items()])
-
-                    file.write(
-                        f"""
-                            <tr>
-                                <td class="rule-id" rowspan='2'>{rule_id}</td>
-                                <td>{description}</td>
-                                <td>{standard_section}</td>
-                                <td class="outcome-summary">{outcome_summary}</td>
-                            </tr>
-                            <tr>
-                                <td colspan='3'>
-                                    <button class="btn btn-primary" type="button" data-bs-toggle="collapse" data-bs-target="#eval_{rule_id}">
-                                        View Evaluations
-                                    </button>
-                                    <div class="collapse" id="eval_{rule_id}">
-                                        <ul>
-                        """
-                    )
-                    outcome_order = {
-                        "FAILED": 0,
-                        "UNDETERMINED": 1,
-                        "PASS": 2,
-                        "NOT_APPLICABLE": 3,
-                    }
-
-                    # Sort evaluations based on outcome priority
-                    sorted_evaluations = sorted(
-                        rule_data["evaluations"],
-                        key=lambda e: outcome_order.get(e["outcome"], 3),
-                    )
-
-                    for evaluation in sorted_evaluations:
-                        has_any_units = False
-                        styles = {
-                            "FAILED": "background-color: #ffcccc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ff0000;",
-                            "PASS": "background-color: #ccffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #008000;",
-                            "UNDETERMINED": "background-color: #ffffcc; color: black; font-weight: bold; padding-left: 10px; border-radius: 8px; border: 2px solid #ffcc00;",
-                            "DEFAULT": "padding-left: 10px; border: 2px solid #ccc; border-radius: 8px;",
-                        }
-
-                        # Select the appropriate style based on outcome
-                        li_style = styles.get(
-                            evaluation["outcome"], styles["DEFAULT"]
-                        )
-                        file.write(
-                            f"""
-                                <li style=\"{li_style}\"  class=\"p-2 m-1\">{evaluation['data_group_id']}
-                                    <ul>
-                                        <li><strong>Outcome:</strong> {evaluation['outcome']}</li>
-                                """
-                        )
-                        if evaluation["messages"]:
-                            messages = set()
-                            if isinstance(evaluation["messages"], str):
-                                messages.add(evaluation["messages"])
-                            if isinstance(evaluation["messages"], dict):
-                                for key, message in evaluation["messages"].items():
-                                    messages.add(f"{key}: {message}")
-                            if isinstance(evaluation["messages"], list):
-                                for message in evaluation["messages"]:
-                                    messages.add(message)
-                            file.write(
-                                f"<li><strong>Messages:</strong> {', '.join(messages)}</li>"
-                            )
-                        if evaluation["calculated_values"]:
-                            file.write(
-                                """
-                                    <li><strong>Calculated Values:</strong>
-                                        <table class="mb-2 me-2 table table-sm table-bordered">
-                                            <thead>
-                                                <tr><th>Variable</th><th>Value</th>
-                                """
-                            )
-                            if any(
-                                    cv.get("unit")
-                                    for cv in evaluation["calculated_values"]
-                            ):
-                                has_any_units = True
-                                file.write("<th>Unit</th>")
-                            file.write("</tr></thead><tbody>")
-
-                            for calculated_value in evaluation["calculated_values"]:
-                                file.write(
-                                    f"""
-                                    <tr>
-                                    <td>{calculated_value['variable']}</td>
-                                    <td>{calculated_value['value'][0] if len(calculated_value['value']) == 1
-                                    else calculated_value['value']}
-                                    </td>
-                                    """
-                                )
-                                if calculated_value.get("unit"):
-                                    file.write(
-                                        f"<td>{calculated_value['unit']}</td>"
-                                    )
-                                elif has_any_units:
-                                    file.write("<td></td>")
-                                file.write("</tr>")
-                            file.write("</tbody></table></li>")
-                        file.write("</ul></li>")
-                    file.write("</ul></div></td></tr>")
+                write_rule_rows(file, rct_detailed_report, rules, section_title_cell="th")
 
             file.write("</tbody></table></div></div>")
 
@@ -1083,38 +983,38 @@ def write_html_file(rct_detailed_report):
                 calculateSubtotals();
 
                 // Chart labels
-                const labels = {[label.replace('_', ' ').title() for label in rct_detailed_report.baseline_model_summary["elec_by_end_use"].keys()]};
+                const labels = {[label.replace('_', ' ').title() for label in baseline_model_summary["elec_by_end_use"].keys()]};
 
                 const elecDataRaw = {{
                   consumption: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["elec_by_end_use"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["elec_by_end_use"].values())}
+                    baseline: {list(baseline_energy_summary["elec_by_end_use"].values())},
+                    proposed: {list(proposed_model_summary["elec_by_end_use"].values())}
                   }},
                   eui: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["elec_by_end_use_eui"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["elec_by_end_use_eui"].values())}
+                    baseline: {list(baseline_energy_summary["elec_by_end_use_eui"].values())},
+                    proposed: {list(proposed_model_summary["elec_by_end_use_eui"].values())}
                   }}
                 }};
 
                 const gasDataRaw = {{
                   consumption: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["gas_by_end_use"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["gas_by_end_use"].values())}
+                    baseline: {list(baseline_energy_summary["gas_by_end_use"].values())},
+                    proposed: {list(proposed_model_summary["gas_by_end_use"].values())}
                   }},
                   eui: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["gas_by_end_use_eui"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["gas_by_end_use_eui"].values())}
+                    baseline: {list(baseline_energy_summary["gas_by_end_use_eui"].values())},
+                    proposed: {list(proposed_model_summary["gas_by_end_use_eui"].values())}
                   }}
                 }};
 
                 const energyDataRaw = {{
                   consumption: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["energy_by_end_use"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["energy_by_end_use"].values())}
+                    baseline: {list(baseline_energy_summary["energy_by_end_use"].values())},
+                    proposed: {list(proposed_model_summary["energy_by_end_use"].values())}
                   }},
                   eui: {{
-                    baseline: {list(rct_detailed_report.baseline_model_summary["energy_by_end_use_eui"].values())},
-                    proposed: {list(rct_detailed_report.proposed_model_summary["energy_by_end_use_eui"].values())}
+                    baseline: {list(baseline_energy_summary["energy_by_end_use_eui"].values())},
+                    proposed: {list(proposed_model_summary["energy_by_end_use_eui"].values())}
                   }}
                 }};
 
@@ -1123,13 +1023,13 @@ def write_html_file(rct_detailed_report):
                     labels: labels,
                     datasets: [
                         {{
-                            label: 'Baseline',
-                            data: {list(rct_detailed_report.baseline_model_summary["elec_by_end_use"].values())},
+                            label: '{baseline_energy_label}',
+                            data: {list(baseline_energy_summary["elec_by_end_use"].values())},
                             backgroundColor: 'rgba(54, 162, 235, 0.7)'
                         }},
                         {{
                             label: 'Proposed',
-                            data: {list(rct_detailed_report.proposed_model_summary["elec_by_end_use"].values())},
+                            data: {list(proposed_model_summary["elec_by_end_use"].values())},
                             backgroundColor: 'rgba(75, 192, 75, 0.7)'
                         }}
                     ]
@@ -1166,7 +1066,7 @@ def write_html_file(rct_detailed_report):
                                 beginAtZero: true,
                                 title: {{
                                     display: true,
-                                    text: 'kWh',
+                                    text: '{labels["electricity"]}',
                                     font: {{
                                         size: 14
                                     }}
@@ -1180,13 +1080,13 @@ def write_html_file(rct_detailed_report):
                     labels: labels,
                     datasets: [
                         {{
-                            label: 'Baseline',
-                            data: {list(rct_detailed_report.baseline_model_summary["gas_by_end_use"].values())},
+                            label: '{baseline_energy_label}',
+                            data: {list(baseline_energy_summary["gas_by_end_use"].values())},
                             backgroundColor: 'rgba(255, 180, 80, 0.5)'
                         }},
                         {{
                             label: 'Proposed',
-                            data: {list(rct_detailed_report.proposed_model_summary["gas_by_end_use"].values())},
+                            data: {list(proposed_model_summary["gas_by_end_use"].values())},
                             backgroundColor: 'rgba(255, 100, 100, 0.5)'
                         }}
                     ]
@@ -1223,7 +1123,7 @@ def write_html_file(rct_detailed_report):
                                 beginAtZero: true,
                                 title: {{
                                     display: true,
-                                    text: 'Therms',
+                                    text: '{labels["gas"]}',
                                     font: {{
                                         size: 14
                                     }}
@@ -1237,13 +1137,13 @@ def write_html_file(rct_detailed_report):
                     labels: labels,
                     datasets: [
                         {{
-                            label: 'Baseline',
-                            data: {list(rct_detailed_report.baseline_model_summary["energy_by_end_use"].values())},
+                            label: '{baseline_energy_label}',
+                            data: {list(baseline_energy_summary["energy_by_end_use"].values())},
                             backgroundColor: 'rgba(128, 0, 64, 0.6)'
                         }},
                         {{
                             label: 'Proposed',
-                            data: {list(rct_detailed_report.proposed_model_summary["energy_by_end_use"].values())},
+                            data: {list(proposed_model_summary["energy_by_end_use"].values())},
                             backgroundColor: 'rgba(0, 128, 128, 0.6)'
                         }}
                     ]
@@ -1280,7 +1180,7 @@ def write_html_file(rct_detailed_report):
                                 beginAtZero: true,
                                 title: {{
                                     display: true,
-                                    text: 'kBtu',
+                                    text: '{labels["energy"]}',
                                     font: {{
                                         size: 14
                                     }}
@@ -1298,19 +1198,19 @@ def write_html_file(rct_detailed_report):
                   // Update Electricity
                   elecChart.data.datasets[0].data = elecDataRaw[unitType].baseline;
                   elecChart.data.datasets[1].data = elecDataRaw[unitType].proposed;
-                  elecChart.options.scales.y.title.text = unitType === 'consumption' ? 'kWh' : 'kBtu/ft²';
+                  elecChart.options.scales.y.title.text = unitType === 'consumption' ? '{labels["electricity"]}' : '{labels["eui"]}';
                   elecChart.update();
 
                   // Update Gas
                   gasChart.data.datasets[0].data = gasDataRaw[unitType].baseline;
                   gasChart.data.datasets[1].data = gasDataRaw[unitType].proposed;
-                  gasChart.options.scales.y.title.text = unitType === 'consumption' ? 'Therms' : 'kBtu/ft²';
+                  gasChart.options.scales.y.title.text = unitType === 'consumption' ? '{labels["gas"]}' : '{labels["eui"]}';
                   gasChart.update();
 
                   // Update Total Energy
                   energyChart.data.datasets[0].data = energyDataRaw[unitType].baseline;
                   energyChart.data.datasets[1].data = energyDataRaw[unitType].proposed;
-                  energyChart.options.scales.y.title.text = unitType === 'consumption' ? 'kBtu' : 'kBtu/ft²';
+                  energyChart.options.scales.y.title.text = unitType === 'consumption' ? '{labels["energy"]}' : '{labels["eui"]}';
                   energyChart.update();
                 }}
 
@@ -1320,9 +1220,9 @@ def write_html_file(rct_detailed_report):
 
                 function getUnitLabel(source, unitType) {{
                   if (unitType === 'eui') {{
-                    return 'kBtu/ft²';
+                    return '{labels["eui"]}';
                   }} else {{
-                    return source === 'elec' ? 'kWh' : source === 'gas' ? 'Therms' : 'kBtu';
+                    return source === 'elec' ? '{labels["electricity"]}' : source === 'gas' ? '{labels["gas"]}' : '{labels["energy"]}';
                   }}
                 }}
 
@@ -1349,37 +1249,37 @@ def write_html_file(rct_detailed_report):
 
                   if (source === 'elec') {{
                     baseline = unitType === 'eui'
-                      ? {list(rct_detailed_report.baseline_model_summary["elec_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.baseline_model_summary["elec_by_end_use"].values())};
+                      ? {list(baseline_energy_summary["elec_by_end_use_eui"].values())}
+                      : {list(baseline_energy_summary["elec_by_end_use"].values())};
 
                     proposed = unitType === 'eui'
-                      ? {list(rct_detailed_report.proposed_model_summary["elec_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.proposed_model_summary["elec_by_end_use"].values())};
+                      ? {list(proposed_model_summary["elec_by_end_use_eui"].values())}
+                      : {list(proposed_model_summary["elec_by_end_use"].values())};
 
                   }} else if (source === 'gas') {{
                     baseline = unitType === 'eui'
-                      ? {list(rct_detailed_report.baseline_model_summary["gas_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.baseline_model_summary["gas_by_end_use"].values())};
+                      ? {list(baseline_energy_summary["gas_by_end_use_eui"].values())}
+                      : {list(baseline_energy_summary["gas_by_end_use"].values())};
 
                     proposed = unitType === 'eui'
-                      ? {list(rct_detailed_report.proposed_model_summary["gas_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.proposed_model_summary["gas_by_end_use"].values())};
+                      ? {list(proposed_model_summary["gas_by_end_use_eui"].values())}
+                      : {list(proposed_model_summary["gas_by_end_use"].values())};
 
                   }} else if (source === 'energy') {{
                     baseline = unitType === 'eui'
-                      ? {list(rct_detailed_report.baseline_model_summary["energy_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.baseline_model_summary["energy_by_end_use"].values())};
+                      ? {list(baseline_energy_summary["energy_by_end_use_eui"].values())}
+                      : {list(baseline_energy_summary["energy_by_end_use"].values())};
 
                     proposed = unitType === 'eui'
-                      ? {list(rct_detailed_report.proposed_model_summary["energy_by_end_use_eui"].values())}
-                      : {list(rct_detailed_report.proposed_model_summary["energy_by_end_use"].values())};
+                      ? {list(proposed_model_summary["energy_by_end_use_eui"].values())}
+                      : {list(proposed_model_summary["energy_by_end_use"].values())};
                   }}
 
                   const unit = getUnitLabel(source, unitType);
                   const baselineSum = sumArray(baseline).toLocaleString(undefined, {{ maximumFractionDigits: 0 }});
                   const proposedSum = sumArray(proposed).toLocaleString(undefined, {{ maximumFractionDigits: 0 }});
 
-                  document.getElementById('baselineTotal').textContent = `Baseline Total: ${{baselineSum}} ${{unit}}`;
+                  document.getElementById('baselineTotal').textContent = `{baseline_energy_label} Total: ${{baselineSum}} ${{unit}}`;
                   document.getElementById('proposedTotal').textContent = `Proposed Total: ${{proposedSum}} ${{unit}}`;
                 }}
 